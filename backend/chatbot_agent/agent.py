@@ -569,8 +569,8 @@ class ChatbotOrchestrator:
                 conversation_history = self.context_manager.load_history(contract_id, session_id)
                 previous_turn = conversation_history[-2:] if len(conversation_history) >= 2 else []
                 
-                # 2. 질문 범위 검증 + 이전 대화 참조 판단
-                scope_result = self.scope_validator.validate(user_message, previous_turn)
+                # 2. 질문 범위 검증 + 이전 대화 참조 판단 (이벤트 루프 블로킹 방지)
+                scope_result = await self.scope_validator.validate_async(user_message, previous_turn)
                 if not scope_result.is_contract_related:
                     logger.warning(f"범위 외 질문: {scope_result.reasoning}")
                     error_msg = "죄송합니다. 저는 계약서 내용에 대한 질문에만 답변할 수 있습니다. 계약서와 관련된 내용에 대해 질문해주세요."
@@ -0,0 +1,131 @@
+"""
+LocalScopeClassifier - 로컬 범위 분류기
+
+ONNX로 내보낸 경량 한국어 분류 모델(예: klue/roberta-small 파인튜닝, INT8 양자화)로
+계약서 관련 질문 여부를 판단합니다. 확신도가 애매한 구간은 LLM에 위임합니다.
+
+모델 디렉토리 구성:
+- model.onnx: input_ids, attention_mask 입력 / 계약서 관련 logit 1개 출력
+- tokenizer.json: HuggingFace tokenizers 형식 토크나이저
+
+학습 데이터는 ScopeVerdictRecorder가 기록한 (질문, LLM 판단) 쌍으로 구축합니다.
+"""
+
+import json
+import logging
+import math
+import threading
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger("uvicorn.error")
+
+try:
+    import numpy as np
+    import onnxruntime
+    from tokenizers import Tokenizer
+except ImportError:
+    onnxruntime = None
+
+
+def _sigmoid(logit: float) -> float:
+    """수치적으로 안정적인 시그모이드 (큰 음수 logit에서 math.exp 오버플로 방지)"""
+    if logit >= 0:
+        return 1.0 / (1.0 + math.exp(-logit))
+    z = math.exp(logit)
+    return z / (1.0 + z)
+
+
+class LocalScopeClassifier:
+    """
+    ONNX 기반 로컬 범위 분류기
+
+    predict()는 계약서 관련 확률을 반환하며, gray band 구간이면 None을 반환하여
+    LLM 판단에 위임합니다.
+    """
+
+    def __init__(
+        self,
+        model_dir: str,
+        max_length: int = 128,
+        gray_band: tuple = (0.4, 0.6)
+    ):
+        """
+        Args:
+            model_dir: model.onnx, tokenizer.json이 있는 디렉토리
+            max_length: 최대 토큰 길이
+            gray_band: LLM에 위임할 확률 구간 (하한, 상한)
+        """
+        if onnxruntime is None:
+            raise ImportError("로컬 범위 분류기에는 onnxruntime, tokenizers가 필요합니다: pip install onnxruntime tokenizers")
+
+        model_path = Path(model_dir)
+        self.session = onnxruntime.InferenceSession(
+            str(model_path / "model.onnx"),
+            providers=["CPUExecutionProvider"]
+        )
+        self.tokenizer = Tokenizer.from_file(str(model_path / "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length=max_length)
+        self.gray_band = gray_band
+
+        logger.info(f"LocalScopeClassifier 초기화: {model_dir}")
+
+    def predict(self, user_message: str) -> Optional[float]:
+        """
+        계약서 관련 확률 예측
+
+        Args:
+            user_message: 사용자 질문
+
+        Returns:
+            계약서 관련 확률 (0.0-1.0), gray band 구간이면 None
+        """
+        encoding = self.tokenizer.encode(user_message)
+        input_ids = np.asarray([encoding.ids], dtype=np.int64)
+        attention_mask = np.asarray([encoding.attention_mask], dtype=np.int64)
+
+        logits = self.session.run(
+            None,
+            {"input_ids": input_ids, "attention_mask": attention_mask}
+        )[0]
+        probability = _sigmoid(float(np.ravel(logits)[0]))
+
+        low, high = self.gray_band
+        if low < probability < high:
+            return None
+        return probability
+
+
+class ScopeVerdictRecorder:
+    """
+    (질문, LLM 판단) 쌍을 JSONL로 기록
+
+    LocalScopeClassifier 학습 데이터 부트스트랩 용도입니다.
+    """
+
+    def __init__(self, dataset_path: str):
+        """
+        Args:
+            dataset_path: 기록할 JSONL 파일 경로
+        """
+        self.dataset_path = Path(dataset_path)
+        self.dataset_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def record(self, user_message: str, is_contract_related: bool):
+        """
+        판단 결과 한 건 기록
+
+        Args:
+            user_message: 사용자 질문
+            is_contract_related: LLM 판단 결과
+        """
+        line = json.dumps(
+            {"text": user_message, "label": int(bool(is_contract_related))},
+            ensure_ascii=False
+        )
+        try:
+            with self._lock, open(self.dataset_path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except OSError as e:
+            logger.warning(f"범위 판단 기록 실패: {e}")
@@ -4,14 +4,327 @@ ScopeValidator - 질문 범위 검증 + 이전 대화 참조 판단
 계약서 관련 질문인지 + 이전 대화 참조가 필요한지 동시 판단합니다.
 """
 
+import asyncio
+import functools
 import logging
 import json
-from typing import List, Dict
+import os
+import queue
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 from openai import OpenAI
 from backend.chatbot_agent.models import ValidationResult
+from backend.chatbot_agent.validators.local_scope_classifier import (
+    LocalScopeClassifier,
+    ScopeVerdictRecorder
+)
 
 logger = logging.getLogger("uvicorn.error")
 
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+    logger.warning("tiktoken이 설치되지 않았습니다. 범위 검증은 JSON 응답 방식을 사용합니다. pip install tiktoken")
+
+
+# 범위 외 키워드 (계약서와 무관할 가능성 높음)
+_OUT_OF_SCOPE_KEYWORDS = tuple(kw.casefold() for kw in (
+    "날씨", "기온", "강수량",
+    "코스피", "국회의원",
+    "요리", "레시피", "맛집",
+    "게임", "영화", "드라마", "음악",
+    "스포츠", "축구", "야구",
+    "정치", "대통령",
+    "아침", "점심", "저녁"
+))
+
+# 계약서 관련 긍정 신호 키워드
+_CONTRACT_KEYWORDS = tuple(kw.casefold() for kw in (
+    "계약", "조", "별지", "조항", "항", "내용", "규정",
+    "데이터", "제공", "이용", "대가", "지급",
+    "기간", "해지", "책임", "의무", "권리",
+    "당사자", "제공자", "이용자", "중개자",
+    "조건", "명시", "충돌", "검증",
+    "가공", "창출", "중개", "거래", "서비스",
+    "검수", "절차", "수행", "범위",
+    "대금", "비용", "수수료", "보수",
+    "손해배상", "위약금", "지체상금",
+    "비밀유지", "보안", "개인정보"
+))
+
+# 이전 대화 참조 지시어
+_REFERENCE_KEYWORDS = tuple(kw.casefold() for kw in (
+    "그게", "그거", "이거", "저거", "이것", "저것", "그것", "그",
+    "그럼", "그러면", "그래서", "그러니까",
+    "그건", "그랬", "그런", "그렇",
+    "어디", "언제", "왜", "아니",
+    "더", "또", "다시", "간단", "간략", "자세", "상세", "요약", "구체", "좀", "추가로",
+    "아까", "방금", "전에", "위에서", "앞서"
+))
+
+# 가장 짧은 키워드 길이 (이보다 짧은 메시지는 어떤 키워드도 포함할 수 없음)
+_MIN_KEYWORD_LEN = min(
+    len(kw) for kw in _OUT_OF_SCOPE_KEYWORDS + _CONTRACT_KEYWORDS + _REFERENCE_KEYWORDS
+)
+
+# 범주별 키워드 패턴 (키워드마다 부분 문자열 검색을 반복하지 않고 한 번에 스캔)
+_OUT_OF_SCOPE_PATTERN = re.compile("|".join(map(re.escape, _OUT_OF_SCOPE_KEYWORDS)))
+_CONTRACT_PATTERN = re.compile("|".join(map(re.escape, _CONTRACT_KEYWORDS)))
+_REFERENCE_PATTERN = re.compile("|".join(map(re.escape, _REFERENCE_KEYWORDS)))
+
+# 스트리밍 응답에서 판단 플래그를 조기에 추출하기 위한 패턴
+_JSON_FLAG_PATTERNS = {
+    key: re.compile(rf'"{key}"\s*:\s*(true|false)')
+    for key in ("is_contract_related", "need_previous_context")
+}
+
+# 키워드 첫 글자 집합 (메시지에 하나도 없으면 해당 범주의 패턴 검색 생략)
+_OUT_OF_SCOPE_FIRST_CHARS = frozenset(kw[0] for kw in _OUT_OF_SCOPE_KEYWORDS)
+_CONTRACT_FIRST_CHARS = frozenset(kw[0] for kw in _CONTRACT_KEYWORDS)
+_REFERENCE_FIRST_CHARS = frozenset(kw[0] for kw in _REFERENCE_KEYWORDS)
+
+# 범위 판단 프롬프트 (질문만 바뀌므로 고정 부분은 미리 구성)
+_SCOPE_CRITERIA = """계약서 관련 질문의 예:
+- 계약 조항 내용 관련 질문 → true
+- 계약 당사자, 기간, 대가 등에 대한 질문 → true
+- 계약서에 명시된 권리, 의무, 책임에 대한 질문 → true
+- 그냥 계약에 대한 질문 대부분 → true
+
+계약서와 무관한 질문의 예:
+- 일반 상식, 뉴스, 날씨 등 → false
+- 일반적인 인사, 감사 표현 → false
+- 계약서와 무관한 개인적 질문 → false
+"""
+
+_SCOPE_ONLY_PROMPT_PREFIX = """다음 질문이 계약서 내용과 관련된 질문인지 판단하세요.
+
+질문: """
+
+_SCOPE_ONLY_PROMPT_SUFFIX = "\n\n" + _SCOPE_CRITERIA + """
+응답 형식 (JSON):
+{
+    "is_contract_related": true/false,
+    "reasoning": "판단 근거 (한 문장)"
+}
+
+JSON만 응답하세요."""
+
+_SCOPE_YES_NO_PROMPT_SUFFIX = "\n\n" + _SCOPE_CRITERIA + """
+계약서 관련 질문이면 y, 무관한 질문이면 n 한 글자로만 답하세요.
+답:"""
+
+_SCOPE_DENIAL_REASON_PROMPT_PREFIX = """다음 질문은 계약서 내용과 무관한 질문으로 판단되었습니다.
+그 근거를 한 문장으로 작성하세요.
+
+질문: """
+
+# 규칙 기반 판단 결과 (매 요청 동일하므로 미리 생성해 공유, 호출자는 읽기 전용으로 사용)
+_RULE_BASED_CONTRACT = ValidationResult(
+    is_contract_related=True,
+    need_previous_context=False,
+    reasoning="계약서 키워드 감지",
+    confidence=0.95,
+    method="rule_based"
+)
+
+_RULE_BASED_CONTRACT_WITH_REFERENCE = ValidationResult(
+    is_contract_related=True,
+    need_previous_context=True,
+    reasoning="계약서 키워드 + 이전 대화 참조 감지",
+    confidence=0.95,
+    method="rule_based"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _yes_no_token_ids(model: str) -> Optional[Tuple[int, int]]:
+    """
+    모델 토크나이저 기준 "y", "n" 토큰 ID 조회
+    
+    Args:
+        model: 모델명
+        
+    Returns:
+        (y 토큰 ID, n 토큰 ID), tiktoken을 사용할 수 없으면 None
+        (실패도 캐시되어 이후 호출은 바로 JSON 응답 방식을 사용)
+    """
+    if tiktoken is None:
+        return None
+    try:
+        encoding = tiktoken.encoding_for_model(model)
+    except KeyError:
+        logger.warning(f"tiktoken이 모델을 지원하지 않음: {model}")
+        return None
+    except Exception as e:
+        # 인코딩 파일 최초 다운로드 실패 등 (예외는 lru_cache에 캐시되지 않으므로 None으로 처리)
+        logger.warning(f"tiktoken 인코딩 로드 실패, JSON 응답 방식 사용: {e}")
+        return None
+    
+    yes_tokens = encoding.encode("y")
+    no_tokens = encoding.encode("n")
+    if len(yes_tokens) != 1 or len(no_tokens) != 1:
+        return None
+    return yes_tokens[0], no_tokens[0]
+
+
+# 범위 판단 배치 결과 대기 상한 (수집/호출 스레드에 문제가 생겨도 호출자가 무한 대기하지 않도록)
+_SCOPE_BATCH_TIMEOUT_SECONDS = float(os.getenv("SCOPE_BATCH_TIMEOUT_SECONDS", "30"))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_local_classifier(model_dir: str) -> Optional[LocalScopeClassifier]:
+    """
+    로컬 범위 분류기 로드 (모델 디렉토리별로 프로세스당 한 번)
+    
+    Args:
+        model_dir: 모델 디렉토리
+        
+    Returns:
+        LocalScopeClassifier (로드 실패 시 None, 실패도 캐시되어 요청마다 재시도하지 않음)
+    """
+    try:
+        return LocalScopeClassifier(model_dir)
+    except Exception as e:
+        logger.warning(f"로컬 범위 분류기 로드 실패, LLM만 사용: {e}")
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _get_verdict_recorder(dataset_path: str) -> ScopeVerdictRecorder:
+    """기록 경로별 ScopeVerdictRecorder (프로세스당 한 번 생성, 파일 쓰기 락 공유)"""
+    return ScopeVerdictRecorder(dataset_path)
+
+
+class _ScopeBatcher:
+    """
+    범위 판단 LLM 호출 마이크로 배처 (프로세스 단위 싱글톤, _get_scope_batcher()로 사용)
+    
+    짧은 대기 시간 동안 들어온 질문을 모아 한 번의 LLM 호출로 판단하고,
+    결과를 각 호출자에게 돌려줍니다. 호출자는 결과가 나올 때까지 블로킹됩니다.
+    ScopeValidator는 요청마다 생성되므로, 질문과 함께 제출한 validator로 LLM을 호출하고
+    같은 API 설정(키, 엔드포인트)의 질문끼리만 배치로 묶습니다.
+    """
+    
+    def __init__(
+        self,
+        max_batch_size: int = 16,
+        max_wait_seconds: float = 0.02,
+        max_workers: int = 4
+    ):
+        """
+        Args:
+            max_batch_size: 배치당 최대 질문 수
+            max_wait_seconds: 첫 질문 이후 배치를 모으는 최대 대기 시간
+            max_workers: 동시에 진행할 수 있는 LLM 호출 수
+        """
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        
+        self._queue: "queue.Queue[Tuple[ScopeValidator, str, Future]]" = queue.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scope-validator")
+        self._collector: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+    
+    def submit(
+        self,
+        validator: "ScopeValidator",
+        user_message: str,
+        timeout: float = _SCOPE_BATCH_TIMEOUT_SECONDS
+    ) -> Dict[str, Any]:
+        """
+        질문을 배치 큐에 넣고 판단 결과를 기다림
+        
+        Args:
+            validator: LLM 호출에 사용할 ScopeValidator
+            user_message: 사용자 질문
+            timeout: 결과 대기 상한 (초)
+            
+        Returns:
+            {"is_contract_related": bool, "reasoning": str}
+            
+        Raises:
+            concurrent.futures.TimeoutError: timeout 내에 결과가 나오지 않은 경우
+        """
+        self._ensure_collector()
+        future: Future = Future()
+        self._queue.put((validator, user_message, future))
+        return future.result(timeout=timeout)
+    
+    def _ensure_collector(self):
+        """수집 스레드를 최초 요청 시 시작 (비정상 종료된 경우 재시작)"""
+        if self._collector is not None and self._collector.is_alive():
+            return
+        with self._lock:
+            if self._collector is None or not self._collector.is_alive():
+                self._collector = threading.Thread(
+                    target=self._collect_loop,
+                    name="scope-validator-batcher",
+                    daemon=True
+                )
+                self._collector.start()
+    
+    def _collect_loop(self):
+        """큐에서 질문을 모아 API 설정별 배치 단위로 LLM 호출을 위임"""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait_seconds
+            
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            groups: Dict[tuple, List[Tuple[ScopeValidator, str, Future]]] = {}
+            for item in batch:
+                groups.setdefault(self._client_key(item[0].client), []).append(item)
+            for group in groups.values():
+                self._executor.submit(self._dispatch, group)
+    
+    @staticmethod
+    def _client_key(client: OpenAI) -> tuple:
+        """같은 배치로 묶을 수 있는 클라이언트 구분 키 (API 키, 엔드포인트)"""
+        return (getattr(client, "api_key", None), str(getattr(client, "base_url", "")))
+    
+    def _dispatch(self, batch: List[Tuple["ScopeValidator", str, Future]]):
+        """배치를 LLM에 요청하고 결과를 각 Future에 전달"""
+        if len(batch) > 1:
+            try:
+                results = batch[0][0]._request_scope_only_batch([message for _, message, _ in batch])
+                for (_, _, future), result in zip(batch, results):
+                    future.set_result(result)
+                logger.info(f"LLM 범위 검증 배치 처리: {len(batch)}건")
+                return
+            except Exception as e:
+                logger.warning(f"LLM 범위 검증 배치 실패, 개별 처리로 전환: {e}")
+        
+        for validator, message, future in batch:
+            try:
+                future.set_result(validator._request_scope_only(message))
+            except Exception as e:
+                future.set_exception(e)
+
+
+_scope_batcher: Optional[_ScopeBatcher] = None
+_scope_batcher_lock = threading.Lock()
+
+
+def _get_scope_batcher() -> _ScopeBatcher:
+    """프로세스 단위 _ScopeBatcher 싱글톤 (최초 호출 시 생성)"""
+    global _scope_batcher
+    if _scope_batcher is None:
+        with _scope_batcher_lock:
+            if _scope_batcher is None:
+                _scope_batcher = _ScopeBatcher()
+    return _scope_batcher
+
 
 class ScopeValidator:
     """
@@ -29,40 +342,16 @@ class ScopeValidator:
         """
         self.client = openai_client
         
-        # 범위 외 키워드 (계약서와 무관할 가능성 높음)
-        self.out_of_scope_keywords = [
-            "날씨", "기온", "강수량",
-            "코스피", "국회의원",
-            "요리", "레시피", "맛집",
-            "게임", "영화", "드라마", "음악",
-            "스포츠", "축구", "야구",
-            "정치", "대통령",
-            "아침", "점심", "저녁"
-        ]
-        
-        # 계약서 관련 긍정 신호 키워드
-        self.contract_indicators = [
-            "계약", "조", "별지", "조항", "항", "내용", "규정",
-            "데이터", "제공", "이용", "대가", "지급",
-            "기간", "해지", "책임", "의무", "권리",
-            "당사자", "제공자", "이용자", "중개자",
-            "조건", "명시", "충돌", "검증",
-            "가공", "창출", "중개", "거래", "서비스",
-            "검수", "절차", "수행", "범위",
-            "대금", "비용", "수수료", "보수",
-            "손해배상", "위약금", "지체상금",
-            "비밀유지", "보안", "개인정보"
-        ]
-        
-        # 이전 대화 참조 지시어
-        self.reference_indicators = [
-            "그게", "그거", "이거", "저거", "이것", "저것", "그것", "그",
-            "그럼", "그러면", "그래서", "그러니까",
-            "그건", "그랬", "그런", "그렇",
-            "어디", "언제", "왜", "아니",
-            "더", "또", "다시", "간단", "간략", "자세", "상세", "요약", "구체", "좀", "추가로",
-            "아까", "방금", "전에", "위에서", "앞서"
-        ]
+        # 로컬 분류기 (모델이 배포된 경우에만 사용, 애매한 경우는 LLM 위임)
+        # ScopeValidator는 요청마다 생성되므로 모델/기록기는 프로세스 단위로 한 번만 로드
+        model_dir = os.getenv("SCOPE_CLASSIFIER_MODEL_DIR")
+        self.local_classifier: Optional[LocalScopeClassifier] = (
+            _load_local_classifier(model_dir) if model_dir else None
+        )
+        
+        # LLM 판단 기록 (로컬 분류기 학습 데이터)
+        dataset_path = os.getenv("SCOPE_VERDICT_DATASET_PATH")
+        self.verdict_recorder = _get_verdict_recorder(dataset_path) if dataset_path else None
         
         logger.info("ScopeValidator 초기화")
     
@@ -95,127 +384,138 @@ class ScopeValidator:
         5. 이전 대화 있음 + 나머지 → LLM 통합 판단
         """
         has_previous = previous_turn and len(previous_turn) > 0
-        message_lower = user_message.lower()
+        # 한 번만 정규화하여 모든 키워드 매칭에 재사용
+        message_lower = user_message.casefold()
         
-        # 키워드 매칭
-        has_contract_keyword = any(
-            kw in user_message for kw in self.contract_indicators
-        )
-        has_reference_keyword = any(
-            indicator in user_message for indicator in self.reference_indicators
+        # 계약서 키워드를 먼저 확인하고, 판단에 필요한 경우에만 나머지 키워드를 스캔
+        # 계약서 키워드가 없으면 나머지 키워드는 판단에 쓰이지 않으므로 길이 검사는 여기서 한 번만 수행
+        has_contract_keyword = (
+            len(message_lower) >= _MIN_KEYWORD_LEN
+            and self._contains_any(message_lower, _CONTRACT_PATTERN, _CONTRACT_FIRST_CHARS)
         )
-        has_out_of_scope_keyword = any(
-            keyword in message_lower for keyword in self.out_of_scope_keywords
+        
+        if not has_contract_keyword:
+            # 케이스 2: 이전 대화 없음 + contract_indicators ❌
+            if not has_previous:
+                logger.info("범위 검증: 이전 대화 없음 + 계약서 키워드 없음 → LLM (범위만 판단)")
+                return self._llm_validate_scope_only(user_message)
+            
+            # 케이스 5: 이전 대화 있음 + 나머지
+            logger.info("범위 검증: 이전 대화 있음 + 기타 케이스 → LLM 통합 판단")
+            return self._llm_validate_integrated(user_message, previous_turn)
+        
+        has_out_of_scope_keyword = self._contains_any(
+            message_lower, _OUT_OF_SCOPE_PATTERN, _OUT_OF_SCOPE_FIRST_CHARS
         )
         
-        # 케이스 1: 이전 대화 없음 + contract_indicators ✅ + out_of_scope ❌
-        if not has_previous and has_contract_keyword and not has_out_of_scope_keyword:
+        if not has_previous:
+            # 케이스 1-1: 이전 대화 없음 + contract_indicators ✅ + out_of_scope ✅
+            if has_out_of_scope_keyword:
+                logger.info("범위 검증: 이전 대화 없음 + 계약서 키워드 + 범위 외 키워드 동시 존재 → LLM 판단")
+                return self._llm_validate_scope_only(user_message)
+            
+            # 케이스 1: 이전 대화 없음 + contract_indicators ✅ + out_of_scope ❌
             logger.info("범위 검증: 이전 대화 없음 + 계약서 키워드 존재 + 범위 외 키워드 없음 → LLM 스킵")
-            return ValidationResult(
-                is_contract_related=True,
-                need_previous_context=False,
-                reasoning="계약서 키워드 감지",
-                confidence=0.95,
-                method="rule_based"
-            )
+            return _RULE_BASED_CONTRACT
         
-        # 케이스 1-1: 이전 대화 없음 + contract_indicators ✅ + out_of_scope ✅
-        if not has_previous and has_contract_keyword and has_out_of_scope_keyword:
-            logger.info("범위 검증: 이전 대화 없음 + 계약서 키워드 + 범위 외 키워드 동시 존재 → LLM 판단")
-            return self._llm_validate_scope_only(user_message)
+        # 케이스 4: 이전 대화 있음 + contract_indicators ✅ + out_of_scope ✅
+        if has_out_of_scope_keyword:
+            logger.info("범위 검증: 이전 대화 있음 + 계약서 키워드 + 범위 외 키워드 동시 존재 → LLM 통합 판단")
+            return self._llm_validate_integrated(user_message, previous_turn)
         
-        # 케이스 2: 이전 대화 없음 + contract_indicators ❌
-        if not has_previous and not has_contract_keyword:
-            logger.info("범위 검증: 이전 대화 없음 + 계약서 키워드 없음 → LLM (범위만 판단)")
-            return self._llm_validate_scope_only(user_message)
+        has_reference_keyword = self._contains_any(
+            message_lower, _REFERENCE_PATTERN, _REFERENCE_FIRST_CHARS
+        )
         
         # 케이스 3: 이전 대화 있음 + 둘 다 ✅ + out_of_scope ❌
-        if has_previous and has_contract_keyword and has_reference_keyword and not has_out_of_scope_keyword:
+        if has_reference_keyword:
             logger.info("범위 검증: 이전 대화 있음 + 둘 다 매칭 + 범위 외 키워드 없음 → LLM 스킵")
-            return ValidationResult(
-                is_contract_related=True,
-                need_previous_context=True,
-                reasoning="계약서 키워드 + 이전 대화 참조 감지",
-                confidence=0.95,
-                method="rule_based"
-            )
+            return _RULE_BASED_CONTRACT_WITH_REFERENCE
         
         # 케이스 3-1: 이전 대화 있음 + contract_indicators ✅ + out_of_scope ❌ (신규)
         # → is_contract_related=true 확정, need_previous_context만 LLM 판단
-        if has_previous and has_contract_keyword and not has_out_of_scope_keyword:
-            logger.info("범위 검증: 이전 대화 있음 + 계약서 키워드 존재 + 범위 외 키워드 없음 → is_contract_related=true 확정, need_previous_context만 LLM 판단")
-            return self._llm_validate_context_only(user_message, previous_turn)
+        logger.info("범위 검증: 이전 대화 있음 + 계약서 키워드 존재 + 범위 외 키워드 없음 → is_contract_related=true 확정, need_previous_context만 LLM 판단")
+        return self._llm_validate_context_only(user_message, previous_turn)
+    
+    async def validate_async(
+        self,
+        user_message: str,
+        previous_turn: List[Dict[str, str]] = None
+    ) -> ValidationResult:
+        """
+        validate()의 비동기 버전 (async 호출자용)
         
-        # 케이스 4: 이전 대화 있음 + contract_indicators ✅ + out_of_scope ✅
-        if has_previous and has_contract_keyword and has_out_of_scope_keyword:
-            logger.info("범위 검증: 이전 대화 있음 + 계약서 키워드 + 범위 외 키워드 동시 존재 → LLM 통합 판단")
-            return self._llm_validate_integrated(user_message, previous_turn)
+        LLM 호출이 이벤트 루프를 막지 않도록 워커 스레드에서 검증을 수행합니다.
+        동시 요청은 스레드에서 _ScopeBatcher로 모이므로 배치 처리도 그대로 적용됩니다.
         
-        # 케이스 5: 이전 대화 있음 + 나머지
-        if has_previous:
-            logger.info("범위 검증: 이전 대화 있음 + 기타 케이스 → LLM 통합 판단")
-            return self._llm_validate_integrated(user_message, previous_turn)
+        Args:
+            user_message: 사용자 질문
+            previous_turn: 직전 대화 이력 (선택)
+            
+        Returns:
+            ValidationResult
+        """
+        return await asyncio.to_thread(self.validate, user_message, previous_turn)
+    
+    @staticmethod
+    def _contains_any(message: str, pattern: "re.Pattern[str]", first_chars: frozenset) -> bool:
+        """
+        키워드 중 하나라도 메시지에 포함되는지 확인
         
-        # 폴백 (도달하지 않아야 함)
-        logger.warning("범위 검증: 예상치 못한 케이스, 기본값 반환")
-        return ValidationResult(
-            is_contract_related=True,
-            need_previous_context=False,
-            reasoning="예상치 못한 케이스",
-            confidence=0.5,
-            method="fallback"
-        )
+        키워드 첫 글자가 메시지에 하나도 없으면 패턴 검색 없이 즉시 False를 반환합니다.
+        
+        Args:
+            message: casefold된 사용자 질문
+            pattern: 범주 키워드 alternation 패턴
+            first_chars: 키워드 첫 글자 집합
+            
+        Returns:
+            키워드 포함 여부
+        """
+        if first_chars.isdisjoint(message):
+            return False
+        return pattern.search(message) is not None
     
     def _llm_validate_scope_only(self, user_message: str) -> ValidationResult:
         """
         LLM 기반 범위 검증 (이전 대화 없음)
         
+        로컬 분류기가 있으면 먼저 판단하고, 확신도가 애매한 경우에만 LLM을 호출합니다.
+        동시에 들어온 요청은 _ScopeBatcher가 모아 한 번의 LLM 호출로 판단합니다.
+        
         Args:
             user_message: 사용자 질문
             
         Returns:
             ValidationResult (need_previous_context=False 고정)
         """
-        prompt = f"""다음 질문이 계약서 내용과 관련된 질문인지 판단하세요.
-
-질문: {user_message}
-
-계약서 관련 질문의 예:
-- 계약 조항 내용 관련 질문 → true
-- 계약 당사자, 기간, 대가 등에 대한 질문 → true
-- 계약서에 명시된 권리, 의무, 책임에 대한 질문 → true
-- 그냥 계약에 대한 질문 대부분 → true
-
-계약서와 무관한 질문의 예:
-- 일반 상식, 뉴스, 날씨 등 → false
-- 일반적인 인사, 감사 표현 → false
-- 계약서와 무관한 개인적 질문 → false
-
-응답 형식 (JSON):
-{{
-    "is_contract_related": true/false,
-    "reasoning": "판단 근거 (한 문장)"
-}}
-
-JSON만 응답하세요."""
-
+        if self.local_classifier is not None:
+            try:
+                probability = self.local_classifier.predict(user_message)
+                if probability is not None:
+                    is_contract_related = probability >= 0.5
+                    logger.info(f"로컬 범위 검증: is_contract_related={is_contract_related} (p={probability:.3f})")
+                    return ValidationResult(
+                        is_contract_related=is_contract_related,
+                        need_previous_context=False,
+                        reasoning="로컬 분류기 판단",
+                        confidence=max(probability, 1.0 - probability),
+                        method="local_classifier"
+                    )
+            except Exception as e:
+                logger.warning(f"로컬 범위 검증 실패, LLM으로 전환: {e}")
+        
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.0,
-                max_tokens=100,
-                response_format={"type": "json_object"}
-            )
-            
-            content = response.choices[0].message.content.strip()
-            result = json.loads(content)
+            result = _get_scope_batcher().submit(self, user_message)
             
             is_contract_related = result.get("is_contract_related", False)
-            reasoning = result.get("reasoning", "")
+            reasoning = result.get("reasoning")
             
             logger.info(f"LLM 범위 검증 (범위만): is_contract_related={is_contract_related}")
             
+            if self.verdict_recorder is not None:
+                self.verdict_recorder.record(user_message, is_contract_related)
+            
             return ValidationResult(
                 is_contract_related=is_contract_related,
                 need_previous_context=False,  # 고정
@@ -235,6 +535,209 @@ JSON만 응답하세요."""
                 method="fallback"
             )
     
+    def _request_scope_only(self, user_message: str) -> Dict[str, Any]:
+        """
+        질문 1건에 대한 범위 판단 LLM 호출
+        
+        Args:
+            user_message: 사용자 질문
+            
+        Returns:
+            {"is_contract_related": bool, "reasoning": Optional[str]}
+        """
+        token_ids = _yes_no_token_ids("gpt-4o-mini")
+        if token_ids is None:
+            prompt = _SCOPE_ONLY_PROMPT_PREFIX + user_message + _SCOPE_ONLY_PROMPT_SUFFIX
+            return self._stream_json_flags(
+                prompt,
+                flag_keys=("is_contract_related",),
+                temperature=0.0,
+                max_tokens=100
+            )
+        
+        # y/n 한 토큰만 생성하도록 제한 (판단 근거는 범위 외인 경우에만 별도 요청)
+        prompt = _SCOPE_ONLY_PROMPT_PREFIX + user_message + _SCOPE_YES_NO_PROMPT_SUFFIX
+        response = self.client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.0,
+            max_tokens=1,
+            logit_bias={str(token_id): 100 for token_id in token_ids}
+        )
+        
+        answer = (response.choices[0].message.content or "").strip().casefold()
+        result: Dict[str, Any] = {"is_contract_related": answer.startswith("y")}
+        if not result["is_contract_related"]:
+            result["reasoning"] = self._request_scope_denial_reason(user_message)
+        return result
+    
+    def _request_scope_denial_reason(self, user_message: str) -> Optional[str]:
+        """
+        범위 외로 판단된 질문의 판단 근거 요청
+        
+        Args:
+            user_message: 사용자 질문
+            
+        Returns:
+            판단 근거 (실패 시 None)
+        """
+        try:
+            response = self.client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": _SCOPE_DENIAL_REASON_PROMPT_PREFIX + user_message}],
+                temperature=0.0,
+                max_tokens=60
+            )
+            return response.choices[0].message.content.strip()
+        except Exception as e:
+            logger.warning(f"범위 외 판단 근거 요청 실패: {e}")
+            return None
+    
+    def _request_scope_only_batch(self, user_messages: List[str]) -> List[Dict[str, Any]]:
+        """
+        여러 질문에 대한 범위 판단을 한 번의 LLM 호출로 수행
+        
+        Args:
+            user_messages: 사용자 질문 리스트
+            
+        Returns:
+            질문 순서대로 정렬된 [{"is_contract_related": bool, "reasoning": str}, ...]
+            
+        Raises:
+            ValueError: 응답 번호가 1..N과 정확히 일치하지 않거나 판단 플래그가 없는 경우
+        """
+        questions_text = "\n".join(
+            f"{i}. {message}" for i, message in enumerate(user_messages, 1)
+        )
+        
+        prompt = f"""다음 {len(user_messages)}개의 질문 각각이 계약서 내용과 관련된 질문인지 판단하세요.
+각 질문은 서로 독립적입니다.
+
+질문 목록:
+{questions_text}
+
+{_SCOPE_CRITERIA}
+응답 형식 (JSON, 질문 번호 순서대로 {len(user_messages)}개):
+{{
+    "results": [
+        {{
+            "index": 질문 번호,
+            "is_contract_related": true/false,
+            "reasoning": "판단 근거 (한 문장)"
+        }}
+    ]
+}}
+
+JSON만 응답하세요."""
+
+        response = self.client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.0,
+            max_tokens=100 * len(user_messages),
+            response_format={"type": "json_object"}
+        )
+        
+        content = response.choices[0].message.content.strip()
+        results = json.loads(content).get("results", [])
+        
+        if len(results) != len(user_messages):
+            raise ValueError(
+                f"배치 응답 개수 불일치: 질문 {len(user_messages)}개, 응답 {len(results)}개"
+            )
+        
+        # 번호 중복/누락이 있으면 다른 질문의 판단이 섞이므로 배치 전체를 무효화 (호출 측에서 개별 처리)
+        results_by_index: Dict[int, Dict[str, Any]] = {}
+        for result in results:
+            index = result.get("index") if isinstance(result, dict) else None
+            if not isinstance(index, int) or isinstance(index, bool) or index in results_by_index:
+                raise ValueError(f"배치 응답 번호 오류: {index}")
+            if not isinstance(result.get("is_contract_related"), bool):
+                raise ValueError(f"배치 응답 {index}번에 is_contract_related 누락")
+            results_by_index[index] = result
+        
+        if set(results_by_index) != set(range(1, len(user_messages) + 1)):
+            raise ValueError(f"배치 응답 번호 불일치: {sorted(results_by_index)}")
+        
+        return [results_by_index[i] for i in range(1, len(user_messages) + 1)]
+    
+    def _stream_json_flags(
+        self,
+        prompt: str,
+        flag_keys: Tuple[str, ...],
+        temperature: float,
+        max_tokens: int
+    ) -> Dict[str, Any]:
+        """
+        JSON 응답을 스트리밍으로 받으면서 판단 플래그가 모두 나오면 즉시 중단
+        
+        판단에는 불리언 플래그만 필요하므로, 플래그가 모두 도착하면 뒤따르는
+        reasoning 생성을 기다리지 않습니다. 이 경우 reasoning은 포함되지 않습니다.
+        
+        Args:
+            prompt: 프롬프트
+            flag_keys: 추출할 불리언 플래그 키
+            temperature: 온도
+            max_tokens: 최대 출력 토큰
+            
+        Returns:
+            {flag_key: bool, ..., "reasoning": str (응답이 끝까지 도착한 경우)}
+        """
+        stream = self.client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[{"role": "user", "content": prompt}],
+            temperature=temperature,
+            max_tokens=max_tokens,
+            response_format={"type": "json_object"},
+            stream=True
+        )
+        
+        buffer = ""
+        flags: Dict[str, Any] = {}
+        try:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                buffer += delta
+                
+                for key in flag_keys:
+                    if key not in flags:
+                        match = _JSON_FLAG_PATTERNS[key].search(buffer)
+                        if match:
+                            flags[key] = match.group(1) == "true"
+                
+                if len(flags) == len(flag_keys):
+                    return flags
+        finally:
+            stream.close()
+        
+        # 플래그가 끝까지 나오지 않은 경우 전체 응답 파싱
+        return json.loads(buffer.strip())
+    
+    @staticmethod
+    def _format_previous_turn(previous_turn: List[Dict[str, str]]) -> str:
+        """
+        이전 대화를 프롬프트용 텍스트로 구성
+        
+        Args:
+            previous_turn: 이전 대화
+            
+        Returns:
+            "사용자: ...\n챗봇: ...\n" 형식 문자열
+        """
+        lines = []
+        for msg in previous_turn:
+            role = msg.get("role", "")
+            content = msg.get("content", "")
+            if role == "user":
+                lines.append(f"사용자: {content}\n")
+            elif role == "assistant":
+                lines.append(f"챗봇: {content}\n")
+        return "".join(lines)
+    
     def _llm_validate_context_only(
         self,
         user_message: str,
@@ -250,15 +753,7 @@ JSON만 응답하세요."""
         Returns:
             ValidationResult (is_contract_related=true 고정)
         """
-        # 이전 대화 컨텍스트 구성
-        context_text = ""
-        for msg in previous_turn:
-            role = msg.get("role", "")
-            content = msg.get("content", "")
-            if role == "user":
-                context_text += f"사용자: {content}\n"
-            elif role == "assistant":
-                context_text += f"챗봇: {content}\n"
+        context_text = self._format_previous_turn(previous_turn)
         
         prompt = f"""다음은 계약서 챗봇과의 대화 내역입니다.
 현재 질문이 이전 대화를 참조하는지만 판단하세요.
@@ -293,19 +788,15 @@ JSON만 응답하세요."""
 JSON만 응답하세요."""
 
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
+            result = self._stream_json_flags(
+                prompt,
+                flag_keys=("need_previous_context",),
                 temperature=0.0,
-                max_tokens=100,
-                response_format={"type": "json_object"}
+                max_tokens=100
             )
             
-            content = response.choices[0].message.content.strip()
-            result = json.loads(content)
-            
             need_previous_context = result.get("need_previous_context", False)
-            reasoning = result.get("reasoning", "")
+            reasoning = result.get("reasoning")
             
             logger.info(f"LLM 컨텍스트 검증 (참조만): need_previous_context={need_previous_context}")
             
@@ -343,15 +834,7 @@ JSON만 응답하세요."""
         Returns:
             ValidationResult (두 가지 모두 LLM이 판단)
         """
-        # 이전 대화 컨텍스트 구성
-        context_text = ""
-        for msg in previous_turn:
-            role = msg.get("role", "")
-            content = msg.get("content", "")
-            if role == "user":
-                context_text += f"사용자: {content}\n"
-            elif role == "assistant":
-                context_text += f"챗봇: {content}\n"
+        context_text = self._format_previous_turn(previous_turn)
         
         prompt = f"""다음은 "데이터 계약서 챗봇"과의 대화 내역입니다.
 현재 사용자 질문에 대해 두 가지를 판단하세요.
@@ -423,20 +906,16 @@ JSON만 응답하세요."""
 JSON만 응답하세요."""
 
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
+            result = self._stream_json_flags(
+                prompt,
+                flag_keys=("need_previous_context", "is_contract_related"),
                 temperature=0.1,
-                max_tokens=250,
-                response_format={"type": "json_object"}
+                max_tokens=250
             )
             
-            content = response.choices[0].message.content.strip()
-            result = json.loads(content)
-            
             is_contract_related = result.get("is_contract_related", False)
             need_previous_context = result.get("need_previous_context", False)
-            reasoning = result.get("reasoning", "")
+            reasoning = result.get("reasoning")
             
             logger.info(
                 f"LLM 통합 검증: is_contract_related={is_contract_related}, "
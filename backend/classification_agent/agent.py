@@ -3,17 +3,120 @@ Classification Agent
 사용자 계약서의 유형을 5종 표준계약 중 하나로 분류
 """
 
+import asyncio
+import hashlib
+import io
+import json
 import logging
 import os
+import re
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, List, Tuple, Optional
-from openai import AzureOpenAI
-from backend.shared.core.celery_app import celery_app
-from backend.shared.database import SessionLocal, ContractDocument, ClassificationResult, TokenUsage
+
+import httpx
+import numpy as np
+from celery.signals import worker_process_init, worker_process_shutdown
+from openai import AzureOpenAI, AsyncAzureOpenAI
+from backend.shared.core.celery_app import celery_app, worker_consumes
+from backend.shared.database import (
+    SessionLocal, ContractDocument, ClassificationResult, ClassificationCache,
+    get_token_usage_batcher
+)
+from backend.shared.services import get_embedding_service
 from backend.shared.services.embedding_loader import EmbeddingLoader
+from backend.shared.services.knowledge_base_loader import get_knowledge_base_loader
 
 logger = logging.getLogger(__name__)
 
+try:
+    import redis
+except ImportError:
+    redis = None
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+try:
+    import orjson
+    _json_loads = orjson.loads  # orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스
+except ImportError:
+    _json_loads = json.loads
+
+
+# Few-shot 프롬프트에 넣을 조항당 최대 글자 수 (제목+조문+내용)
+_MAX_ARTICLE_CHARS = 400
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# LLM 분류 응답 JSON 파싱 실패 시 사용하는 폴백 패턴
+_ANSWER_TYPE_PATTERN = re.compile(r'type["\']?\s*:\s*["\']?(\w+)', re.IGNORECASE)
+_ANSWER_CONFIDENCE_PATTERN = re.compile(r'confidence["\']?\s*:\s*["\']?([\d.]+)', re.IGNORECASE)
+_ANSWER_REASON_PATTERN = re.compile(r'reason["\']?\s*:\s*["\']?([^"\'\n]+)', re.IGNORECASE)
+
+
+# 임베딩 게이트 (유사도 결과가 명확하면 LLM 생략). false면 항상 LLM Few-shot 분류
+# 실제 임베딩 기반 유사도 분포로 게이트 임계값(gap, top1)을 검증하기 전까지 기본 비활성화
+EMBEDDING_GATE_ENABLED = os.getenv("CLASSIFICATION_EMBEDDING_GATE_ENABLED", "false").lower() == "true"
+
+# LLM 분류 결과 캐시 (Redis 1차, classification_cache 테이블 2차)
+LLM_CACHE_ENABLED = os.getenv("CLASSIFICATION_LLM_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_TTL = int(os.getenv("CLASSIFICATION_LLM_CACHE_TTL", str(7 * 24 * 3600)))  # 초
+
+# 조항 텍스트 쿼리 임베딩 캐시 (Redis, LLM 분류 결과 캐시와 별도로 제어)
+EMBEDDING_CACHE_ENABLED = os.getenv("CLASSIFICATION_EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+EMBEDDING_CACHE_TTL = int(os.getenv("CLASSIFICATION_EMBEDDING_CACHE_TTL", str(7 * 24 * 3600)))  # 초
+
+_redis_client = None
+
+
+def _get_redis_client():
+    """분류 캐시용 Redis 클라이언트 (연결 불가 시 None, DB 캐시만 사용)"""
+    global _redis_client
+    if _redis_client is None:
+        if redis is None:
+            return None
+        try:
+            client = redis.Redis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379"))
+            client.ping()
+            _redis_client = client
+        except Exception as e:
+            logger.warning(f"분류 캐시 Redis 연결 실패, DB 캐시만 사용: {e}")
+            _redis_client = False
+    return _redis_client or None
+
+
+# 임베딩 모델 입력 토큰 한도 (text-embedding-3-large)
+_EMBEDDING_MAX_TOKENS = 8191
+_embedding_encoding = None
+
+
+def _truncate_to_embedding_limit(text: str) -> str:
+    """임베딩 입력 토큰 한도를 넘는 텍스트를 자름 (tiktoken 미설치 시 그대로 반환)"""
+    global _embedding_encoding
+    if tiktoken is None:
+        return text
+    if _embedding_encoding is None:
+        _embedding_encoding = tiktoken.get_encoding("cl100k_base")
+    tokens = _embedding_encoding.encode(text)
+    if len(tokens) <= _EMBEDDING_MAX_TOKENS:
+        return text
+    logger.info(f"임베딩 입력 토큰 한도 초과로 자름: {len(tokens)} → {_EMBEDDING_MAX_TOKENS}")
+    return _embedding_encoding.decode(tokens[:_EMBEDDING_MAX_TOKENS])
+
+
+def _truncate(text: str, limit: int) -> str:
+    """공백을 한 칸으로 정규화한 뒤 limit자 이내로 자름 (잘린 경우 '...' 포함 limit자)"""
+    if limit <= 0 or not text:
+        return ""
+    normalized = _WHITESPACE_PATTERN.sub(" ", text).strip()
+    if len(normalized) <= limit:
+        return normalized
+    if limit <= 3:
+        return normalized[:limit]
+    return normalized[:limit - 3] + "..."
+
 
 class ClassificationAgent:
     """
@@ -141,10 +244,60 @@ class ClassificationAgent:
 }
 
 
+"""
+
+    # Few-shot 분류 system 메시지
+    # 호출마다 바이트 단위로 동일해야 Azure OpenAI 프롬프트 캐싱이 적용되므로 동적 값을 넣지 않음
+    FEWSHOT_SYSTEM_PROMPT = f"""당신은 데이터 계약서 분류 전문가입니다.
+
+다음은 5가지 데이터 계약 유형의 특징과 출력 예시입니다:
+
+{FEWSHOT_EXAMPLES}
+
+---
+
+**분석 지침**:
+1. 역할 구조 파악 (누가 누구에게 무엇을 제공/위탁/중개하는가)
+2. 핵심 패턴 찾기 (제공, 생성, 가공, 중개 관련 키워드)
+3. 데이터 흐름 확인 (단방향/양방향, 창출 여부)
+
+**출력 형식** (반드시 JSON만 출력):
+{{
+  "type": "[provide|create|process|brokerage_provider|brokerage_user]",
+  "confidence": [0.0-1.0 사이의 숫자],
+  "reason": "[역할 구조와 핵심 패턴 기반 판단 근거]"
+}}
+"""
+
+    # 유사도 점수 줄 템플릿 (유형 설명은 고정이므로 미리 구성)
+    SCORE_LINE_TEMPLATES = {t: f"- {desc}: {{score:.3f}}" for t, desc in CONTRACT_TYPES.items()}
+
+    # _llm_classify 프롬프트의 고정 후반부
+    LEGACY_PROMPT_FOOTER = """
+
+위 정보를 바탕으로 이 계약서가 어떤 유형인지 판단해주세요.
+
+가능한 유형:
+1. provide: 데이터 제공 계약 (데이터 제공자 → 이용자)
+2. create: 데이터 생성 계약 (데이터 생성 위탁)
+3. process: 데이터 가공 계약 (데이터 가공 위탁)
+4. brokerage_provider: 데이터 중개 계약 (제공자용)
+5. brokerage_user: 데이터 중개 계약 (이용자용)
+
+**출력 형식** (반드시 JSON만 출력):
+{
+  "type": "[provide|create|process|brokerage_provider|brokerage_user]",
+  "confidence": [0.0-1.0 사이의 숫자],
+  "reason": "[간단한 판단 근거]"
+}
 """
 
     # Gating threshold
     SCORE_GAP_THRESHOLD = 0.05  # 1위-2위 점수 차이 임계값
+    TOP1_SCORE_THRESHOLD = 0.85  # 1위 점수가 이 이상이면 차이와 무관하게 임베딩 결과 사용
+
+    # 유형별 유사도 계산에 사용할 표준계약서 청크 수
+    SIMILARITY_CHUNKS_PER_TYPE = 20
 
     def __init__(
         self,
@@ -170,10 +323,19 @@ class ClassificationAgent:
         if not self.api_key or not self.azure_endpoint:
             raise ValueError("Azure OpenAI 자격 증명이 필요합니다")
 
+        # 워커 프로세스에서 인스턴스를 재사용하므로 keep-alive 연결을 넉넉히 유지
+        http_limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
         self.client = AzureOpenAI(
             api_key=self.api_key,
             api_version=api_version,
-            azure_endpoint=self.azure_endpoint
+            azure_endpoint=self.azure_endpoint,
+            http_client=httpx.Client(limits=http_limits)
+        )
+        self.async_client = AsyncAzureOpenAI(
+            api_key=self.api_key,
+            api_version=api_version,
+            azure_endpoint=self.azure_endpoint,
+            http_client=httpx.AsyncClient(limits=http_limits)
         )
 
         self.embedding_loader = EmbeddingLoader()
@@ -237,6 +399,88 @@ class ClassificationAgent:
             logger.error(f"분류 실패: {contract_id} - {e}")
             raise
 
+    async def classify_async(
+        self,
+        contract_id: str,
+        parsed_data: Dict[str, Any],
+        knowledge_base_loader,
+        filename: str = None
+    ) -> Dict[str, Any]:
+        """
+        사용자 계약서 분류 (비동기)
+
+        classify()와 동일한 결과를 반환하며, 유사도 계산은 스레드로 넘기고
+        LLM 호출은 AsyncAzureOpenAI로 수행합니다.
+        """
+        try:
+            logger.info(f"계약서 분류 시작: {contract_id}")
+
+            key_articles = self._extract_key_articles(parsed_data)
+
+            similarity_scores = await asyncio.to_thread(
+                self._calculate_similarity_scores,
+                key_articles,
+                knowledge_base_loader,
+                contract_id,
+                parsed_data
+            )
+
+            result, score_gap = self._embedding_gate(similarity_scores, contract_id)
+            if result is None:
+                logger.info(f"⚠ LLM 정밀 분류 필요 (유사도 점수 차이 0.05 미만)")
+                predicted_type, confidence, reasoning = await self._llm_classify_with_fewshot_async(
+                    key_articles,
+                    similarity_scores,
+                    contract_id,
+                    filename
+                )
+                result = self._build_llm_result(
+                    contract_id, predicted_type, confidence, reasoning, similarity_scores, score_gap
+                )
+
+            logger.info(
+                f"분류 완료: {contract_id} -> {result['predicted_type']} "
+                f"(신뢰도: {result['confidence']:.2%}, 방법: {result.get('classification_method', 'unknown')})"
+            )
+            return result
+
+        except Exception as e:
+            logger.error(f"분류 실패: {contract_id} - {e}")
+            raise
+
+    async def classify_batch(
+        self,
+        items: List[Dict[str, Any]],
+        knowledge_base_loader,
+        max_concurrency: int = 10
+    ) -> List[Any]:
+        """
+        여러 계약서 동시 분류
+
+        Args:
+            items: {"contract_id", "parsed_data", "filename"(옵션)} 딕셔너리 리스트
+            knowledge_base_loader: 지식베이스 로더 인스턴스
+            max_concurrency: 동시 LLM 호출 상한
+
+        Returns:
+            items 순서의 분류 결과 리스트 (실패한 항목은 예외 객체)
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _classify_one(item: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.classify_async(
+                    contract_id=item["contract_id"],
+                    parsed_data=item["parsed_data"],
+                    knowledge_base_loader=knowledge_base_loader,
+                    filename=item.get("filename")
+                )
+
+        return await asyncio.gather(
+            *[_classify_one(item) for item in items],
+            return_exceptions=True
+        )
+
     def _extract_key_articles(self, parsed_data: Dict[str, Any]) -> List[Dict[str, str]]:
         """
         주요 조항 추출 (처음 5개 조항)
@@ -257,6 +501,7 @@ class ClassificationAgent:
 
             key_articles.append({
                 "number": article.get("number"),
+                "article_no": self._safe_int(article.get("number")),
                 "title": article.get("title", ""),
                 "text": text,
                 "content": content,
@@ -274,8 +519,6 @@ class ClassificationAgent:
         parsed_data: Optional[Dict[str, Any]] = None
     ) -> Dict[str, float]:
         """Calculate similarity scores against standard contract types."""
-        scores: Dict[str, float] = {}
-
         query_embedding = self._build_query_embedding(
             key_articles=key_articles,
             parsed_data=parsed_data,
@@ -286,28 +529,24 @@ class ClassificationAgent:
             logger.warning("Failed to build query embedding; returning zero scores.")
             return {contract_type: 0.0 for contract_type in self.CONTRACT_TYPES.keys()}
 
-        for contract_type in self.CONTRACT_TYPES.keys():
-            try:
-                chunks = knowledge_base_loader.load_chunks(contract_type)
-
-                if not chunks:
-                    logger.warning(f"No chunks available: {contract_type}")
-                    scores[contract_type] = 0.0
-                    continue
-
-                similarities = []
-                for chunk in chunks[:20]:
-                    chunk_embedding = chunk.get("embedding")
-                    if chunk_embedding:
-                        sim = self._cosine_similarity(query_embedding, chunk_embedding)
-                        similarities.append(sim)
+        contract_types = tuple(self.CONTRACT_TYPES.keys())
+        centroids = knowledge_base_loader.load_similarity_centroids(
+            contract_types, max_chunks_per_type=self.SIMILARITY_CHUNKS_PER_TYPE
+        )
+        if centroids is None:
+            return {contract_type: 0.0 for contract_type in contract_types}
 
-                avg_similarity = sum(similarities) / len(similarities) if similarities else 0.0
-                scores[contract_type] = avg_similarity
+        try:
+            # 쿼리는 여기서 한 번만 정규화 (0 벡터면 모든 점수 0)
+            # 중심 벡터 @ q = 유형별 청크 코사인 유사도 평균 (유형 수만큼의 내적)
+            query = np.asarray(query_embedding, dtype=np.float32)
+            query /= np.linalg.norm(query) or 1.0
+            means = centroids @ query
+        except ValueError as e:
+            logger.error(f"Similarity calculation failed: {e}")
+            return {contract_type: 0.0 for contract_type in contract_types}
 
-            except Exception as e:
-                logger.error(f"Similarity calculation failed: {contract_type} - {e}")
-                scores[contract_type] = 0.0
+        scores = dict(zip(contract_types, means.tolist()))
 
         logger.debug(f"Similarity scores: {scores}")
         return scores
@@ -317,21 +556,31 @@ class ClassificationAgent:
         key_articles: List[Dict[str, str]],
         parsed_data: Optional[Dict[str, Any]],
         contract_id: Optional[str],
-    ) -> Optional[List[float]]:
+    ) -> Optional[np.ndarray]:
         stored_embeddings = self._get_stored_embeddings(contract_id, parsed_data)
 
         if stored_embeddings:
             combined = self._combine_article_embeddings(stored_embeddings, key_articles)
-            if combined:
+            if combined is not None:
                 return combined
+
+            # 주요 조항 임베딩이 없으면 파싱 시 저장한 문서 임베딩 사용 (임베딩 API 호출 없음)
+            document_embedding = stored_embeddings.get("document_embedding")
+            if document_embedding:
+                logger.info("Stored embeddings incomplete for key articles; using document embedding.")
+                return np.asarray(document_embedding, dtype=np.float32)
             logger.warning("Stored embeddings incomplete for key articles; falling back to live embedding.")
 
-        query_text = " ".join([art.get("full_text", "") for art in key_articles])
-        normalized = " ".join(query_text.split())
-        if not normalized:
+        # 조항별 텍스트를 한 번의 배치 호출로 임베딩하여 평균 (조항 단위 신호 유지)
+        article_texts = [
+            " ".join(art.get("full_text", "").split())
+            for art in key_articles
+        ]
+        article_texts = [text for text in article_texts if text]
+        if not article_texts:
             return None
 
-        return self._get_embedding(normalized, contract_id)
+        return self._get_live_query_embedding(article_texts, contract_id)
 
     def _get_stored_embeddings(
         self,
@@ -354,7 +603,7 @@ class ClassificationAgent:
         self,
         embeddings_payload: Dict[str, Any],
         key_articles: List[Dict[str, str]],
-    ) -> Optional[List[float]]:
+    ) -> Optional[np.ndarray]:
         article_entries = embeddings_payload.get("article_embeddings")
         if not article_entries:
             return None
@@ -365,48 +614,59 @@ class ClassificationAgent:
             if entry.get("article_no") is not None
         }
 
-        aggregated_vectors: List[List[float]] = []
+        # 조항별 벡터를 한 리스트에 이어 붙이고 조항 경계만 기록 (배열 변환은 한 번만)
+        flat_vectors: List[List[float]] = []
+        segment_starts: List[int] = []
 
         for article in key_articles:
-            article_no = self._safe_int(article.get("number"))
-            if article_no is None:
-                continue
-
-            entry = article_map.get(article_no)
+            # article_no는 _extract_key_articles에서 정수로 변환됨 (저장 임베딩도 정수 키)
+            entry = article_map.get(article.get("article_no"))
             if not entry:
                 continue
 
-            vectors: List[List[float]] = []
+            start = len(flat_vectors)
             title_vec = entry.get("title_embedding")
             if title_vec:
-                vectors.append(title_vec)
+                flat_vectors.append(title_vec)
 
             for sub_item in entry.get("sub_items", []):
                 vec = sub_item.get("text_embedding")
                 if vec:
-                    vectors.append(vec)
+                    flat_vectors.append(vec)
 
-            if vectors:
-                article_vector = self._average_vectors(vectors)
-                if article_vector:
-                    aggregated_vectors.append(article_vector)
+            if len(flat_vectors) > start:
+                segment_starts.append(start)
 
-        if not aggregated_vectors:
+        if not segment_starts:
             return None
 
-        return self._average_vectors(aggregated_vectors)
+        return self._average_vectors(self._segment_means(flat_vectors, segment_starts))
 
     @staticmethod
-    def _average_vectors(vectors: List[List[float]]) -> Optional[List[float]]:
-        if not vectors:
-            return None
-        import numpy as np
+    def _segment_means(vectors: List[List[float]], segment_starts: List[int]) -> np.ndarray:
+        """
+        연속 구간별 평균 벡터 계산
+
+        Args:
+            vectors: 구간 순서대로 이어 붙인 벡터 리스트
+            segment_starts: 각 구간의 시작 인덱스 (오름차순)
 
-        array = np.array(vectors, dtype=float)
+        Returns:
+            (구간 수, D) float32 배열
+        """
+        array = np.asarray(vectors, dtype=np.float32)
+        starts = np.asarray(segment_starts, dtype=np.intp)
+        counts = np.diff(np.append(starts, len(array)))
+        return np.add.reduceat(array, starts, axis=0) / counts[:, None]
+
+    @staticmethod
+    def _average_vectors(vectors: List[List[float]]) -> Optional[np.ndarray]:
+        if len(vectors) == 0:
+            return None
+        array = np.asarray(vectors, dtype=np.float32)
         if array.size == 0:
             return None
-        mean_vector = array.mean(axis=0)
-        return mean_vector.tolist()
+        return array.mean(axis=0, dtype=np.float32)
 
     @staticmethod
     def _safe_int(value: Any) -> Optional[int]:
@@ -439,37 +699,16 @@ class ClassificationAgent:
             for art in key_articles
         ])
 
-        scores_text = "\n".join([
-            f"- {self.CONTRACT_TYPES[t]}: {score:.3f}"
-            for t, score in sorted(similarity_scores.items(), key=lambda x: x[1], reverse=True)
-        ])
-
         # 파일명 정보 추가
         filename_info = f"\n업로드된 파일명: {filename}\n" if filename else ""
 
-        prompt = f"""다음은 사용자가 업로드한 계약서의 주요 조항입니다:{filename_info}
-
-{articles_text}
-
-5종 데이터 표준계약서와의 유사도 점수:
-{scores_text}
-
-위 정보를 바탕으로 이 계약서가 어떤 유형인지 판단해주세요.
-
-가능한 유형:
-1. provide: 데이터 제공 계약 (데이터 제공자 → 이용자)
-2. create: 데이터 생성 계약 (데이터 생성 위탁)
-3. process: 데이터 가공 계약 (데이터 가공 위탁)
-4. brokerage_provider: 데이터 중개 계약 (제공자용)
-5. brokerage_user: 데이터 중개 계약 (이용자용)
-
-**출력 형식** (반드시 JSON만 출력):
-{{
-  "type": "[provide|create|process|brokerage_provider|brokerage_user]",
-  "confidence": [0.0-1.0 사이의 숫자],
-  "reason": "[간단한 판단 근거]"
-}}
-"""
+        prompt = "".join([
+            f"다음은 사용자가 업로드한 계약서의 주요 조항입니다:{filename_info}\n\n",
+            articles_text,
+            "\n\n5종 데이터 표준계약서와의 유사도 점수:\n",
+            self._format_scores_text(similarity_scores),
+            self.LEGACY_PROMPT_FOOTER
+        ])
 
         try:
             response = self.client.chat.completions.create(
@@ -496,52 +735,7 @@ class ClassificationAgent:
                 )
 
             answer = response.choices[0].message.content.strip()
-
-            # JSON 파싱 시도
-            try:
-                import json
-                result = json.loads(answer)
-                predicted_type = result.get("type")
-                confidence = float(result.get("confidence", 0.5))
-                reasoning = result.get("reason", "")
-
-                # 유효성 검증
-                if predicted_type not in self.CONTRACT_TYPES:
-                    raise ValueError(f"Invalid type: {predicted_type}")
-
-                return predicted_type, confidence, reasoning
-
-            except (json.JSONDecodeError, ValueError, KeyError) as parse_error:
-                logger.warning(f"JSON 파싱 실패, 텍스트 파싱 폴백: {parse_error}")
-
-                # 폴백: 텍스트 파싱
-                predicted_type = None
-                confidence = 0.5
-                reasoning = answer
-
-                for line in answer.split("\n"):
-                    if "type" in line.lower() and ":" in line:
-                        type_text = line.split(":", 1)[1].strip().strip('"').strip("'")
-                        for t in self.CONTRACT_TYPES.keys():
-                            if t in type_text:
-                                predicted_type = t
-                                break
-                    elif "confidence" in line.lower() and ":" in line:
-                        try:
-                            conf_text = line.split(":", 1)[1].strip()
-                            confidence = float(conf_text.split()[0].strip(','))
-                        except:
-                            pass
-                    elif "reason" in line.lower() and ":" in line:
-                        reasoning = line.split(":", 1)[1].strip()
-
-                # 파싱 실패 시 유사도 기반
-                if not predicted_type:
-                    predicted_type = max(similarity_scores.items(), key=lambda x: x[1])[0]
-                    confidence = max(similarity_scores.values())
-                    reasoning = f"LLM 파싱 실패. 최고 유사도 기반 분류."
-
-                return predicted_type, confidence, reasoning
+            return self._parse_classification_answer(answer, similarity_scores)
 
         except Exception as e:
             logger.error(f"LLM 분류 실패: {e}")
@@ -551,15 +745,47 @@ class ClassificationAgent:
             reasoning = f"LLM 호출 실패. 유사도 기반 분류."
             return predicted_type, confidence, reasoning
 
-    def _get_embedding(self, text: str, contract_id: str = None) -> List[float]:
-        """텍스트 임베딩 생성 (EmbeddingService 사용)"""
-        from backend.shared.services import get_embedding_service
+    def _get_live_query_embedding(
+        self,
+        article_texts: List[str],
+        contract_id: str = None
+    ) -> np.ndarray:
+        """
+        조항 텍스트 임베딩 평균 (EmbeddingService 배치 호출 1회)
+
+        각 텍스트는 임베딩 모델 입력 한도로 자르고, 텍스트 목록의 해시로 Redis를 먼저
+        조회하여 재처리 시 다른 워커 프로세스에서도 임베딩 API 호출을 건너뜁니다.
+        """
+        article_texts = [_truncate_to_embedding_limit(text) for text in article_texts]
+        redis_client = _get_redis_client() if EMBEDDING_CACHE_ENABLED else None
+        redis_key = None
+
+        if redis_client is not None:
+            text_hash = hashlib.sha256("\x1e".join(article_texts).encode("utf-8")).hexdigest()
+            redis_key = f"emb:{self.embedding_model}:{text_hash}"
+            try:
+                cached = redis_client.get(redis_key)
+                if cached:
+                    return np.frombuffer(cached, dtype=np.float32).copy()
+            except Exception as e:
+                logger.warning(f"임베딩 캐시 조회 실패 (Redis): {e}")
 
-        return get_embedding_service().get_embedding(
-            text=text,
+        vectors = get_embedding_service().get_embeddings_batch(
+            texts=article_texts,
             contract_id=contract_id,
-            component="classification_agent"
+            component="classification_agent",
+            batch_size=len(article_texts),
+            purpose="classification_query"
         )
+        embedding = np.asarray(vectors, dtype=np.float32).mean(axis=0, dtype=np.float32)
+
+        if redis_key is not None:
+            try:
+                redis_client.setex(redis_key, EMBEDDING_CACHE_TTL, embedding.tobytes())
+            except Exception as e:
+                logger.warning(f"임베딩 캐시 저장 실패 (Redis): {e}")
+
+        return embedding
 
     def _log_token_usage(
         self,
@@ -571,62 +797,18 @@ class ClassificationAgent:
         total_tokens: int,
         extra_info: dict = None
     ):
-        """토큰 사용량을 DB에 저장 (재시도 로직 포함)"""
-        import time
-        from sqlalchemy.exc import OperationalError
-
-        max_retries = 3
-        retry_delay = 0.1  # 100ms
-
-        for attempt in range(max_retries):
-            db = None
-            try:
-                db = SessionLocal()
-                token_usage = TokenUsage(
-                    contract_id=contract_id,
-                    component="classification_agent",
-                    api_type=api_type,
-                    model=model,
-                    prompt_tokens=prompt_tokens,
-                    completion_tokens=completion_tokens,
-                    total_tokens=total_tokens,
-                    extra_info=extra_info
-                )
-                db.add(token_usage)
-                db.commit()
-                logger.info(f"토큰 사용량 로깅: {api_type} - {total_tokens} tokens")
-                return  # 성공 시 즉시 반환
-            except OperationalError as exc:
-                if "database is locked" in str(exc) and attempt < max_retries - 1:
-                    logger.warning(
-                        f"[ClassificationAgent] DB 잠금 감지, 재시도 {attempt + 1}/{max_retries} "
-                        f"(contract_id={contract_id})"
-                    )
-                    time.sleep(retry_delay * (attempt + 1))  # 지수 백오프
-                    if db:
-                        try:
-                            db.rollback()
-                        except:
-                            pass
-                else:
-                    logger.error(f"토큰 사용량 로깅 실패 (최종): {exc}")
-                    if db:
-                        try:
-                            db.rollback()
-                        except:
-                            pass
-                    raise
-            except Exception as e:
-                logger.error(f"토큰 사용량 로깅 실패: {e}")
-                if db:
-                    try:
-                        db.rollback()
-                    except:
-                        pass
-                break
-            finally:
-                if db:
-                    db.close()
+        """토큰 사용량 기록 (TokenUsageBatcher가 백그라운드에서 일괄 저장)"""
+        get_token_usage_batcher().put({
+            "contract_id": contract_id,
+            "component": "classification_agent",
+            "api_type": api_type,
+            "model": model,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": total_tokens,
+            "extra_info": extra_info
+        })
+        logger.info(f"토큰 사용량 로깅: {api_type} - {total_tokens} tokens")
 
     def _classify_with_gating(
         self,
@@ -638,8 +820,8 @@ class ClassificationAgent:
         """
         Hybrid Gating을 통한 분류
 
-        1위-2위 점수 차이가 충분히 크면 임베딩 결과 사용 (LLM 스킵)
-        차이가 작으면 LLM Few-shot 분류 수행
+        1위-2위 점수 차이가 충분히 크거나 1위 점수 자체가 충분히 높으면
+        임베딩 결과 사용 (LLM 스킵), 그 외에는 LLM Few-shot 분류 수행
 
         Args:
             key_articles: 주요 조항 리스트
@@ -650,6 +832,33 @@ class ClassificationAgent:
         Returns:
             분류 결과 딕셔너리
         """
+        embedding_result, score_gap = self._embedding_gate(similarity_scores, contract_id)
+        if embedding_result is not None:
+            return embedding_result
+
+        # 애매함 → LLM Few-shot 호출
+        logger.info(f"⚠ LLM 정밀 분류 필요 (유사도 점수 차이 0.05 미만)")
+        predicted_type, confidence, reasoning = self._llm_classify_with_fewshot(
+            key_articles,
+            similarity_scores,
+            contract_id,
+            filename
+        )
+        return self._build_llm_result(
+            contract_id, predicted_type, confidence, reasoning, similarity_scores, score_gap
+        )
+
+    def _embedding_gate(
+        self,
+        similarity_scores: Dict[str, float],
+        contract_id: str
+    ) -> Tuple[Optional[Dict[str, Any]], float]:
+        """
+        임베딩 결과만으로 결정 가능한지 판단
+
+        Returns:
+            (임베딩 기반 분류 결과 또는 None, 1위-2위 점수 차이)
+        """
         # 1위와 2위 점수 차이 계산
         sorted_scores = sorted(similarity_scores.items(), key=lambda x: x[1], reverse=True)
         top1_type, top1_score = sorted_scores[0]
@@ -657,38 +866,48 @@ class ClassificationAgent:
 
         score_gap = top1_score - top2_score
 
+        if not EMBEDDING_GATE_ENABLED:
+            return None, score_gap
+
         # Gating 임계값 확인
         if score_gap >= self.SCORE_GAP_THRESHOLD:
-            # 명확함 → 임베딩 결과 사용 (LLM 호출 없음)
-            logger.info(f"✓ 임베딩 기반 결정 (gap={score_gap:.3f}, top1={top1_type}:{top1_score:.3f})")
-            return {
-                "contract_id": contract_id,
-                "predicted_type": top1_type,
-                "confidence": top1_score,
-                "scores": similarity_scores,
-                "reasoning": f"임베딩 유사도 차이가 충분함 (gap={score_gap:.3f})",
-                "classification_method": "embedding",
-                "score_gap": score_gap
-            }
+            reasoning = f"임베딩 유사도 차이가 충분함 (gap={score_gap:.3f})"
+        elif top1_score >= self.TOP1_SCORE_THRESHOLD:
+            reasoning = f"최고 임베딩 유사도가 충분히 높음 (top1={top1_score:.3f})"
         else:
-            # 애매함 → LLM Few-shot 호출
-            # logger.info(f"⚠ LLM 정밀 분류 필요 (gap={score_gap:.3f}, top1={top1_type}:{top1_score:.3f}, top2={top2_type}:{top2_score:.3f})")
-            logger.info(f"⚠ LLM 정밀 분류 필요 (유사도 점수 차이 0.05 미만)")
-            predicted_type, confidence, reasoning = self._llm_classify_with_fewshot(
-                key_articles,
-                similarity_scores,
-                contract_id,
-                filename
-            )
-            return {
-                "contract_id": contract_id,
-                "predicted_type": predicted_type,
-                "confidence": confidence,
-                "scores": similarity_scores,
-                "reasoning": reasoning,
-                "classification_method": "llm_fewshot",
-                "score_gap": score_gap
-            }
+            return None, score_gap
+
+        # 명확함 → 임베딩 결과 사용 (LLM 호출 없음)
+        logger.info(f"✓ 임베딩 기반 결정 (gap={score_gap:.3f}, top1={top1_type}:{top1_score:.3f})")
+        return {
+            "contract_id": contract_id,
+            "predicted_type": top1_type,
+            "confidence": top1_score,
+            "scores": similarity_scores,
+            "reasoning": reasoning,
+            "classification_method": "embedding",
+            "score_gap": score_gap
+        }, score_gap
+
+    @staticmethod
+    def _build_llm_result(
+        contract_id: str,
+        predicted_type: str,
+        confidence: float,
+        reasoning: str,
+        similarity_scores: Dict[str, float],
+        score_gap: float
+    ) -> Dict[str, Any]:
+        """LLM Few-shot 분류 결과 딕셔너리 구성"""
+        return {
+            "contract_id": contract_id,
+            "predicted_type": predicted_type,
+            "confidence": confidence,
+            "scores": similarity_scores,
+            "reasoning": reasoning,
+            "classification_method": "llm_fewshot",
+            "score_gap": score_gap
+        }
 
     def _llm_classify_with_fewshot(
         self,
@@ -710,66 +929,16 @@ class ClassificationAgent:
             (predicted_type, confidence, reasoning) 튜플
         """
         try:
-            # 조항 텍스트 구성
-            articles_text = ""
-            for i, art in enumerate(key_articles, 1):
-                title = art.get("title", "")
-                text = art.get("text", "")
-                content_preview = art.get("content", [""])[0] if art.get("content") else ""
-
-                articles_text += f"[조항 {i}] 제목: {title}\n"
-                if text:
-                    articles_text += f"  조문: {text}\n"
-                if content_preview:
-                    preview = content_preview[:200] + "..." if len(content_preview) > 200 else content_preview
-                    articles_text += f"  내용: {preview}\n"
-                articles_text += "\n"
-
-            # 유사도 점수 텍스트
-            scores_text = "\n".join([
-                f"- {self.CONTRACT_TYPES[t]}: {score:.3f}"
-                for t, score in sorted(similarity_scores.items(), key=lambda x: x[1], reverse=True)
-            ])
-
-            # 파일명 정보
-            filename_info = f" (파일명: {filename})" if filename else ""
-
-            # Few-shot 프롬프트 구성
-            prompt = f"""당신은 데이터 계약서 분류 전문가입니다.
-
-다음은 5가지 데이터 계약 유형의 특징과 출력 예시입니다:
-
-{self.FEWSHOT_EXAMPLES}
-
----
-
-이제 사용자가 업로드한 계약서의 주요 내용을 분석해주세요:{filename_info}
-
-{articles_text}
-
-임베딩 유사도 점수 (참고용):
-{scores_text}
-
-**분석 지침**:
-1. 역할 구조 파악 (누가 누구에게 무엇을 제공/위탁/중개하는가)
-2. 핵심 패턴 찾기 (제공, 생성, 가공, 중개 관련 키워드)
-3. 데이터 흐름 확인 (단방향/양방향, 창출 여부)
-
-**출력 형식** (반드시 JSON만 출력):
-{{
-  "type": "[provide|create|process|brokerage_provider|brokerage_user]",
-  "confidence": [0.0-1.0 사이의 숫자],
-  "reason": "[역할 구조와 핵심 패턴 기반 판단 근거]"
-}}
-"""
+            messages = self._build_fewshot_messages(key_articles, similarity_scores, filename)
+            cache_key = self._classification_cache_key(messages)
+            cached = self._get_cached_classification(cache_key)
+            if cached:
+                return cached
 
             # LLM 호출 (JSON 모드)
             response = self.client.chat.completions.create(
                 model=self.chat_model,
-                messages=[
-                    {"role": "system", "content": "당신은 데이터 계약서 분류 전문가입니다."},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=messages,
                 temperature=0.2,
                 max_tokens=600,
                 response_format={"type": "json_object"}  # JSON 강제
@@ -786,77 +955,327 @@ class ClassificationAgent:
                 extra_info={"purpose": "classification_fewshot"}
             )
 
-            # 응답 파싱 (JSON 우선)
-            answer = response.choices[0].message.content.strip()
+            parsed = self._try_parse_classification_answer(response.choices[0].message.content.strip())
+            if parsed is None:
+                # 파싱 실패 폴백은 LLM 판단이 아니므로 캐시하지 않음 (재시도 시 LLM 재호출)
+                return self._similarity_fallback(similarity_scores, "LLM 파싱 실패. 최고 유사도 기반 분류.")
+            self._store_cached_classification(cache_key, parsed)
+            return parsed
 
-            try:
-                import json
-                result = json.loads(answer)
-                predicted_type = result.get("type")
-                confidence = float(result.get("confidence", 0.5))
-                reasoning = result.get("reason", "")
+        except Exception as e:
+            logger.error(f"LLM Few-shot 분류 실패: {e}")
+            # Fallback: 유사도 기반
+            predicted_type = max(similarity_scores.items(), key=lambda x: x[1])[0]
+            confidence = max(similarity_scores.values())
+            reasoning = f"LLM 호출 실패. 유사도 기반 분류."
+            return predicted_type, confidence, reasoning
 
-                # 유효성 검증
-                if predicted_type not in self.CONTRACT_TYPES:
-                    raise ValueError(f"Invalid type: {predicted_type}")
+    async def _llm_classify_with_fewshot_async(
+        self,
+        key_articles: List[Dict[str, str]],
+        similarity_scores: Dict[str, float],
+        contract_id: str,
+        filename: str = None
+    ) -> Tuple[str, float, str]:
+        """
+        _llm_classify_with_fewshot의 비동기 버전
+        """
+        try:
+            messages = self._build_fewshot_messages(key_articles, similarity_scores, filename)
+            cache_key = self._classification_cache_key(messages)
+            cached = await asyncio.to_thread(self._get_cached_classification, cache_key)
+            if cached:
+                return cached
 
-                return predicted_type, confidence, reasoning
+            response = await self.async_client.chat.completions.create(
+                model=self.chat_model,
+                messages=messages,
+                temperature=0.2,
+                max_tokens=600,
+                response_format={"type": "json_object"}
+            )
 
-            except (json.JSONDecodeError, ValueError, KeyError) as parse_error:
-                logger.warning(f"JSON 파싱 실패, 텍스트 파싱 시도: {parse_error}")
+            self._log_token_usage(
+                contract_id=contract_id,
+                api_type="chat_completion",
+                model=self.chat_model,
+                prompt_tokens=response.usage.prompt_tokens,
+                completion_tokens=response.usage.completion_tokens,
+                total_tokens=response.usage.total_tokens,
+                extra_info={"purpose": "classification_fewshot"}
+            )
 
-                # 폴백: 텍스트 파싱
-                predicted_type = None
-                confidence = 0.5
-                reasoning = answer
-
-                for line in answer.split("\n"):
-                    if "type" in line.lower() and ":" in line:
-                        type_text = line.split(":", 1)[1].strip().strip('"').strip("'")
-                        for t in self.CONTRACT_TYPES.keys():
-                            if t in type_text:
-                                predicted_type = t
-                                break
-                    elif "confidence" in line.lower() and ":" in line:
-                        try:
-                            conf_text = line.split(":", 1)[1].strip()
-                            confidence = float(conf_text.split()[0].strip(','))
-                        except:
-                            pass
-                    elif "reason" in line.lower() and ":" in line:
-                        reasoning = line.split(":", 1)[1].strip()
-
-                # 파싱 실패 시 폴백
-                if not predicted_type:
-                    predicted_type = max(similarity_scores.items(), key=lambda x: x[1])[0]
-                    confidence = max(similarity_scores.values())
-                    reasoning = f"LLM 파싱 실패. 최고 유사도 기반 분류."
-
-                return predicted_type, confidence, reasoning
+            parsed = self._try_parse_classification_answer(response.choices[0].message.content.strip())
+            if parsed is None:
+                # 파싱 실패 폴백은 LLM 판단이 아니므로 캐시하지 않음 (재시도 시 LLM 재호출)
+                return self._similarity_fallback(similarity_scores, "LLM 파싱 실패. 최고 유사도 기반 분류.")
+            await asyncio.to_thread(self._store_cached_classification, cache_key, parsed)
+            return parsed
 
         except Exception as e:
             logger.error(f"LLM Few-shot 분류 실패: {e}")
-            # Fallback: 유사도 기반
             predicted_type = max(similarity_scores.items(), key=lambda x: x[1])[0]
             confidence = max(similarity_scores.values())
             reasoning = f"LLM 호출 실패. 유사도 기반 분류."
             return predicted_type, confidence, reasoning
 
-    def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
-        """코사인 유사도 계산"""
-        import numpy as np
+    def _build_fewshot_messages(
+        self,
+        key_articles: List[Dict[str, str]],
+        similarity_scores: Dict[str, float],
+        filename: str = None
+    ) -> List[Dict[str, str]]:
+        """Few-shot 분류 프롬프트 메시지 구성"""
+        # 조항 텍스트 구성 (조항당 제목+조문+내용 합계 _MAX_ARTICLE_CHARS자 이내, 공백 정규화)
+        articles_text = ""
+        article_index = 0
+        for art in key_articles:
+            budget = _MAX_ARTICLE_CHARS
+            title = _truncate(art.get("title", ""), budget)
+            budget -= len(title)
+            text = _truncate(art.get("text", ""), budget)
+            budget -= len(text)
+            content_preview = _truncate(art.get("content", ""), budget)
+
+            if not (title or text or content_preview):
+                continue
+
+            article_index += 1
+            articles_text += f"[조항 {article_index}] 제목: {title}\n"
+            if text:
+                articles_text += f"  조문: {text}\n"
+            if content_preview:
+                articles_text += f"  내용: {content_preview}\n"
+            articles_text += "\n"
+
+        # 유사도 점수 텍스트
+        scores_text = self._format_scores_text(similarity_scores)
+
+        # 파일명 정보
+        filename_info = f" (파일명: {filename})" if filename else ""
+
+        # 가변 입력만 user 메시지로 구성 (few-shot 예시와 지침은 system 메시지)
+        prompt = f"""사용자가 업로드한 계약서의 주요 내용을 분석해주세요:{filename_info}
+
+{articles_text}
 
-        vec1 = np.array(vec1)
-        vec2 = np.array(vec2)
+임베딩 유사도 점수 (참고용):
+{scores_text}
+"""
 
-        dot_product = np.dot(vec1, vec2)
-        norm1 = np.linalg.norm(vec1)
-        norm2 = np.linalg.norm(vec2)
+        return [
+            {"role": "system", "content": self.FEWSHOT_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
 
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
+    def _format_scores_text(self, similarity_scores: Dict[str, float]) -> str:
+        """유사도 점수 내림차순 목록 텍스트 (유형별 템플릿 사용)"""
+        return "\n".join([
+            self.SCORE_LINE_TEMPLATES[t].format(score=score)
+            for t, score in sorted(similarity_scores.items(), key=lambda x: x[1], reverse=True)
+        ])
 
-        return float(dot_product / (norm1 * norm2))
+    def _classification_cache_key(self, messages: List[Dict[str, str]]) -> str:
+        """
+        분류 캐시 키 생성
+
+        메시지에는 조항 텍스트, 소수점 3자리로 반올림된 유사도 점수, 파일명이
+        모두 포함되므로 모델명과 함께 해시하면 동일 입력 재분류를 식별할 수 있습니다.
+        """
+        payload = "\n".join([self.chat_model] + [message["content"] for message in messages])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _get_cached_classification(self, cache_key: str) -> Optional[Tuple[str, float, str]]:
+        """
+        캐시된 LLM 분류 결과 조회 (Redis → DB 순, 실패 시 None)
+
+        DB에서 찾은 결과는 Redis에도 채워 다음 조회를 빠르게 합니다.
+        DB 항목도 Redis와 같이 LLM_CACHE_TTL이 지나면 사용하지 않습니다.
+        """
+        if not LLM_CACHE_ENABLED:
+            return None
+
+        redis_key = f"llm_cache:{self.chat_model}:{cache_key}"
+        redis_client = _get_redis_client()
+        if redis_client is not None:
+            try:
+                cached = redis_client.get(redis_key)
+                if cached:
+                    predicted_type, confidence, reasoning = _json_loads(cached)
+                    if predicted_type in self.CONTRACT_TYPES:
+                        logger.info(f"분류 캐시 히트 (Redis): {cache_key[:12]}")
+                        return predicted_type, confidence, reasoning
+            except Exception as e:
+                logger.warning(f"분류 캐시 조회 실패 (Redis): {e}")
+
+        db = SessionLocal()
+        try:
+            entry = db.query(ClassificationCache).filter(
+                ClassificationCache.contract_hash == cache_key,
+                ClassificationCache.created_at >= datetime.utcnow() - timedelta(seconds=LLM_CACHE_TTL)
+            ).first()
+            if entry is None or entry.predicted_type not in self.CONTRACT_TYPES:
+                return None
+            logger.info(f"분류 캐시 히트: {cache_key[:12]}")
+            parsed = (entry.predicted_type, entry.confidence, entry.reason or "")
+        except Exception as e:
+            logger.warning(f"분류 캐시 조회 실패: {e}")
+            return None
+        finally:
+            db.close()
+
+        self._set_redis_cached_classification(redis_key, parsed)
+        return parsed
+
+    def _store_cached_classification(self, cache_key: str, parsed: Tuple[str, float, str]):
+        """LLM 분류 결과 캐시 저장 (Redis + DB, 실패해도 분류는 계속 진행)"""
+        if not LLM_CACHE_ENABLED:
+            return
+
+        self._set_redis_cached_classification(f"llm_cache:{self.chat_model}:{cache_key}", parsed)
+
+        predicted_type, confidence, reasoning = parsed
+        db = SessionLocal()
+        try:
+            db.merge(ClassificationCache(
+                contract_hash=cache_key,
+                predicted_type=predicted_type,
+                confidence=confidence,
+                reason=reasoning,
+                created_at=datetime.utcnow()  # merge로 갱신할 때도 TTL 기준 시각을 새로 기록
+            ))
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"분류 캐시 저장 실패: {e}")
+        finally:
+            db.close()
+
+    @staticmethod
+    def _set_redis_cached_classification(redis_key: str, parsed: Tuple[str, float, str]):
+        redis_client = _get_redis_client()
+        if redis_client is None:
+            return
+        try:
+            redis_client.setex(redis_key, LLM_CACHE_TTL, json.dumps(list(parsed), ensure_ascii=False))
+        except Exception as e:
+            logger.warning(f"분류 캐시 저장 실패 (Redis): {e}")
+
+    def _parse_classification_answer(
+        self,
+        answer: str,
+        similarity_scores: Dict[str, float]
+    ) -> Tuple[str, float, str]:
+        """LLM 분류 응답 파싱 (JSON 우선, 정규식 폴백, 유형을 찾지 못하면 최고 유사도 유형)"""
+        parsed = self._try_parse_classification_answer(answer)
+        if parsed is None:
+            return self._similarity_fallback(similarity_scores, "LLM 파싱 실패. 최고 유사도 기반 분류.")
+        return parsed
+
+    def _try_parse_classification_answer(self, answer: str) -> Optional[Tuple[str, float, str]]:
+        """
+        LLM 분류 응답 파싱 (JSON 우선, 정규식 폴백)
+
+        Returns:
+            (유형, 신뢰도, 근거), 응답에서 유효한 유형을 찾지 못하면 None
+        """
+        try:
+            result = _json_loads(answer)
+            predicted_type = result.get("type")
+            confidence = float(result.get("confidence", 0.5))
+            reasoning = result.get("reason", "")
+
+            # 유효성 검증
+            if predicted_type not in self.CONTRACT_TYPES:
+                raise ValueError(f"Invalid type: {predicted_type}")
+
+            return predicted_type, confidence, reasoning
+
+        except (json.JSONDecodeError, ValueError, KeyError) as parse_error:
+            logger.warning(f"JSON 파싱 실패, 텍스트 파싱 시도: {parse_error}")
+
+            # 폴백: 정규식 파싱
+            type_match = _ANSWER_TYPE_PATTERN.search(answer)
+            predicted_type = type_match.group(1) if type_match and type_match.group(1) in self.CONTRACT_TYPES else None
+            if not predicted_type:
+                return None
+
+            confidence_match = _ANSWER_CONFIDENCE_PATTERN.search(answer)
+            try:
+                confidence = float(confidence_match.group(1)) if confidence_match else 0.5
+            except ValueError:
+                confidence = 0.5
+
+            reason_match = _ANSWER_REASON_PATTERN.search(answer)
+            reasoning = reason_match.group(1).strip() if reason_match else answer
+
+            return predicted_type, confidence, reasoning
+
+    @staticmethod
+    def _similarity_fallback(similarity_scores: Dict[str, float], reasoning: str) -> Tuple[str, float, str]:
+        """최고 유사도 유형으로 분류 (LLM 결과를 사용할 수 없을 때)"""
+        predicted_type = max(similarity_scores.items(), key=lambda x: x[1])[0]
+        return predicted_type, max(similarity_scores.values()), reasoning
+
+
+def _save_classification_result(db, contract: ContractDocument, result: Dict[str, Any]):
+    """분류 결과 저장 및 계약서 상태 갱신 (commit은 호출자가 수행)"""
+    classification = ClassificationResult(
+        contract_id=contract.contract_id,
+        predicted_type=result["predicted_type"],
+        confidence=result["confidence"],
+        scores=result["scores"],
+        reasoning=result["reasoning"],
+        confirmed_type=result["predicted_type"]
+    )
+    db.add(classification)
+
+    # 계약서 상태 업데이트
+    contract.status = "classified"
+
+
+_classification_agent = None
+
+
+def get_classification_agent() -> ClassificationAgent:
+    """
+    ClassificationAgent 싱글톤 인스턴스 반환 (워커 프로세스 단위)
+
+    Azure 클라이언트의 HTTP 연결 풀과 EmbeddingLoader를 태스크 간에 재사용합니다.
+
+    Returns:
+        ClassificationAgent 인스턴스
+    """
+    global _classification_agent
+    if _classification_agent is None:
+        _classification_agent = ClassificationAgent()
+    return _classification_agent
+
+
+@worker_process_init.connect
+def preload_classification_matrix(**kwargs):
+    """
+    워커 프로세스 시작 시 분류용 임베딩 행렬 미리 생성
+
+    프로세스 단위 지식베이스 로더 싱글톤에 캐시되므로 이후 분류 태스크는
+    청크 JSON 파싱과 리스트→ndarray 변환 없이 바로 행렬을 사용합니다.
+    분류 워커에서만 로드합니다.
+    """
+    if not worker_consumes("classification"):
+        return
+    try:
+        kb_loader = get_knowledge_base_loader()
+        contract_types = tuple(ClassificationAgent.CONTRACT_TYPES.keys())
+        chunks_per_type = ClassificationAgent.SIMILARITY_CHUNKS_PER_TYPE
+        kb_loader.load_similarity_centroids(contract_types, max_chunks_per_type=chunks_per_type)
+    except Exception as e:
+        logger.warning(f"분류용 임베딩 행렬 사전 로드 실패 (첫 분류 시 생성): {e}")
+
+
+@worker_process_shutdown.connect
+def flush_token_usage(**kwargs):
+    """워커 프로세스 종료 전 대기 중인 토큰 사용량 기록 저장"""
+    get_token_usage_batcher().flush()
 
 
 # Celery Task 정의
@@ -887,8 +1306,7 @@ def classify_contract_task(contract_id: str):
             raise ValueError(f"파싱된 데이터가 없습니다: {contract_id}")
 
         # Classification Agent 실행
-        agent = ClassificationAgent()
-        from backend.shared.services import get_knowledge_base_loader
+        agent = get_classification_agent()
         kb_loader = get_knowledge_base_loader()
 
         result = agent.classify(
@@ -899,18 +1317,7 @@ def classify_contract_task(contract_id: str):
         )
 
         # 분류 결과 DB 저장
-        classification = ClassificationResult(
-            contract_id=contract_id,
-            predicted_type=result["predicted_type"],
-            confidence=result["confidence"],
-            scores=result["scores"],
-            reasoning=result["reasoning"],
-            confirmed_type=result["predicted_type"]
-        )
-        db.add(classification)
-
-        # 계약서 상태 업데이트
-        contract.status = "classified"
+        _save_classification_result(db, contract, result)
         db.commit()
 
         logger.info(f"[Celery Task] 분류 완료 및 저장: {contract_id}")
@@ -938,3 +1345,283 @@ def classify_contract_task(contract_id: str):
 
     finally:
         db.close()
+
+
+_event_loop = None
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    워커 프로세스 단위 이벤트 루프 반환
+
+    재사용되는 ClassificationAgent의 AsyncAzureOpenAI 연결 풀은 생성된 루프에 묶이므로
+    태스크마다 asyncio.run()으로 새 루프를 만들지 않고 같은 루프를 계속 사용합니다.
+    """
+    global _event_loop
+    if _event_loop is None or _event_loop.is_closed():
+        _event_loop = asyncio.new_event_loop()
+    return _event_loop
+
+
+@celery_app.task(name="classification.classify_contracts_batch", queue="classification")
+def classify_contracts_batch_task(contract_ids: List[str], max_concurrency: int = 10):
+    """
+    Celery Task: 여러 계약서 동시 분류 (일괄 업로드용)
+
+    LLM 호출을 AsyncAzureOpenAI로 동시에 수행하여 처리 시간이 계약서 수가 아닌
+    동시 호출 상한에 비례하도록 합니다. 개별 실패는 해당 계약서만 오류 상태로 둡니다.
+
+    Args:
+        contract_ids: 분류할 계약서 ID 리스트
+        max_concurrency: 동시 LLM 호출 상한
+
+    Returns:
+        {"classified": [contract_id, ...], "failed": [contract_id, ...]}
+    """
+    db = SessionLocal()
+    try:
+        contracts = db.query(ContractDocument).filter(
+            ContractDocument.contract_id.in_(contract_ids)
+        ).all()
+        targets = [contract for contract in contracts if contract.parsed_data]
+        target_ids = {contract.contract_id for contract in targets}
+        failed = [contract_id for contract_id in contract_ids if contract_id not in target_ids]
+        logger.info(f"[Celery Task] 일괄 분류 시작: {len(targets)}건 (대상 아님 {len(failed)}건)")
+
+        agent = get_classification_agent()
+        results = _get_event_loop().run_until_complete(
+            agent.classify_batch(
+                [
+                    {
+                        "contract_id": contract.contract_id,
+                        "parsed_data": contract.parsed_data,
+                        "filename": contract.filename
+                    }
+                    for contract in targets
+                ],
+                get_knowledge_base_loader(),
+                max_concurrency=max_concurrency
+            )
+        )
+
+        classified = []
+        for contract, result in zip(targets, results):
+            if isinstance(result, Exception):
+                contract.status = "classification_error"
+                failed.append(contract.contract_id)
+            else:
+                _save_classification_result(db, contract, result)
+                classified.append(contract.contract_id)
+        db.commit()
+
+        logger.info(f"[Celery Task] 일괄 분류 완료: 성공 {len(classified)}건, 실패 {len(failed)}건")
+        return {"classified": classified, "failed": failed}
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"[Celery Task] 일괄 분류 실패: {e}")
+        raise
+
+    finally:
+        db.close()
+
+
+# Batch API 설정 (재처리/백필 등 비대화형 대량 분류용)
+BATCH_API_VERSION = os.getenv("AZURE_OPENAI_BATCH_API_VERSION", "2024-10-21")
+BATCH_POLL_INTERVAL = int(os.getenv("CLASSIFICATION_BATCH_POLL_INTERVAL", "300"))  # 초
+
+
+def _create_batch_client() -> AzureOpenAI:
+    """Batch API 지원 버전의 Azure 클라이언트 생성"""
+    return AzureOpenAI(
+        api_key=os.getenv("AZURE_OPENAI_API_KEY"),
+        api_version=BATCH_API_VERSION,
+        azure_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT")
+    )
+
+
+@celery_app.task(name="classification.submit_classification_batch", queue="classification")
+def submit_classification_batch_task(contract_ids: List[str]):
+    """
+    Celery Task: Azure OpenAI Batch API로 대량 분류 제출
+
+    임베딩 게이팅으로 결정되는 계약서는 즉시 저장하고, LLM 판단이 필요한
+    계약서만 JSONL로 묶어 Batch 작업으로 제출합니다 (24시간 SLA, 토큰 비용 절반).
+    사용자 업로드 분류는 기존 classify_contract_task를 사용합니다.
+
+    Args:
+        contract_ids: 분류할 계약서 ID 리스트
+
+    Returns:
+        {"batch_id": str | None, "embedding_classified": int, "submitted": int}
+    """
+    agent = get_classification_agent()
+    kb_loader = get_knowledge_base_loader()
+    batch_deployment = os.getenv("AZURE_GPT_BATCH_DEPLOYMENT", agent.chat_model)
+
+    db = SessionLocal()
+    pending: Dict[str, Dict[str, Any]] = {}
+    request_lines: List[str] = []
+    embedding_classified = 0
+
+    try:
+        for contract_id in contract_ids:
+            contract = db.query(ContractDocument).filter(
+                ContractDocument.contract_id == contract_id
+            ).first()
+            if not contract or not contract.parsed_data:
+                logger.warning(f"[Batch] 분류 대상 아님 (계약서/파싱 데이터 없음): {contract_id}")
+                continue
+
+            key_articles = agent._extract_key_articles(contract.parsed_data)
+            similarity_scores = agent._calculate_similarity_scores(
+                key_articles, kb_loader, contract_id, contract.parsed_data
+            )
+
+            result, score_gap = agent._embedding_gate(similarity_scores, contract_id)
+            if result is not None:
+                _save_classification_result(db, contract, result)
+                db.commit()
+                embedding_classified += 1
+                continue
+
+            pending[contract_id] = {"scores": similarity_scores, "score_gap": score_gap}
+            request_lines.append(json.dumps({
+                "custom_id": contract_id,
+                "method": "POST",
+                "url": "/chat/completions",
+                "body": {
+                    "model": batch_deployment,
+                    "messages": agent._build_fewshot_messages(
+                        key_articles, similarity_scores, contract.filename
+                    ),
+                    "temperature": 0.2,
+                    "max_tokens": 600,
+                    "response_format": {"type": "json_object"}
+                }
+            }, ensure_ascii=False))
+
+        if not request_lines:
+            logger.info(f"[Batch] LLM 분류 대상 없음 (임베딩 결정 {embedding_classified}건)")
+            return {"batch_id": None, "embedding_classified": embedding_classified, "submitted": 0}
+
+        client = _create_batch_client()
+        payload = io.BytesIO(("\n".join(request_lines) + "\n").encode("utf-8"))
+        input_file = client.files.create(
+            file=("classification_batch.jsonl", payload),
+            purpose="batch"
+        )
+        batch = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/chat/completions",
+            completion_window="24h"
+        )
+
+        logger.info(f"[Batch] 분류 배치 제출: {batch.id} ({len(request_lines)}건)")
+        poll_classification_batch_task.apply_async(
+            args=[batch.id, pending],
+            countdown=BATCH_POLL_INTERVAL
+        )
+
+        return {
+            "batch_id": batch.id,
+            "embedding_classified": embedding_classified,
+            "submitted": len(request_lines)
+        }
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"[Batch] 분류 배치 제출 실패: {e}")
+        raise
+
+    finally:
+        db.close()
+
+
+@celery_app.task(name="classification.poll_classification_batch", queue="classification")
+def poll_classification_batch_task(batch_id: str, pending: Dict[str, Dict[str, Any]]):
+    """
+    Celery Task: 분류 배치 상태 확인 및 결과 저장
+
+    완료 전이면 BATCH_POLL_INTERVAL 후 다시 예약합니다. 배치가 실패/만료되었거나
+    개별 응답이 없는 계약서는 유사도 기반으로 분류합니다.
+
+    Args:
+        batch_id: Azure Batch 작업 ID
+        pending: {contract_id: {"scores": dict, "score_gap": float}}
+    """
+    client = _create_batch_client()
+    batch = client.batches.retrieve(batch_id)
+
+    if batch.status in ("validating", "in_progress", "finalizing", "cancelling"):
+        logger.info(f"[Batch] 분류 배치 진행 중: {batch_id} ({batch.status})")
+        poll_classification_batch_task.apply_async(
+            args=[batch_id, pending],
+            countdown=BATCH_POLL_INTERVAL
+        )
+        return {"batch_id": batch_id, "status": batch.status}
+
+    answers: Dict[str, Dict[str, Any]] = {}
+    if batch.status == "completed" and batch.output_file_id:
+        output = client.files.content(batch.output_file_id).text
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") == 200:
+                answers[record["custom_id"]] = response["body"]
+    else:
+        logger.error(f"[Batch] 분류 배치 비정상 종료: {batch_id} ({batch.status}), 유사도 기반으로 분류")
+
+    agent = get_classification_agent()
+    db = SessionLocal()
+    saved = 0
+    try:
+        for contract_id, info in pending.items():
+            contract = db.query(ContractDocument).filter(
+                ContractDocument.contract_id == contract_id
+            ).first()
+            if not contract:
+                continue
+
+            similarity_scores = info["scores"]
+            body = answers.get(contract_id)
+            if body:
+                usage = body.get("usage") or {}
+                agent._log_token_usage(
+                    contract_id=contract_id,
+                    api_type="chat_completion",
+                    model=body.get("model", agent.chat_model),
+                    prompt_tokens=usage.get("prompt_tokens", 0),
+                    completion_tokens=usage.get("completion_tokens", 0),
+                    total_tokens=usage.get("total_tokens", 0),
+                    extra_info={"purpose": "classification_fewshot", "batch_id": batch_id}
+                )
+                predicted_type, confidence, reasoning = agent._parse_classification_answer(
+                    body["choices"][0]["message"]["content"].strip(),
+                    similarity_scores
+                )
+            else:
+                predicted_type = max(similarity_scores.items(), key=lambda x: x[1])[0]
+                confidence = max(similarity_scores.values())
+                reasoning = f"LLM 배치 응답 없음. 유사도 기반 분류."
+
+            result = agent._build_llm_result(
+                contract_id, predicted_type, confidence, reasoning,
+                similarity_scores, info["score_gap"]
+            )
+            _save_classification_result(db, contract, result)
+            db.commit()
+            saved += 1
+
+        logger.info(f"[Batch] 분류 배치 결과 저장 완료: {batch_id} ({saved}건)")
+        return {"batch_id": batch_id, "status": batch.status, "saved": saved}
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"[Batch] 분류 배치 결과 저장 실패: {batch_id} - {e}")
+        raise
+
+    finally:
+        db.close()
@@ -5,18 +5,136 @@ A1 Node - Completeness Check (완전성 검증)
 다단계 검증과 LLM 매칭 검증 수행
 """
 
+import asyncio
+import hashlib
+import json
 import logging
+import os
+import re
+import threading
 import time
+from collections import OrderedDict
+from functools import lru_cache
 from datetime import datetime
 from typing import Dict, Any, List, Set, Optional
-from collections import defaultdict
-from openai import AzureOpenAI
+import numpy as np
+from openai import AzureOpenAI, AsyncAzureOpenAI
 
 from .article_matcher import ArticleMatcher
 from .matching_verifier import MatchingVerifier
+from .verification_cache import get_verification_cache, normalize_text
 
 logger = logging.getLogger(__name__)
 
+# 표준 조문 정렬용 조 번호 패턴
+_ARTICLE_NUMBER_PATTERN = re.compile(r'\d+')
+
+# parent_id("제N조")에서 조 번호 추출 (global_id 생성 fallback)
+_KOREAN_ARTICLE_PATTERN = re.compile(r'제(\d+)조')
+
+# LLM 응답의 ```json 코드 블록 추출
+_JSON_BLOCK_PATTERN = re.compile(r'```json\s*(\{.*?\})\s*```', re.DOTALL)
+
+# 사용자 조문 FAISS 인덱스 캐시 (프로세스 단위 LRU, 키: (contract_id, 조문 내용 해시))
+_USER_FAISS_CACHE_MAX_SIZE = int(os.getenv('A1_USER_FAISS_CACHE_SIZE', '32'))
+_user_faiss_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_user_faiss_cache_lock = threading.Lock()
+
+# 표준계약서 조문 목록 캐시 (contract_type → (KnowledgeBaseLoader 청크 리스트, 조문 목록))
+_standard_articles_cache: Dict[str, tuple] = {}
+
+# 조 단위 평균을 계산하는 청크 점수 종류 (_average_chunk_scores 반환 순서)
+_CHUNK_SCORE_KEYS = ('dense_score', 'sparse_score', 'dense_score_raw', 'sparse_score_raw')
+
+
+# 매칭 안된 조항 분류 기준 (단건/일괄 분석 프롬프트 공용)
+_UNMATCHED_CATEGORY_GUIDE = """**분류 기준**:
+
+1. **additional (추가 조항)**: 
+   - 표준계약서에는 없지만 사용자가 의도적으로 추가한 조항
+   - 특수한 요구사항이나 추가 의무사항
+   - 예: "데이터 품질 보증", "정기 보고 의무", "감사 협조", "특수 보안 요구사항"
+   - **판단 기준**: 내용이 계약 이행에 도움이 되는가?
+
+2. **modified (변형 조항)**: 
+   - 표준계약서의 특정 조항과 내용은 유사하지만 제목/구조가 달라서 자동 매칭 실패
+   - 예: 표준 "제3조(데이터 제공 범위 및 방식)" → 사용자 "제3조(제공 데이터의 범위)"
+   - **판단 기준**: 표준 조항의 일부 내용이 누락되었을 가능성이 있는가?
+
+3. **irrelevant (불필요 조항)**: 
+   - 계약 내용과 직접 관련 없는 형식적 요소
+   - 예: 목차, 부록, 서식, 일반적인 법률 조항(관할법원, 준거법)
+   - **판단 기준**: 계약 이행에 실질적 영향이 없는가?
+
+"""
+
+_UNMATCHED_RISK_GUIDE = """**위험도 기준:**
+- **high**: 중요한 표준 조항이 변형되어 필수 내용이 누락되었을 가능성
+- **medium**: 검토가 필요한 추가 조항 또는 변형 조항
+- **low**: 문제없는 추가 조항 또는 불필요한 조항
+
+**중요**: 
+- "additional"은 표준에 없는 **새로운** 내용
+- "modified"는 표준에 있는 조항의 **변형**
+- "irrelevant"는 계약과 **무관**한 내용
+"""
+
+# 매칭 안된 조항 분석 결과 중 캐시에 저장하는 필드 (조항 번호/제목/본문은 조회 시 다시 채움)
+_UNMATCHED_ANALYSIS_FIELDS = ('category', 'confidence', 'reasoning', 'recommendation', 'risk_level')
+
+# 매칭 안된 조항 분석 응답 토큰 상한 (조항당, 분류 JSON 한 건 기준)
+_UNMATCHED_MAX_TOKENS_PER_ARTICLE = 300
+
+# 비동기 LLM 호출용 프로세스 공용 이벤트 루프 (백그라운드 스레드에서 실행)
+_event_loop: Optional[asyncio.AbstractEventLoop] = None
+_event_loop_lock = threading.Lock()
+
+
+def get_a1_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    A1 비동기 작업용 프로세스 공용 이벤트 루프
+
+    비동기 클라이언트의 커넥션 풀은 처음 사용한 루프에 묶이므로, 공유 클라이언트는
+    항상 이 루프에서만 사용합니다.
+
+    Returns:
+        백그라운드 스레드에서 실행 중인 이벤트 루프
+    """
+    global _event_loop
+    with _event_loop_lock:
+        if _event_loop is None or _event_loop.is_closed():
+            _event_loop = asyncio.new_event_loop()
+            threading.Thread(target=_event_loop.run_forever, name="a1-event-loop", daemon=True).start()
+    return _event_loop
+
+
+@lru_cache(maxsize=4096)
+def _resolve_base_global_id(parent_id: str, first_chunk_global_id: str, contract_type: str) -> str:
+    """
+    표준 조항 base global_id 계산 (문자열 입력만 사용하므로 프로세스 단위로 메모이즈)
+
+    Args:
+        parent_id: 표준 조항 ID (예: "제1조")
+        first_chunk_global_id: 조항 첫 청크의 global_id (없으면 빈 문자열)
+        contract_type: 계약 유형
+
+    Returns:
+        base global_id (예: "urn:std:provide:art:001")
+    """
+    # 1. 청크 global_id에서 :att, :sub, :cla 제거
+    if first_chunk_global_id:
+        return ':'.join(first_chunk_global_id.split(':')[:5])
+
+    # 2. parent_id에서 직접 생성 시도
+    match = _KOREAN_ARTICLE_PATTERN.search(parent_id)
+    if match:
+        article_num = int(match.group(1))
+        return f"urn:std:{contract_type}:art:{article_num:03d}"
+
+    # 3. 최종 fallback
+    logger.warning(f"    global_id 생성 실패: {parent_id}")
+    return parent_id
+
 
 class CompletenessCheckNode:
     """
@@ -32,17 +150,38 @@ class CompletenessCheckNode:
         self,
         knowledge_base_loader,
         azure_client: AzureOpenAI,
-        matching_threshold: float = 0.7
+        matching_threshold: float = 0.7,
+        async_azure_client: Optional[AsyncAzureOpenAI] = None,
+        max_concurrency: int = 20,
+        verification_batch_size: int = 5,
+        bypass_threshold: float = 0.92,
+        unmatched_model: str = "gpt-4o-mini",
+        unmatched_escalation_model: Optional[str] = "gpt-4o",
+        unmatched_escalation_threshold: float = 0.6
     ):
         """
         Args:
             knowledge_base_loader: KnowledgeBaseLoader 서비스
             azure_client: Azure OpenAI 클라이언트
             matching_threshold: 매칭 성공 임계치(기본 0.7)
+            async_azure_client: 비동기 Azure OpenAI 클라이언트 (LLM 검증 동시 호출용)
+            max_concurrency: 동시에 검증할 최대 조문 수 (Azure TPM 한도 보호)
+            verification_batch_size: LLM 매칭 검증 1회에 묶을 사용자 조문 수 (1이면 조문별 개별 호출)
+            bypass_threshold: 최상위 후보 청크의 원본 dense 점수 평균이 이 값 이상이고 제목이 일치하면 LLM 검증 생략
+            unmatched_model: 매칭 안된 조항 분류 모델 (기본: gpt-4o-mini)
+            unmatched_escalation_model: 분류 신뢰도가 낮을 때 재분석할 모델 (None이면 재분석 안 함)
+            unmatched_escalation_threshold: 재분석 기준 신뢰도 (미만이면 재분석)
         """
         self.kb_loader = knowledge_base_loader
         self.azure_client = azure_client
+        self.async_azure_client = async_azure_client
         self.threshold = matching_threshold
+        self.max_concurrency = max_concurrency
+        self.verification_batch_size = max(1, verification_batch_size)
+        self.bypass_threshold = bypass_threshold
+        self.unmatched_model = unmatched_model
+        self.unmatched_escalation_model = unmatched_escalation_model
+        self.unmatched_escalation_threshold = unmatched_escalation_threshold
 
         # 내부 컴포넌트 초기화
         self.article_matcher = ArticleMatcher(
@@ -51,14 +190,40 @@ class CompletenessCheckNode:
             similarity_threshold=matching_threshold
         )
 
+        # LLM 검증/분류 결과 캐시 (매칭 검증과 매칭 안된 조항 분석 공용)
+        self.verification_cache = get_verification_cache()
+
         self.matching_verifier = MatchingVerifier(
             azure_client,
             model="gpt-4o",
-            knowledge_base_loader=knowledge_base_loader
+            knowledge_base_loader=knowledge_base_loader,
+            async_azure_client=async_azure_client,
+            cache=self.verification_cache
         )
 
         logger.info("A1 노드 (Completeness Check) 초기화 완료")
 
+    def _run_async(self, coro):
+        """
+        프로세스 공용 이벤트 루프에서 코루틴 실행
+
+        Celery prefork 워커는 동기 컨텍스트이므로 asyncio.run 대신 백그라운드 루프를 유지하여
+        태스크가 바뀌어도 공유 비동기 클라이언트의 keep-alive 커넥션을 재사용합니다.
+
+        Args:
+            coro: 실행할 코루틴
+
+        Returns:
+            코루틴 결과
+        """
+        return asyncio.run_coroutine_threadsafe(coro, get_a1_event_loop()).result()
+
+    async def _create_chat_completion_async(self, **kwargs):
+        """비동기 LLM 호출 (비동기 클라이언트가 없으면 동기 클라이언트를 스레드에서 호출)"""
+        if self.async_azure_client is not None:
+            return await self.async_azure_client.chat.completions.create(**kwargs)
+        return await asyncio.to_thread(self.azure_client.chat.completions.create, **kwargs)
+
     def check_completeness_stage1(
         self,
         contract_id: str,
@@ -92,7 +257,7 @@ class CompletenessCheckNode:
                 ...
             }
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         logger.info(f"[A1-S1] 매칭 검증 시작: {contract_id} (type={contract_type})")
 
@@ -111,68 +276,38 @@ class CompletenessCheckNode:
                 "matched_standard_articles": 0,
                 "missing_standard_articles": [],
                 "matching_details": [],
-                "processing_time": time.time() - start_time,
+                "processing_time": time.perf_counter() - start_time,
                 "verification_date": datetime.now().isoformat()
             }
 
-        # 표준계약서 항목 로드
-        standard_chunks = self.kb_loader.load_chunks(contract_type)
-        if not standard_chunks:
-            logger.error(f"[A1-S1] 표준계약서 데이터를 로드 실패: {contract_type}")
-            raise ValueError(f"표준계약서 데이터를 로드할 수 없습니다: {contract_type}")
-
-        # 표준계약서의 parent_id 목록 추출
-        standard_articles = self._extract_standard_articles(standard_chunks)
+        # 표준계약서 조문 목록 (계약 유형별 캐시)
+        standard_articles = self._get_standard_articles(contract_type)
         total_standard_articles = len(standard_articles)
 
         logger.info(f"[A1-S1] 사용자 조문: {total_user_articles}개, 표준 조문: {total_standard_articles}개")
 
         # 1단계: 모든 사용자 조문과 표준 조문 매칭 수행 (병렬 처리)
-        matched_standard_articles: Set[str] = set()  # 매칭된 표준 조문 ID
-        matched_user_articles: Set[int] = set()  # 매칭된 사용자조문 번호
-        matching_details: List[Dict] = []
+        logger.info(f"[A1-S1] 🚀 조항 매칭 병렬 처리 시작: {len(user_articles)}개 조항 (max_concurrency={self.max_concurrency})")
+
+        # 병렬 실행 (입력 순서 유지)
+        article_results = self._run_async(
+            self._check_articles_async(
+                user_articles,
+                contract_type,
+                contract_id,
+                text_weight,
+                title_weight,
+                dense_weight
+            )
+        )
+
+        matching_details: List[Dict] = [r for r in article_results if r]
+
+        # 매칭 성공 조항 추적
+        matched_results = [r for r in matching_details if r['matched'] and r['matched_articles']]
+        matched_user_articles: Set[int] = {r['user_article_no'] for r in matched_results}  # 매칭된 사용자조문 번호
+        matched_standard_articles: Set[str] = set().union(*(r['matched_articles'] for r in matched_results))  # 매칭된 표준 조문 ID
 
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-        
-        logger.info(f"[A1-S1] 🚀 조항 매칭 병렬 처리 시작: {len(user_articles)}개 조항 (max_workers=5)")
-        
-        def process_single_article(article):
-            """단일 조항 처리"""
-            try:
-                article_result = self._check_article(
-                    article,
-                    contract_type,
-                    contract_id,
-                    text_weight,
-                    title_weight,
-                    dense_weight
-                )
-                logger.info("----------------------------------------[A1-S1]----------------------------------------")
-                return article_result
-            except Exception as e:
-                logger.error(f"[A1-S1] 조항 검증 실패 (제{article.get('number')}조): {e}")
-                logger.info("----------------------------------------[A1-S1]----------------------------------------")
-                return None
-        
-        # 병렬 실행
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            future_to_article = {
-                executor.submit(process_single_article, article): article
-                for article in user_articles
-            }
-            
-            for future in as_completed(future_to_article):
-                article_result = future.result()
-                
-                if article_result:
-                    matching_details.append(article_result)
-                    
-                    # 매칭 성공 시 추적
-                    if article_result['matched'] and article_result['matched_articles']:
-                        matched_user_articles.add(article_result['user_article_no'])
-                        for matched_std_id in article_result['matched_articles']:
-                            matched_standard_articles.add(matched_std_id)
-        
         logger.info(f"[A1-S1] ✨ 조항 매칭 병렬 처리 완료")
 
         # 2단계: 누락된 표준 조문 식별 (재검증은 하지 않음)
@@ -206,7 +341,7 @@ class CompletenessCheckNode:
             logger.info(f"[A1-S1] 모든 사용자 조항이 표준계약서와 매칭되었습니다")
 
         # 결과 생성 (missing_article_analysis 없음)
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
 
         result = {
             "contract_id": contract_id,
@@ -258,40 +393,42 @@ class CompletenessCheckNode:
         """
         from backend.shared.database import SessionLocal, ValidationResult, ContractDocument
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         logger.info(f"[A1-S2] 누락 조문 재검증 시작: {contract_id}")
 
         db = SessionLocal()
         try:
-            # DB에서 Stage 1 결과 로드
-            validation_result = db.query(ValidationResult).filter(
+            # Stage 1 결과와 사용자 계약서를 한 번의 쿼리로 로드 (필요한 JSON 컬럼만 조회)
+            row = db.query(
+                ValidationResult.completeness_check,
+                ContractDocument.parsed_data
+            ).outerjoin(
+                ContractDocument,
+                ContractDocument.contract_id == ValidationResult.contract_id
+            ).filter(
                 ValidationResult.contract_id == contract_id
             ).first()
 
-            if not validation_result or not validation_result.completeness_check:
+            if not row or not row.completeness_check:
                 raise ValueError(f"A1-Stage1 결과를 찾을 수 없습니다: {contract_id}")
 
-            completeness_check = validation_result.completeness_check
+            completeness_check = row.completeness_check
             missing_articles = completeness_check.get('missing_standard_articles', [])
 
             if not missing_articles:
                 logger.info(f"[A1-S2] 누락 조문이 없습니다")
                 return {
                     "missing_article_analysis": [],
-                    "processing_time": time.time() - start_time
+                    "processing_time": time.perf_counter() - start_time
                 }
 
             logger.info(f"[A1-S2] 누락 조문: {len(missing_articles)}개")
 
-            # 사용자 계약서 로드 (역방향 검증용)
-            contract = db.query(ContractDocument).filter(
-                ContractDocument.contract_id == contract_id
-            ).first()
-
-            if not contract or not contract.parsed_data:
+            # 사용자 계약서 (역방향 검증용)
+            if not row.parsed_data:
                 raise ValueError(f"계약서 데이터를 찾을 수 없습니다: {contract_id}")
 
-            user_articles = contract.parsed_data.get('articles', [])
+            user_articles = row.parsed_data.get('articles', [])
 
             # 누락 조문 재검증
             missing_article_analysis = self._verify_missing_articles(
@@ -304,7 +441,7 @@ class CompletenessCheckNode:
                 dense_weight
             )
 
-            processing_time = time.time() - start_time
+            processing_time = time.perf_counter() - start_time
 
             result = {
                 "missing_article_analysis": missing_article_analysis,
@@ -346,7 +483,7 @@ class CompletenessCheckNode:
         Returns:
             완전성 검증 결과 (전체)
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         logger.info(f"A1 완전성 검증 시작 (순차): {contract_id} (type={contract_type})")
 
@@ -380,7 +517,7 @@ class CompletenessCheckNode:
             logger.info(f"  누락 조문 재검증 완료: {len(missing_article_analysis)}개")
 
         # 전체 결과 생성 (Stage 1 + Stage 2 통합)
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
 
         result = {
             **stage1_result,  # Stage 1 결과 복사
@@ -394,25 +531,232 @@ class CompletenessCheckNode:
 
         return result
 
-    def _check_article(
+    async def _check_articles_async(
         self,
-        user_article: Dict[str, Any],
+        user_articles: List[Dict[str, Any]],
         contract_type: str,
         contract_id: str,
         text_weight: float,
         title_weight: float,
         dense_weight: float
-    ) -> Dict[str, Any]:
+    ) -> List[Optional[Dict[str, Any]]]:
         """
-        단일 조항 완전성 검증
+        사용자 조항 전체를 동시에 검증
+
+        1) 조항별 후보 검색(ArticleMatcher)을 동시에 수행하고
+        2) 후보가 있는 조항들을 verification_batch_size개씩 묶어 LLM 검증(MatchingVerifier)을 일괄 요청한 뒤
+        3) 조항별 매칭 결과를 조립합니다.
+
         Args:
-            user_article: 사용자 조항
+            user_articles: 사용자 조항 리스트
             contract_type: 계약 유형
-            contract_id: 계약서ID (토큰 로깅용)
+            contract_id: 계약서 ID
             text_weight: 본문 가중치
             title_weight: 제목 가중치
             dense_weight: 임베딩가중치
 
+        Returns:
+            조항별 매칭 결과 리스트 (입력 순서, 실패한 조항은 None)
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        # 전체 청크 로드 (MatchingVerifier의 참조 해결용)
+        self.matching_verifier.set_all_chunks(contract_type)
+
+        # 1단계: 검색 기반 후보 취합 (ArticleMatcher, 동기 검색이므로 스레드에서 실행)
+        async def search_single_article(article):
+            """단일 조항 후보 검색"""
+            async with semaphore:
+                try:
+                    return await asyncio.to_thread(
+                        self.article_matcher.find_matching_article,
+                        article,
+                        contract_type,
+                        top_k=3,  # 단계별로 top-3까지만 사용
+                        contract_id=contract_id,
+                        text_weight=text_weight,
+                        title_weight=title_weight,
+                        dense_weight=dense_weight
+                    )
+                except Exception as e:
+                    logger.error(f"[A1-S1] 조항 검색 중 오류 (제{article.get('number')}조): {e}")
+                    return {"matched": False, "matched_articles": [], "error": str(e)}
+
+        # 제목/본문/하위항목이 같은 조항은 대표 조항만 검색·검증하고 결과를 공유
+        representative_indices = self._group_duplicate_articles(user_articles)
+        unique_indices = sorted(set(representative_indices))
+        if len(unique_indices) < len(user_articles):
+            logger.info(f"[A1-S1] 중복 조항 {len(user_articles) - len(unique_indices)}개는 대표 조항 결과를 공유합니다")
+
+        # 저장 임베딩이 없는 검색 쿼리는 조항별 개별 요청 대신 한 번에 임베딩 (EmbeddingService 캐시에 적재)
+        try:
+            await asyncio.to_thread(
+                self.article_matcher.prefetch_query_embeddings,
+                [user_articles[i] for i in unique_indices],
+                contract_id
+            )
+        except Exception as e:
+            logger.warning(f"[A1-S1] 검색 쿼리 임베딩 사전 생성 실패 (조항별 개별 생성): {e}")
+
+        searched = await asyncio.gather(
+            *(search_single_article(user_articles[i]) for i in unique_indices)
+        )
+        matching_results: Dict[int, Dict[str, Any]] = dict(zip(unique_indices, searched))
+
+        # 2단계: LLM 매칭 검증 (후보가 있는 조항만, 배치 단위로 묶어 호출)
+        # 최상위 후보가 고득점이고 제목까지 일치하는 조항은 LLM 검증 없이 바로 채택
+        verification_results: Dict[int, Any] = {}
+        pending = []
+        for i in unique_indices:
+            if not (matching_results[i]['matched'] and matching_results[i]['matched_articles']):
+                continue
+            bypass_result = self._try_bypass_verification(user_articles[i], matching_results[i]['matched_articles'])
+            if bypass_result is not None:
+                verification_results[i] = bypass_result
+            else:
+                pending.append(i)
+
+        if verification_results:
+            logger.info(f"[A1-S1] 고신뢰 후보 직접 채택: {len(verification_results)}개 조항 "
+                       f"(bypass_threshold={self.bypass_threshold})")
+
+        batches = [
+            pending[start:start + self.verification_batch_size]
+            for start in range(0, len(pending), self.verification_batch_size)
+        ]
+
+        async def verify_single_batch(indices):
+            """배치 단위 LLM 매칭 검증"""
+            async with semaphore:
+                return await self.matching_verifier.verify_matching_batch_async(
+                    [(user_articles[i], matching_results[i]['matched_articles']) for i in indices],
+                    contract_type,
+                    top_k=5,  # Top-5 조문 LLM 검증
+                    user_embeddings=[matching_results[i].get('article_embedding') for i in indices]
+                )
+
+        logger.info(f"[A1-S1] LLM 매칭 검증: {len(pending)}개 조항, {len(batches)}개 배치 "
+                   f"(batch_size={self.verification_batch_size})")
+
+        batch_results = await asyncio.gather(
+            *(verify_single_batch(indices) for indices in batches),
+            return_exceptions=True
+        )
+
+        for indices, batch_result in zip(batches, batch_results):
+            if isinstance(batch_result, Exception):
+                logger.error(f"[A1-S1] 배치 검증 실패: {batch_result}")
+                verification_results.update((i, batch_result) for i in indices)
+            else:
+                verification_results.update(zip(indices, batch_result))
+
+        # 3단계: 조항별 결과 조립 (입력 순서 유지)
+        article_results = []
+        for article, representative in zip(user_articles, representative_indices):
+            try:
+                article_results.append(self._build_article_result(
+                    article,
+                    matching_results[representative],
+                    verification_results.get(representative)
+                ))
+            except Exception as e:
+                logger.error(f"[A1-S1] 조항 검증 실패 (제{article.get('number')}조): {e}")
+                article_results.append(None)
+            logger.info("----------------------------------------[A1-S1]----------------------------------------")
+
+        return article_results
+
+    def _try_bypass_verification(
+        self,
+        user_article: Dict[str, Any],
+        candidate_articles: List[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        고신뢰 후보 직접 채택 (LLM 검증 생략)
+
+        최상위 후보 청크의 원본 dense 점수(dense_score_raw, 1 / (1 + L2 거리)) 평균이
+        bypass_threshold 이상이고 정규화한 제목이 사용자 조항 제목과 같으면
+        MatchingVerifier.verify_matching()과 같은 형식의 결과를 바로 생성합니다.
+        후보 점수(score)는 쿼리별 min-max 정규화 점수의 평균이라 최상위 후보가 항상 1.0에
+        가까우므로 절대 신뢰도 판단에 사용하지 않습니다.
+
+        Args:
+            user_article: 사용자 조항
+            candidate_articles: ArticleMatcher 후보 조문 리스트 (점수 내림차순)
+
+        Returns:
+            검증 결과 (직접 채택 조건을 만족하지 않으면 None)
+        """
+        top = candidate_articles[0]
+        user_title = normalize_text(user_article.get('title', ''))
+        if not user_title or user_title != normalize_text(top.get('title', '')):
+            return None
+
+        avg_dense_raw = self._average_chunk_scores(top.get('matched_chunks', []))[2]
+        if avg_dense_raw < self.bypass_threshold:
+            return None
+
+        score = top.get('score', 0.0)
+        logger.debug(f"[A1-S1] 고신뢰 후보 직접 채택: 제{user_article.get('number')}조 → "
+                    f"{top['parent_id']} (원본 dense 평균: {avg_dense_raw:.3f}, 점수: {score:.3f})")
+
+        return {
+            "matched": True,
+            "selected_articles": [top['parent_id']],
+            "verification_details": [{
+                "article_id": top['parent_id'],
+                "title": top.get('title', ''),
+                "score": score,
+                "matched_sub_items": top.get('matched_sub_items', []),
+                "num_sub_items": top.get('num_sub_items', 0),
+                "verification_method": "score_bypass",
+                "confidence": "high"  # 원본 dense 점수·제목이 모두 일치한 조항
+            }],
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "total_tokens": 0
+        }
+
+    @staticmethod
+    def _group_duplicate_articles(user_articles: List[Dict[str, Any]]) -> List[int]:
+        """
+        동일 조항 그룹화 (정규화한 제목/본문/하위항목 기준)
+
+        Args:
+            user_articles: 사용자 조항 리스트
+
+        Returns:
+            조항별 대표 조항 인덱스 리스트 (각 그룹의 첫 조항이 대표)
+        """
+        first_index_by_fingerprint: Dict[str, int] = {}
+        representative_indices = []
+
+        for i, article in enumerate(user_articles):
+            fingerprint = hashlib.sha1("|".join(
+                normalize_text(part) for part in (
+                    article.get('title', ''),
+                    article.get('text', ''),
+                    *article.get('content', [])
+                )
+            ).encode('utf-8')).hexdigest()
+            representative_indices.append(first_index_by_fingerprint.setdefault(fingerprint, i))
+
+        return representative_indices
+
+    def _build_article_result(
+        self,
+        user_article: Dict[str, Any],
+        matching_result: Dict[str, Any],
+        verification_result: Optional[Any]
+    ) -> Dict[str, Any]:
+        """
+        단일 조항 완전성 검증 결과 조립
+
+        Args:
+            user_article: 사용자 조항
+            matching_result: ArticleMatcher.find_matching_article() 결과
+            verification_result: MatchingVerifier 검증 결과 (후보가 없으면 None, 검증 실패 시 예외 객체)
+
         Returns:
             조항 매칭 결과
         """
@@ -432,96 +776,80 @@ class CompletenessCheckNode:
             "verification_details": []
         }
 
-        try:
-            # 1단계: 검색 기반 후보 취합 (ArticleMatcher)
-            matching_result = self.article_matcher.find_matching_article(
-                user_article,
-                contract_type,
-                top_k=3,  # 단계별로 top-3까지만 사용
-                contract_id=contract_id,
-                text_weight=text_weight,
-                title_weight=title_weight,
-                dense_weight=dense_weight
-            )
-
-            if not matching_result['matched'] or not matching_result['matched_articles']:
-                logger.warning(f"[A1-S1] 매칭 실패: 검색결과 없음")
-                return result
+        if matching_result.get('error'):
+            result['error'] = matching_result['error']
+            return result
 
-            candidate_articles = matching_result['matched_articles']
-            sub_item_results = matching_result.get('sub_item_results', [])  # 하위항목별 매칭 결과
-            logger.info(f"[A1-S1] 후보 조문: {len(candidate_articles)}개")
+        if not matching_result['matched'] or not matching_result['matched_articles']:
+            logger.warning(f"[A1-S1] 매칭 실패: 검색결과 없음")
+            return result
 
-            # 전체 청크 로드 (MatchingVerifier의 참조 해결용)
-            self.matching_verifier.set_all_chunks(contract_type)
+        candidate_articles = matching_result['matched_articles']
+        sub_item_results = matching_result.get('sub_item_results', [])  # 하위항목별 매칭 결과
+        logger.info(f"[A1-S1] 후보 조문: {len(candidate_articles)}개")
 
-            # 2단계: LLM 매칭 검증(MatchingVerifier)
-            verification_result = self.matching_verifier.verify_matching(
-                user_article,
-                candidate_articles,
-                contract_type,
-                top_k=5  # Top-5 조문 LLM 검증
-            )
+        if isinstance(verification_result, Exception):
+            logger.error(f"[A1-S1] 조항 검증 중 오류: {verification_result}")
+            result['error'] = str(verification_result)
+            return result
 
+        try:
             if verification_result['matched']:
                 # ArticleMatcher 결과에서 상세 정보 추출
                 selected_parent_ids = verification_result['selected_articles']
                 selected_global_ids = []
                 matched_details = []
 
+                # 후보 조문 parent_id 색인 (선택된 조문별 선형 탐색 제거)
+                candidates_by_parent_id = {}
+                for candidate in candidate_articles:
+                    candidates_by_parent_id.setdefault(candidate.get('parent_id'), candidate)
+
                 # 캐시 기반 변환 및 상세 정보 수집
                 for parent_id in selected_parent_ids:
-                    # ArticleMatcher의 matched_articles에서 찾기
-                    found = False
-                    for matched in candidate_articles:
-                        if matched.get('parent_id') == parent_id:
-                            base_global_id = matched.get('base_global_id')
-                            if base_global_id:
-                                selected_global_ids.append(base_global_id)
-
-                                # 상세 점수 정보 수집
-                                matched_chunks = matched.get('matched_chunks', [])
-
-                                # 조 단위 평균 점수 계산
-                                avg_dense = sum(c.get('dense_score', 0.0) for c in matched_chunks) / len(matched_chunks) if matched_chunks else 0.0
-                                avg_sparse = sum(c.get('sparse_score', 0.0) for c in matched_chunks) / len(matched_chunks) if matched_chunks else 0.0
-                                avg_dense_raw = sum(c.get('dense_score_raw', 0.0) for c in matched_chunks) / len(matched_chunks) if matched_chunks else 0.0
-                                avg_sparse_raw = sum(c.get('sparse_score_raw', 0.0) for c in matched_chunks) / len(matched_chunks) if matched_chunks else 0.0
-
-                                # 하위항목별 점수 정보
-                                sub_items_scores = []
-                                for chunk in matched_chunks:
-                                    chunk_info = chunk.get('chunk', {})
-                                    sub_items_scores.append({
-                                        'chunk_id': chunk_info.get('id', ''),
-                                        'global_id': chunk_info.get('global_id', ''),
-                                        'text': chunk_info.get('text_raw', ''),
-                                        'dense_score': chunk.get('dense_score', 0.0),
-                                        'dense_score_raw': chunk.get('dense_score_raw', 0.0),
-                                        'sparse_score': chunk.get('sparse_score', 0.0),
-                                        'sparse_score_raw': chunk.get('sparse_score_raw', 0.0),
-                                        'combined_score': chunk.get('score', 0.0)
-                                    })
-
-                                detail = {
-                                    'parent_id': parent_id,
-                                    'global_id': base_global_id,
-                                    'title': matched.get('title', ''),
-                                    'combined_score': matched.get('score', 0.0),  # 조 전체 종합 점수
-                                    'num_sub_items': matched.get('num_sub_items', 0),
-                                    'matched_sub_items': matched.get('matched_sub_items', []),
-                                    'avg_dense_score': avg_dense,
-                                    'avg_dense_score_raw': avg_dense_raw,
-                                    'avg_sparse_score': avg_sparse,
-                                    'avg_sparse_score_raw': avg_sparse_raw,
-                                    'sub_items_scores': sub_items_scores  # 하위항목별 상세 점수
-                                }
-                                matched_details.append(detail)
-                                found = True
-                                break
-
-                    if not found:
+                    matched = candidates_by_parent_id.get(parent_id)
+                    base_global_id = matched.get('base_global_id') if matched else None
+                    if not base_global_id:
                         logger.warning(f"[A1-S1] base_global_id를 찾을 수 없음: {parent_id}")
+                        continue
+
+                    selected_global_ids.append(base_global_id)
+
+                    # 상세 점수 정보 수집
+                    matched_chunks = matched.get('matched_chunks', [])
+
+                    # 조 단위 평균 점수 계산
+                    avg_dense, avg_sparse, avg_dense_raw, avg_sparse_raw = self._average_chunk_scores(matched_chunks)
+
+                    # 하위항목별 점수 정보
+                    sub_items_scores = []
+                    for chunk in matched_chunks:
+                        chunk_info = chunk.get('chunk', {})
+                        sub_items_scores.append({
+                            'chunk_id': chunk_info.get('id', ''),
+                            'global_id': chunk_info.get('global_id', ''),
+                            'text': chunk_info.get('text_raw', ''),
+                            'dense_score': chunk.get('dense_score', 0.0),
+                            'dense_score_raw': chunk.get('dense_score_raw', 0.0),
+                            'sparse_score': chunk.get('sparse_score', 0.0),
+                            'sparse_score_raw': chunk.get('sparse_score_raw', 0.0),
+                            'combined_score': chunk.get('score', 0.0)
+                        })
+
+                    detail = {
+                        'parent_id': parent_id,
+                        'global_id': base_global_id,
+                        'title': matched.get('title', ''),
+                        'combined_score': matched.get('score', 0.0),  # 조 전체 종합 점수
+                        'num_sub_items': matched.get('num_sub_items', 0),
+                        'matched_sub_items': matched.get('matched_sub_items', []),
+                        'avg_dense_score': avg_dense,
+                        'avg_dense_score_raw': avg_dense_raw,
+                        'avg_sparse_score': avg_sparse,
+                        'avg_sparse_score_raw': avg_sparse_raw,
+                        'sub_items_scores': sub_items_scores  # 하위항목별 상세 점수
+                    }
+                    matched_details.append(detail)
 
                 result['matched'] = True
                 result['matched_articles'] = selected_parent_ids  # parent_id 리스트로 저장 (A3/프론트 호환)
@@ -532,12 +860,14 @@ class CompletenessCheckNode:
 
                 # 디버깅: sub_item_results 로그
                 logger.info(f"[A1-S1] sub_item_results 포함: {len(sub_item_results)}개 하위항목")
-                for sub_result in sub_item_results:
-                    logger.info(f"[A1-S1]   하위항목 {sub_result.get('sub_item_index')}: {len(sub_result.get('matched_articles', []))}개 조")
+                if logger.isEnabledFor(logging.INFO):
+                    for sub_result in sub_item_results:
+                        logger.info(f"[A1-S1]   하위항목 {sub_result.get('sub_item_index')}: {len(sub_result.get('matched_articles', []))}개 조")
 
                 logger.info(f"[A1-S1] 매칭 성공: {len(result['matched_articles'])}개 조문")
-                for i, (parent_id, global_id) in enumerate(zip(selected_parent_ids, selected_global_ids)):
-                    logger.info(f"[A1-S1]   - {parent_id} → {global_id}")
+                if logger.isEnabledFor(logging.INFO):
+                    for parent_id, global_id in zip(selected_parent_ids, selected_global_ids):
+                        logger.info(f"[A1-S1]   - {parent_id} → {global_id}")
             else:
                 logger.warning(f"[A1-S1] 매칭 실패: LLM 검증 통과 못함")
 
@@ -547,6 +877,54 @@ class CompletenessCheckNode:
 
         return result
 
+    @staticmethod
+    def _average_chunk_scores(matched_chunks: List[Dict[str, Any]]) -> List[float]:
+        """
+        청크 점수 평균 계산 (청크 × 점수 종류 행렬을 한 번에 집계)
+
+        Args:
+            matched_chunks: 조에 매칭된 청크 리스트
+
+        Returns:
+            [avg_dense, avg_sparse, avg_dense_raw, avg_sparse_raw] (청크가 없으면 모두 0.0)
+        """
+        if not matched_chunks:
+            return [0.0] * len(_CHUNK_SCORE_KEYS)
+
+        scores = np.fromiter(
+            (chunk.get(key, 0.0) for chunk in matched_chunks for key in _CHUNK_SCORE_KEYS),
+            dtype=np.float64,
+            count=len(matched_chunks) * len(_CHUNK_SCORE_KEYS)
+        ).reshape(-1, len(_CHUNK_SCORE_KEYS))
+
+        return scores.mean(axis=0).tolist()
+
+    def _get_standard_articles(self, contract_type: str) -> List[Dict]:
+        """
+        표준계약서 조문 목록 조회 (계약 유형별 캐시)
+
+        KnowledgeBaseLoader가 청크 리스트를 캐싱하므로 같은 리스트 객체가 반환되는 동안은
+        조 단위 그룹화 결과를 재사용합니다. 지식베이스가 다시 로드되면 새로 그룹화합니다.
+
+        Args:
+            contract_type: 계약 유형
+
+        Returns:
+            표준 조문 리스트 (_extract_standard_articles 형식)
+        """
+        standard_chunks = self.kb_loader.load_chunks(contract_type)
+        if not standard_chunks:
+            logger.error(f"[A1-S1] 표준계약서 데이터를 로드 실패: {contract_type}")
+            raise ValueError(f"표준계약서 데이터를 로드할 수 없습니다: {contract_type}")
+
+        cached = _standard_articles_cache.get(contract_type)
+        if cached is not None and cached[0] is standard_chunks:
+            return cached[1]
+
+        standard_articles = self._extract_standard_articles(standard_chunks)
+        _standard_articles_cache[contract_type] = (standard_chunks, standard_articles)
+        return standard_articles
+
     def _extract_standard_articles(self, chunks: List[Dict]) -> List[Dict]:
         """
         표준계약서 항목 정보를 parent_id 기준으로 그룹화
@@ -556,30 +934,30 @@ class CompletenessCheckNode:
         Returns:
             조항단위로 그룹화된 정보 리스트 (별지 제외)
         """
-        article_map = defaultdict(lambda: {
-            'parent_id': None,
-            'title': None,
-            'chunks': []
-        })
+        article_map: Dict[str, Dict] = {}
 
         for chunk in chunks:
             parent_id = chunk.get('parent_id')
-            if not parent_id:
-                continue
 
             # 별지(exhibit) 제외: parent_id가 "별지"로 시작하는 경우
-            if parent_id.startswith('별지'):
+            if not parent_id or parent_id.startswith('별지'):
                 continue
 
-            if article_map[parent_id]['parent_id'] is None:
-                article_map[parent_id]['parent_id'] = parent_id
-                article_map[parent_id]['title'] = chunk.get('title', '')
+            article = article_map.get(parent_id)
+            if article is None:
+                article = article_map[parent_id] = {
+                    'parent_id': parent_id,
+                    'title': chunk.get('title', ''),
+                    'chunks': []
+                }
 
-            article_map[parent_id]['chunks'].append(chunk)
+            article['chunks'].append(chunk)
 
-        # 리스트로 변환 후 정렬
-        articles = list(article_map.values())
-        articles.sort(key=lambda x: self._extract_article_number(x['parent_id']))
+        # 리스트로 변환 후 정렬 (정렬 키는 조문당 한 번만 계산)
+        articles = sorted(
+            article_map.values(),
+            key=lambda x: self._extract_article_number(x['parent_id'])
+        )
 
         logger.info(f"  표준 조문 추출 완료: {len(articles)}개 (별지 제외)")
 
@@ -591,8 +969,7 @@ class CompletenessCheckNode:
 
         예: "제3조" -> 3
         """
-        import re
-        match = re.search(r'\d+', parent_id)
+        match = _ARTICLE_NUMBER_PATTERN.search(parent_id)
         if match:
             return int(match.group())
         return 999999
@@ -612,28 +989,9 @@ class CompletenessCheckNode:
         Returns:
             base global_id (예: "urn:std:provide:art:001")
         """
-        import re
-
-        # 1. chunks에서 직접 추출 시도
-        chunks = article.get('chunks', [])
-        if chunks and len(chunks) > 0:
-            first_chunk = chunks[0]
-            global_id = first_chunk.get('global_id', '')
-            if global_id:
-                # :att, :sub, :cla 제거
-                base_global_id = ':'.join(global_id.split(':')[:5])
-                return base_global_id
-
-        # 2. parent_id에서 직접 생성 시도
-        parent_id = article.get('parent_id', '')
-        match = re.search(r'제(\d+)조', parent_id)
-        if match:
-            article_num = int(match.group(1))
-            return f"urn:std:{contract_type}:art:{article_num:03d}"
-
-        # 3. 최종 fallback
-        logger.warning(f"    global_id 생성 실패: {parent_id}")
-        return parent_id
+        chunks = article.get('chunks') or []
+        first_chunk_global_id = chunks[0].get('global_id', '') if chunks else ''
+        return _resolve_base_global_id(article.get('parent_id', ''), first_chunk_global_id, contract_type)
 
     def _verify_missing_articles(
         self,
@@ -677,17 +1035,12 @@ class CompletenessCheckNode:
                 ...
             ]
         """
-        analysis_results = []
-
         # 사용자 조문 FAISS 인덱스 생성 (한 번만)
         logger.info(f"[A1-S2] 사용자 조문 FAISS 인덱스 생성 시작...")
         logger.info(f"[A1-S2]   - 사용자 조문 수: {len(user_articles)}개")
         logger.info(f"[A1-S2]   - contract_id: {contract_id}")
 
-        user_faiss_index, embedding_map = self.article_matcher.build_user_faiss_index(
-            user_articles=user_articles,
-            contract_id=contract_id
-        )
+        user_faiss_index, embedding_map = self._get_user_faiss_index(user_articles, contract_id)
 
         if user_faiss_index is None:
             logger.error(f"[A1-S2] ❌ FAISS 인덱스 생성 실패 - 누락 검증 중단")
@@ -697,75 +1050,15 @@ class CompletenessCheckNode:
 
         logger.info(f"[A1-S2] ✓ FAISS 인덱스 생성 완료: {len(embedding_map)}개 하위항목")
 
-        for i, missing_article in enumerate(missing_articles, 1):
-            parent_id = missing_article['parent_id']
-            title = missing_article['title']
-
-            logger.info(f"[A1-S2] [{i}/{len(missing_articles)}] 누락 조문 재검증: {parent_id} ({title})")
-            
-            try:
-                # 1단계: 역방향 검색 (표준 → 사용자) - FAISS 인덱스 재사용
-                user_candidates = self.article_matcher.find_matching_user_articles(
-                    standard_article=missing_article,
-                    user_faiss_index=user_faiss_index,
-                    embedding_map=embedding_map,
-                    contract_type=contract_type,
-                    top_k=3  # Top-3 후보
-                )
-                
-                # 2단계: LLM 재검증
-                verification_result = self.matching_verifier.verify_missing_article_forward(
-                    standard_article=missing_article,
-                    user_candidates=user_candidates,
-                    contract_type=contract_type
-                )
-
-                # missing_article의 chunks에서 global_id 추출 (캐시 기반)
-                global_id = self._extract_global_id_from_article(missing_article, contract_type)
-
-                # 결과 저장
-                analysis_results.append({
-                    "standard_article_id": global_id,  # global_id로 저장
-                    "standard_article_title": title,
-                    "is_truly_missing": verification_result['is_truly_missing'],
-                    "confidence": verification_result['confidence'],
-                    "matched_user_article": verification_result.get('matched_user_article'),
-                    "reasoning": verification_result['reasoning'],
-                    "recommendation": verification_result['recommendation'],
-                    "evidence": verification_result['evidence'],
-                    "risk_assessment": verification_result['risk_assessment'],
-                    "top_candidates": user_candidates,
-                    "candidates_analysis": verification_result.get('candidates_analysis', [])
-                })
-                
-                # 로깅
-                if verification_result['is_truly_missing']:
-                    logger.warning(f"[A1-S2]   → 실제 누락 확인 (신뢰도: {verification_result['confidence']:.2f})")
-                else:
-                    matched_no = verification_result.get('matched_user_article', {}).get('number', '?')
-                    logger.info(f"[A1-S2]   → 누락 아님: 제{matched_no}조에 포함 (신뢰도: {verification_result['confidence']:.2f})")
-
-            except Exception as e:
-                logger.error(f"[A1-S2]   재검증 실패: {e}")
-                # missing_article의 chunks에서 global_id 추출
-                global_id = self._extract_global_id_from_article(missing_article, contract_type)
-                # 실패 시 기본 결과
-                analysis_results.append({
-                    "standard_article_id": global_id,  # global_id로 저장
-                    "standard_article_title": title,
-                    "is_truly_missing": True,
-                    "confidence": 0.7,
-                    "matched_user_article": None,
-                    "reasoning": f"재검증 중 오류 발생: {str(e)}",
-                    "recommendation": f"'{title}' 조항 확인 필요",
-                    "evidence": "재검증 실패",
-                    "risk_assessment": "오류로 인해 정확한 평가 불가",
-                    "top_candidates": [],
-                    "candidates_analysis": []
-                })
-            finally:
-                # 누락 조문별 재검증 완료 구분선
-                logger.info("----------------------------------------[A1-S2]----------------------------------------")
+        # 누락 조문별 역방향 검색 + LLM 재검증 동시 실행 (입력 순서 유지)
+        analysis_results = self._run_async(
+            self._verify_missing_articles_async(
+                missing_articles,
+                user_faiss_index,
+                embedding_map,
+                contract_type
+            )
+        )
 
         # 실제 누락 조문 통계
         truly_missing_count = sum(1 for r in analysis_results if r['is_truly_missing'])
@@ -775,6 +1068,170 @@ class CompletenessCheckNode:
 
         return analysis_results
 
+    def _get_user_faiss_index(
+        self,
+        user_articles: List[Dict],
+        contract_id: str
+    ) -> tuple:
+        """
+        사용자 조문 FAISS 인덱스 조회 (프로세스 단위 LRU 캐시, 없으면 생성)
+
+        같은 계약서를 재검증하거나 Celery 재시도하는 경우 임베딩 로드와 인덱스 생성을 생략합니다.
+        키에 조문 내용 해시를 포함하므로 계약서가 다시 파싱되면 새로 생성됩니다.
+
+        Args:
+            user_articles: 사용자 계약서 조문 리스트
+            contract_id: 계약서 ID
+
+        Returns:
+            (faiss_index, embedding_map), 생성 실패 시 (None, [])
+        """
+        digest = hashlib.md5()
+        for article in user_articles:
+            digest.update(json.dumps(
+                [article.get('article_id'), article.get('number'), article.get('text', ''), article.get('content', [])],
+                ensure_ascii=False
+            ).encode('utf-8'))
+        key = (contract_id, digest.hexdigest())
+
+        with _user_faiss_cache_lock:
+            cached = _user_faiss_cache.get(key)
+            if cached is not None:
+                _user_faiss_cache.move_to_end(key)
+                logger.info(f"[A1-S2] 사용자 조문 FAISS 인덱스 캐시 사용: {contract_id}")
+                return cached
+
+        user_faiss_index, embedding_map = self.article_matcher.build_user_faiss_index(
+            user_articles=user_articles,
+            contract_id=contract_id
+        )
+
+        if user_faiss_index is not None:
+            with _user_faiss_cache_lock:
+                _user_faiss_cache[key] = (user_faiss_index, embedding_map)
+                _user_faiss_cache.move_to_end(key)
+                while len(_user_faiss_cache) > _USER_FAISS_CACHE_MAX_SIZE:
+                    _user_faiss_cache.popitem(last=False)
+
+        return user_faiss_index, embedding_map
+
+    async def _verify_missing_articles_async(
+        self,
+        missing_articles: List[Dict],
+        user_faiss_index,
+        embedding_map: List[Dict],
+        contract_type: str
+    ) -> List[Dict]:
+        """
+        누락 조문 재검증을 동시에 수행
+
+        Args:
+            missing_articles: 누락된 표준 조문 리스트
+            user_faiss_index: 사용자 조문 FAISS 인덱스
+            embedding_map: FAISS 인덱스 위치별 사용자 하위항목 정보
+            contract_type: 계약 유형
+
+        Returns:
+            누락 조문 분석 결과 리스트 (입력 순서)
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        total = len(missing_articles)
+
+        # 1단계: 역방향 검색 (표준 → 사용자) - 모든 누락 조문의 청크를 한 번의 FAISS 검색으로 처리
+        try:
+            batch_candidates = await asyncio.to_thread(
+                self.article_matcher.find_matching_user_articles_batch,
+                missing_articles,
+                user_faiss_index,
+                embedding_map,
+                contract_type,
+                top_k=3  # Top-3 후보
+            )
+        except Exception as e:
+            logger.error(f"[A1-S2] 역방향 일괄 검색 실패 (조문별 검색으로 전환): {e}")
+            batch_candidates = None
+
+        async def verify_single_missing_article(i, missing_article):
+            """단일 누락 조문 재검증"""
+            parent_id = missing_article['parent_id']
+            title = missing_article['title']
+
+            async with semaphore:
+                logger.info(f"[A1-S2] [{i}/{total}] 누락 조문 재검증: {parent_id} ({title})")
+
+                try:
+                    if batch_candidates is not None:
+                        user_candidates = batch_candidates[i - 1]
+                    else:
+                        user_candidates = await asyncio.to_thread(
+                            self.article_matcher.find_matching_user_articles,
+                            standard_article=missing_article,
+                            user_faiss_index=user_faiss_index,
+                            embedding_map=embedding_map,
+                            contract_type=contract_type,
+                            top_k=3  # Top-3 후보
+                        )
+
+                    # 2단계: LLM 재검증
+                    verification_result = await self.matching_verifier.verify_missing_article_forward_async(
+                        standard_article=missing_article,
+                        user_candidates=user_candidates,
+                        contract_type=contract_type
+                    )
+
+                    # missing_article의 chunks에서 global_id 추출 (캐시 기반)
+                    global_id = self._extract_global_id_from_article(missing_article, contract_type)
+
+                    # 로깅
+                    if verification_result['is_truly_missing']:
+                        logger.warning(f"[A1-S2]   → {parent_id} 실제 누락 확인 (신뢰도: {verification_result['confidence']:.2f})")
+                    else:
+                        matched_no = verification_result.get('matched_user_article', {}).get('number', '?')
+                        logger.info(f"[A1-S2]   → {parent_id} 누락 아님: 제{matched_no}조에 포함 (신뢰도: {verification_result['confidence']:.2f})")
+
+                    return {
+                        "standard_article_id": global_id,  # global_id로 저장
+                        "standard_article_title": title,
+                        "is_truly_missing": verification_result['is_truly_missing'],
+                        "confidence": verification_result['confidence'],
+                        "matched_user_article": verification_result.get('matched_user_article'),
+                        "reasoning": verification_result['reasoning'],
+                        "recommendation": verification_result['recommendation'],
+                        "evidence": verification_result['evidence'],
+                        "risk_assessment": verification_result['risk_assessment'],
+                        "top_candidates": user_candidates,
+                        "candidates_analysis": verification_result.get('candidates_analysis', [])
+                    }
+
+                except Exception as e:
+                    logger.error(f"[A1-S2]   {parent_id} 재검증 실패: {e}")
+                    # missing_article의 chunks에서 global_id 추출
+                    global_id = self._extract_global_id_from_article(missing_article, contract_type)
+                    # 실패 시 기본 결과
+                    return {
+                        "standard_article_id": global_id,  # global_id로 저장
+                        "standard_article_title": title,
+                        "is_truly_missing": True,
+                        "confidence": 0.7,
+                        "matched_user_article": None,
+                        "reasoning": f"재검증 중 오류 발생: {str(e)}",
+                        "recommendation": f"'{title}' 조항 확인 필요",
+                        "evidence": "재검증 실패",
+                        "risk_assessment": "오류로 인해 정확한 평가 불가",
+                        "top_candidates": [],
+                        "candidates_analysis": []
+                    }
+                finally:
+                    # 누락 조문별 재검증 완료 구분선
+                    logger.info("----------------------------------------[A1-S2]----------------------------------------")
+
+        return list(await asyncio.gather(
+            *(
+                verify_single_missing_article(i, missing_article)
+                for i, missing_article in enumerate(missing_articles, 1)
+            )
+        ))
+
     def _analyze_unmatched_articles(
         self,
         unmatched_articles: List[Dict[str, Any]],
@@ -800,33 +1257,13 @@ class CompletenessCheckNode:
         if not unmatched_articles:
             return []
         
-        logger.info(f"[Unmatched] 매칭 안된 조항 분석 시작: {len(unmatched_articles)}개")
+        logger.info(f"[Unmatched] 매칭 안된 조항 분석 시작: {len(unmatched_articles)}개 "
+                   f"(batch_size={self.verification_batch_size})")
         
-        analysis_results = []
-        
-        for article in unmatched_articles:
-            try:
-                result = self._analyze_single_unmatched_article(
-                    article, contract_type, contract_id
-                )
-                analysis_results.append(result)
-                
-                logger.info(f"[Unmatched] 제{article.get('number')}조: {result['category']} "
-                          f"(신뢰도: {result['confidence']:.2f}, 위험도: {result['risk_level']})")
-            
-            except Exception as e:
-                logger.error(f"[Unmatched] 제{article.get('number')}조 분석 실패: {e}")
-                # 실패 시 기본 결과
-                analysis_results.append({
-                    "user_article_no": article.get('number'),
-                    "user_article_title": article.get('title', ''),
-                    "user_article_text": article.get('text', ''),
-                    "category": "unknown",
-                    "confidence": 0.0,
-                    "reasoning": f"분석 중 오류 발생: {str(e)}",
-                    "recommendation": "수동 검토 필요",
-                    "risk_level": "medium"
-                })
+        # verification_batch_size개씩 묶은 배치들을 동시에 분류 (입력 순서 유지)
+        analysis_results = self._run_async(
+            self._analyze_unmatched_articles_async(unmatched_articles, contract_type, contract_id)
+        )
         
         # 통계
         categories = {}
@@ -838,13 +1275,290 @@ class CompletenessCheckNode:
         
         return analysis_results
     
-    def _analyze_single_unmatched_article(
+    async def _analyze_unmatched_articles_async(
         self,
-        article: Dict[str, Any],
+        unmatched_articles: List[Dict[str, Any]],
         contract_type: str,
         contract_id: str
+    ) -> List[Dict[str, Any]]:
+        """
+        매칭 안된 조항 배치 분석을 동시에 수행
+
+        Args:
+            unmatched_articles: 매칭 실패한 사용자 조항 리스트
+            contract_type: 계약 유형
+            contract_id: 계약서 ID
+
+        Returns:
+            분석 결과 리스트 (입력 순서)
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        # 캐시 조회 (정확 일치만), 히트한 조항은 LLM 분석 생략
+        cache_keys = [
+            self._unmatched_cache_key(article, contract_type)
+            for article in unmatched_articles
+        ]
+        cached_results = [
+            self.verification_cache.get(key) if key is not None else None
+            for key in cache_keys
+        ]
+        pending = [i for i, cached in enumerate(cached_results) if cached is None]
+        if len(pending) < len(unmatched_articles):
+            logger.info(f"[Unmatched] 분석 캐시 히트: {len(unmatched_articles) - len(pending)}개")
+
+        # 같은 문서 안에서 정규화 텍스트가 같은 조항은 한 번만 분석 (동시 호출이 함께 캐시 미스 나는 것 방지)
+        representative_by_text: Dict[str, int] = {}
+        duplicate_of: Dict[int, int] = {}
+        for i in pending:
+            article = unmatched_articles[i]
+            text_key = normalize_text(f"{article.get('title', '')}\n{article.get('text', '')}")
+            if text_key in representative_by_text:
+                duplicate_of[i] = representative_by_text[text_key]
+            else:
+                representative_by_text[text_key] = i
+        if duplicate_of:
+            logger.info(f"[Unmatched] 중복 조항 분석 생략: {len(duplicate_of)}개")
+        pending = [i for i in pending if i not in duplicate_of]
+
+        batches = [
+            pending[start:start + self.verification_batch_size]
+            for start in range(0, len(pending), self.verification_batch_size)
+        ]
+
+        async def analyze_single_batch(indices):
+            """배치 단위 분류 (응답에서 빠진 조항은 조항별로 재분석)"""
+            batch = [unmatched_articles[i] for i in indices]
+            batch_parsed: List[Optional[Dict[str, Any]]] = [None] * len(batch)
+            if len(batch) > 1:
+                try:
+                    async with semaphore:
+                        batch_parsed = await self._analyze_unmatched_batch(batch, contract_type)
+                except Exception as e:
+                    logger.warning(f"[Unmatched] 배치 분석 실패, 조항별 분석으로 전환: {e}")
+
+            return await asyncio.gather(*(
+                self._finalize_unmatched_analysis(article, parsed, contract_type, contract_id, semaphore)
+                for article, parsed in zip(batch, batch_parsed)
+            ))
+
+        batch_results = await asyncio.gather(*(analyze_single_batch(indices) for indices in batches))
+
+        analysis_results: List[Optional[Dict[str, Any]]] = [None] * len(unmatched_articles)
+        for indices, results in zip(batches, batch_results):
+            for i, result in zip(indices, results):
+                analysis_results[i] = result
+
+        await self._escalate_low_confidence_unmatched(
+            unmatched_articles, analysis_results, pending, contract_type, contract_id, semaphore
+        )
+
+        for i in pending:
+            result = analysis_results[i]
+            # 분석 실패/파싱 실패(unknown) 결과는 캐시하지 않음
+            if cache_keys[i] is not None and result.get('category') != 'unknown':
+                self.verification_cache.set(
+                    cache_keys[i],
+                    {field: result.get(field) for field in _UNMATCHED_ANALYSIS_FIELDS}
+                )
+
+        for i, cached in enumerate(cached_results):
+            if cached is not None:
+                analysis_results[i] = await self._finalize_unmatched_analysis(
+                    unmatched_articles[i], cached, contract_type, contract_id, semaphore
+                )
+
+        # 중복 조항은 대표 조항의 분류 결과를 자신의 번호/제목/본문으로 복사
+        for i, representative in duplicate_of.items():
+            representative_result = analysis_results[representative]
+            analysis_results[i] = await self._finalize_unmatched_analysis(
+                unmatched_articles[i],
+                {field: representative_result.get(field) for field in _UNMATCHED_ANALYSIS_FIELDS},
+                contract_type, contract_id, semaphore
+            )
+
+        return analysis_results
+
+    async def _escalate_low_confidence_unmatched(
+        self,
+        unmatched_articles: List[Dict[str, Any]],
+        analysis_results: List[Optional[Dict[str, Any]]],
+        indices: List[int],
+        contract_type: str,
+        contract_id: str,
+        semaphore: asyncio.Semaphore
+    ):
+        """
+        신뢰도가 낮은 분류 결과를 상위 모델로 재분석 (analysis_results를 제자리에서 갱신)
+
+        Args:
+            unmatched_articles: 매칭 실패한 사용자 조항 리스트
+            analysis_results: 분석 결과 리스트 (입력 순서)
+            indices: 이번 실행에서 LLM으로 분석한 조항 인덱스
+            contract_type: 계약 유형
+            contract_id: 계약서 ID
+            semaphore: 동시 LLM 호출 수 제한
+        """
+        if not self.unmatched_escalation_model or self.unmatched_escalation_model == self.unmatched_model:
+            return
+
+        def is_low_confidence(result: Dict[str, Any]) -> bool:
+            if result.get('category') == 'unknown':
+                return False
+            try:
+                return float(result.get('confidence', 0.0)) < self.unmatched_escalation_threshold
+            except (TypeError, ValueError):
+                return True
+
+        targets = [i for i in indices if is_low_confidence(analysis_results[i])]
+        if not targets:
+            return
+
+        logger.info(f"[Unmatched] 저신뢰 분류 {len(targets)}개 → {self.unmatched_escalation_model} 재분석")
+
+        async def escalate(i):
+            async with semaphore:
+                return await self._analyze_single_unmatched_article(
+                    unmatched_articles[i], contract_type, contract_id,
+                    model=self.unmatched_escalation_model
+                )
+
+        escalated = await asyncio.gather(*(escalate(i) for i in targets), return_exceptions=True)
+        for i, result in zip(targets, escalated):
+            if isinstance(result, Exception):
+                logger.warning(f"[Unmatched] 제{unmatched_articles[i].get('number')}조 재분석 실패, 기존 결과 유지: {result}")
+            elif result.get('category') != 'unknown':
+                analysis_results[i] = result
+
+    def _unmatched_cache_key(self, article: Dict[str, Any], contract_type: str) -> Optional[str]:
+        """
+        매칭 안된 조항 분석 캐시 키 생성
+
+        분석 결과의 reasoning/recommendation은 조항 본문에 대한 설명이므로 의미 유사 계층은 쓰지 않고
+        정규화 제목+본문이 같은 조항끼리만 결과를 공유합니다.
+
+        Args:
+            article: 사용자 조항
+            contract_type: 계약 유형
+
+        Returns:
+            캐시 키 (캐시 비활성화 시 None)
+        """
+        if self.verification_cache is None:
+            return None
+
+        text = f"{article.get('title', '')}\n{article.get('text', '')}"
+        return self.verification_cache.make_key(f"unmatched:{self.unmatched_model}", contract_type, text, [])
+
+    async def _finalize_unmatched_analysis(
+        self,
+        article: Dict[str, Any],
+        parsed: Optional[Dict[str, Any]],
+        contract_type: str,
+        contract_id: str,
+        semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        """
+        조항별 분석 결과 확정 (배치 결과가 없으면 단건 분석, 실패 시 기본 결과)
+
+        Args:
+            article: 사용자 조항
+            parsed: 배치 분석에서 얻은 분류 결과 (없으면 None)
+            contract_type: 계약 유형
+            contract_id: 계약서 ID
+            semaphore: 동시 LLM 호출 수 제한
+
+        Returns:
+            분석 결과
+        """
+        try:
+            if parsed is not None:
+                result = {
+                    "user_article_no": article.get('number'),
+                    "user_article_title": article.get('title', ''),
+                    "user_article_text": article.get('text', ''),
+                    **parsed
+                }
+            else:
+                async with semaphore:
+                    result = await self._analyze_single_unmatched_article(
+                        article, contract_type, contract_id
+                    )
+
+            logger.info(f"[Unmatched] 제{article.get('number')}조: {result['category']} "
+                      f"(신뢰도: {result['confidence']:.2f}, 위험도: {result['risk_level']})")
+            return result
+
+        except Exception as e:
+            logger.error(f"[Unmatched] 제{article.get('number')}조 분석 실패: {e}")
+            # 실패 시 기본 결과
+            return {
+                "user_article_no": article.get('number'),
+                "user_article_title": article.get('title', ''),
+                "user_article_text": article.get('text', ''),
+                "category": "unknown",
+                "confidence": 0.0,
+                "reasoning": f"분석 중 오류 발생: {str(e)}",
+                "recommendation": "수동 검토 필요",
+                "risk_level": "medium"
+            }
+
+    async def _analyze_unmatched_batch(
+        self,
+        articles: List[Dict[str, Any]],
+        contract_type: str
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        매칭 안된 조항 여러 개를 한 번의 LLM 호출로 분류
+
+        Args:
+            articles: 사용자 조항 리스트
+            contract_type: 계약 유형
+
+        Returns:
+            조항별 분류 결과 (입력 순서, 응답에서 누락·손상된 조항은 None → 단건 분석으로 재시도)
+        """
+        prompt = self._build_batch_unmatched_analysis_prompt(articles, contract_type)
+
+        response = await self._create_chat_completion_async(
+            model=self.unmatched_model,
+            messages=[
+                {"role": "system", "content": "당신은 데이터 계약서 분석 전문가입니다."},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.1,
+            max_tokens=_UNMATCHED_MAX_TOKENS_PER_ARTICLE * len(articles),
+            response_format={"type": "json_object"}
+        )
+
+        parsed = self._parse_unmatched_llm_response(response.choices[0].message.content)
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(articles)
+        for entry in parsed.get('results') or []:
+            if not isinstance(entry, dict) or 'category' not in entry:
+                continue
+            index = entry.pop('index', None)
+            if isinstance(index, int) and 1 <= index <= len(articles) and results[index - 1] is None:
+                entry.setdefault('confidence', 0.5)
+                entry.setdefault('reasoning', '')
+                entry.setdefault('recommendation', '수동 검토 필요')
+                entry.setdefault('risk_level', 'medium')
+                results[index - 1] = entry
+
+        missing = sum(1 for result in results if result is None)
+        if missing:
+            logger.warning(f"[Unmatched] 배치 응답 누락 {missing}/{len(articles)}개 → 조항별 재분석")
+
+        return results
+
+    async def _analyze_single_unmatched_article(
+        self,
+        article: Dict[str, Any],
+        contract_type: str,
+        contract_id: str,
+        model: Optional[str] = None
     ) -> Dict[str, Any]:
-        """단일 매칭 안된 조항 분석"""
+        """단일 매칭 안된 조항 분석 (model이 없으면 unmatched_model 사용)"""
         
         article_no = article.get('number')
         article_title = article.get('title', '')
@@ -856,13 +1570,15 @@ class CompletenessCheckNode:
         )
         
         # LLM 호출
-        response = self.azure_client.chat.completions.create(
-            model="gpt-4o",
+        response = await self._create_chat_completion_async(
+            model=model or self.unmatched_model,
             messages=[
                 {"role": "system", "content": "당신은 데이터 계약서 분석 전문가입니다."},
                 {"role": "user", "content": prompt}
             ],
-            temperature=0.1
+            temperature=0.1,
+            max_tokens=_UNMATCHED_MAX_TOKENS_PER_ARTICLE,
+            response_format={"type": "json_object"}
         )
         
         # 응답 파싱
@@ -894,26 +1610,7 @@ class CompletenessCheckNode:
 **분석 목적**: 
 이 조항이 표준계약서에 없는 이유를 파악하고, 사용자에게 적절한 가이드를 제공합니다.
 
-**분류 기준**:
-
-1. **additional (추가 조항)**: 
-   - 표준계약서에는 없지만 사용자가 의도적으로 추가한 조항
-   - 특수한 요구사항이나 추가 의무사항
-   - 예: "데이터 품질 보증", "정기 보고 의무", "감사 협조", "특수 보안 요구사항"
-   - **판단 기준**: 내용이 계약 이행에 도움이 되는가?
-
-2. **modified (변형 조항)**: 
-   - 표준계약서의 특정 조항과 내용은 유사하지만 제목/구조가 달라서 자동 매칭 실패
-   - 예: 표준 "제3조(데이터 제공 범위 및 방식)" → 사용자 "제3조(제공 데이터의 범위)"
-   - **판단 기준**: 표준 조항의 일부 내용이 누락되었을 가능성이 있는가?
-
-3. **irrelevant (불필요 조항)**: 
-   - 계약 내용과 직접 관련 없는 형식적 요소
-   - 예: 목차, 부록, 서식, 일반적인 법률 조항(관할법원, 준거법)
-   - **판단 기준**: 계약 이행에 실질적 영향이 없는가?
-
-**응답 형식 (JSON):**
-```json
+{_UNMATCHED_CATEGORY_GUIDE}**응답 형식 (JSON):**
 {{
   "category": "additional|modified|irrelevant",
   "confidence": 0.0-1.0,
@@ -921,27 +1618,51 @@ class CompletenessCheckNode:
   "recommendation": "권장 조치 (1-2문장)",
   "risk_level": "low|medium|high"
 }}
-```
 
-**위험도 기준:**
-- **high**: 중요한 표준 조항이 변형되어 필수 내용이 누락되었을 가능성
-- **medium**: 검토가 필요한 추가 조항 또는 변형 조항
-- **low**: 문제없는 추가 조항 또는 불필요한 조항
+{_UNMATCHED_RISK_GUIDE}"""
+    
+    def _build_batch_unmatched_analysis_prompt(
+        self,
+        articles: List[Dict[str, Any]],
+        contract_type: str
+    ) -> str:
+        """매칭 안된 조항 일괄 분석 프롬프트 생성 (분류 기준은 한 번만 포함)"""
 
-**중요**: 
-- "additional"은 표준에 없는 **새로운** 내용
-- "modified"는 표준에 있는 조항의 **변형**
-- "irrelevant"는 계약과 **무관**한 내용
-"""
+        article_blocks = "\n\n".join(
+            f"[{index}] **제{article.get('number')}조 ({article.get('title', '')})**\n{article.get('text', '')}"
+            for index, article in enumerate(articles, 1)
+        )
+
+        return f"""
+다음은 {contract_type} 유형의 사용자 계약서에서 표준계약서와 매칭되지 않은 조항 {len(articles)}개입니다.
+
+{article_blocks}
+
+**분석 목적**: 
+각 조항이 표준계약서에 없는 이유를 파악하고, 사용자에게 적절한 가이드를 제공합니다.
+
+{_UNMATCHED_CATEGORY_GUIDE}**응답 형식 (JSON):**
+모든 조항을 빠짐없이 분석하고, index에는 조항 앞의 [번호]를 그대로 적으세요.
+{{
+  "results": [
+    {{
+      "index": 1,
+      "category": "additional|modified|irrelevant",
+      "confidence": 0.0-1.0,
+      "reasoning": "분류 근거 (1-2문장)",
+      "recommendation": "권장 조치 (1-2문장)",
+      "risk_level": "low|medium|high"
+    }}
+  ]
+}}
+
+{_UNMATCHED_RISK_GUIDE}"""
     
     def _parse_unmatched_llm_response(self, content: str) -> Dict[str, Any]:
         """LLM 응답 파싱"""
-        import json
-        import re
-        
         try:
             # JSON 블록 추출
-            json_match = re.search(r'```json\s*(\{.*?\})\s*```', content, re.DOTALL)
+            json_match = _JSON_BLOCK_PATTERN.search(content)
             if json_match:
                 json_str = json_match.group(1)
                 parsed = json.loads(json_str)
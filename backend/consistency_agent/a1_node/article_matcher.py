@@ -6,6 +6,7 @@ ArticleMatcher - 대응 조항 검색 (멀티벡터 방식)
 import logging
 import re
 import math
+import threading
 from typing import Dict, Any, List, Optional
 from collections import defaultdict, Counter
 from openai import AzureOpenAI
@@ -54,6 +55,14 @@ class ArticleMatcher:
         # HybridSearcher 인스턴스 (계약 유형별)
         self.searchers = {}
         self.embedding_loader = EmbeddingLoader()
+
+        # 계약서별 저장 임베딩 (contract_id → {article_no: 조문 임베딩})
+        # 조항별 검색이 스레드에서 동시에 실행되므로 락으로 보호
+        self._article_embedding_maps: Dict[str, Dict[Any, Dict[str, Any]]] = {}
+        self._article_embedding_lock = threading.Lock()
+
+        # 표준 청크 ID → FAISS 인덱스 위치 (contract_type별, 역방향 검색용)
+        self._chunk_id_index_maps: Dict[str, Dict[str, int]] = {}
         
         logger.info(f"ArticleMatcher 초기화 완료 (match_threshold={similarity_threshold}, special_threshold={special_threshold})")
     
@@ -96,7 +105,8 @@ class ArticleMatcher:
                 "matched": bool,
                 "matched_articles": List[Dict],  # 매칭된 조 목록 (정렬됨, 여러 개 가능)
                 "sub_item_results": List[Dict],  # 하위항목별 결과
-                "is_special": bool
+                "is_special": bool,
+                "article_embedding": Optional[List[float]]  # 저장된 하위항목 임베딩 평균
             }
         """
         user_article_no = user_article.get('number')
@@ -105,7 +115,7 @@ class ArticleMatcher:
         logger.info(f"조항 매칭 시작: 제{user_article_no}조 ({user_article_title})")
 
         # 멀티벡터 검색 (가중치 전달)
-        matched_articles, sub_item_results = self._search_with_sub_items(
+        matched_articles, sub_item_results, article_embedding = self._search_with_sub_items(
             user_article,
             contract_type,
             top_k,
@@ -121,19 +131,22 @@ class ArticleMatcher:
                 "matched": False,
                 "matched_articles": [],
                 "sub_item_results": sub_item_results,
-                "is_special": False
+                "is_special": False,
+                "article_embedding": article_embedding
             }
 
         # 매칭 결과 로깅
         logger.info(f"  매칭 완료: {len(matched_articles)}개 조")
-        for i, article in enumerate(matched_articles, 1):
-            logger.info(f"    {i}. {article['parent_id']}: {article['score']:.3f} (하위항목 {article['num_sub_items']}개)")
+        if logger.isEnabledFor(logging.INFO):
+            for i, article in enumerate(matched_articles, 1):
+                logger.info(f"    {i}. {article['parent_id']}: {article['score']:.3f} (하위항목 {article['num_sub_items']}개)")
 
         return {
             "matched": True,
             "matched_articles": matched_articles,  # 정렬된 모든 매칭 조
             "sub_item_results": sub_item_results,  # 하위항목별 결과
-            "is_special": False
+            "is_special": False,
+            "article_embedding": article_embedding  # 하위항목 임베딩 평균 (검증 캐시 조회용)
         }
     
     def _search_with_sub_items(
@@ -145,7 +158,7 @@ class ArticleMatcher:
         text_weight: float = 0.7,
         title_weight: float = 0.3,
         dense_weight: float = 0.85
-    ) -> tuple[List[Dict], List[Dict]]:
+    ) -> tuple[List[Dict], List[Dict], Optional[List[float]]]:
         """
         사용자 조항의 각 하위항목으로 검색 (멀티매칭 방식)
 
@@ -160,9 +173,10 @@ class ArticleMatcher:
             dense_weight: 시멘틱 가중치 (기본값: 0.85)
 
         Returns:
-            (article_scores, sub_item_results)
+            (article_scores, sub_item_results, article_embedding)
             - article_scores: 조 단위 최종 결과 (하위항목별 결과 집계)
             - sub_item_results: 하위항목별 매칭 결과 (각 하위항목당 여러 조 포함 가능)
+            - article_embedding: DB에 저장된 하위항목 임베딩 평균 (없으면 None)
         """
         content_items = user_article.get('content', [])
         article_title = user_article.get('title', '')
@@ -175,16 +189,18 @@ class ArticleMatcher:
                 content_items = [article_text]
             else:
                 logger.warning("  하위항목이 없고 text도 없습니다")
-                return [], []
+                return [], [], None
         
         # 하위항목별 매칭 결과
         sub_item_results = []
+        sub_item_embeddings = []
 
         article_no = self._safe_int(user_article.get('number'))
         stored_article_embedding = None
         title_embedding_vector = None
         if contract_id and article_no is not None:
-            stored_article_embedding = self.embedding_loader.load_article_embedding(contract_id, article_no)
+            article_embedding_map = self._get_article_embedding_map(contract_id) or {}
+            stored_article_embedding = article_embedding_map.get(article_no)
             if stored_article_embedding:
                 title_embedding_vector = stored_article_embedding.get('title_embedding')
 
@@ -202,6 +218,8 @@ class ArticleMatcher:
             sub_embedding_vector = None
             if stored_article_embedding:
                 sub_embedding_vector = self._get_sub_item_embedding(stored_article_embedding, idx)
+                if sub_embedding_vector is not None:
+                    sub_item_embeddings.append(sub_embedding_vector)
 
 
             # 하이브리드 검색 수행 (top-1 청크, 가중치 전달)
@@ -235,16 +253,22 @@ class ArticleMatcher:
 
                 # 로깅
                 logger.info(f"      하위항목 {idx}: {len(matched_articles)}개 조 매칭")
-                for article in matched_articles:
-                    logger.info(f"         → {article['parent_id']}: {article['score']:.3f}")
+                if logger.isEnabledFor(logging.INFO):
+                    for article in matched_articles:
+                        logger.info(f"         → {article['parent_id']}: {article['score']:.3f}")
         
+        article_embedding = None
+        if sub_item_embeddings:
+            import numpy as np
+            article_embedding = np.mean(np.asarray(sub_item_embeddings, dtype=np.float32), axis=0).tolist()
+
         if not sub_item_results:
-            return [], []
+            return [], [], article_embedding
         
         # 하위항목별 결과를 조 단위로 집계
         article_scores = self._aggregate_sub_item_results(sub_item_results)
         
-        return article_scores, sub_item_results
+        return article_scores, sub_item_results, article_embedding
     
     def _normalize_sub_item(self, content: str) -> str:
         """
@@ -321,6 +345,89 @@ class ArticleMatcher:
                 return sub_item.get('text_embedding')
         return None
 
+    def _get_article_embedding_map(self, contract_id: str) -> Optional[Dict[Any, Dict[str, Any]]]:
+        """
+        계약서의 조문별 저장 임베딩 조회 (계약서당 DB 조회 1회)
+
+        조항마다 parsed_data 전체를 다시 읽지 않도록 첫 조회 결과를 article_no 기준으로 색인해 둡니다.
+
+        Args:
+            contract_id: 계약서 ID
+
+        Returns:
+            {article_no: 조문 임베딩 항목}, 임베딩 데이터가 없으면 None (캐시하지 않음)
+        """
+        with self._article_embedding_lock:
+            cached = self._article_embedding_maps.get(contract_id)
+            if cached is not None:
+                return cached
+
+            embeddings = self.embedding_loader.load_embeddings(contract_id)
+            if not embeddings:
+                return None
+
+            article_embedding_map = {}
+            for entry in embeddings.get("article_embeddings", []):
+                # 같은 조 번호가 여러 번 있으면 첫 항목 사용 (EmbeddingLoader.load_article_embedding과 동일)
+                article_embedding_map.setdefault(entry.get("article_no"), entry)
+
+            self._article_embedding_maps[contract_id] = article_embedding_map
+            return article_embedding_map
+
+    def prefetch_query_embeddings(self, user_articles: List[Dict[str, Any]], contract_id: str = None) -> int:
+        """
+        저장 임베딩이 없는 검색 쿼리를 한 번의 배치 요청으로 미리 임베딩
+
+        _search_with_sub_items()는 저장 임베딩이 없는 하위항목/제목 쿼리를 검색 시점에
+        한 건씩 임베딩합니다. 해당 쿼리들을 모아 EmbeddingService 캐시에 미리 채워두면
+        이후 검색의 임베딩 요청은 모두 캐시에서 처리됩니다.
+
+        Args:
+            user_articles: 사용자 조항 리스트
+            contract_id: 계약서 ID (저장 임베딩 조회 및 토큰 로깅용)
+
+        Returns:
+            배치로 임베딩한 쿼리 수
+        """
+        article_embedding_map = (self._get_article_embedding_map(contract_id) if contract_id else None) or {}
+
+        queries = {}  # 순서 유지 + 중복 제거
+        for user_article in user_articles:
+            article_title = user_article.get('title', '')
+            content_items = user_article.get('content', []) or (
+                [user_article['text']] if user_article.get('text') else []
+            )
+
+            article_no = self._safe_int(user_article.get('number'))
+            stored = article_embedding_map.get(article_no) if article_no is not None else None
+
+            has_title_query = False
+            for idx, sub_item in enumerate(content_items, 1):
+                normalized = self._normalize_sub_item(sub_item)
+                if not normalized:
+                    continue
+                has_title_query = True
+                if not stored or self._get_sub_item_embedding(stored, idx) is None:
+                    queries.setdefault(normalized, None)
+
+            title_query = str(article_title).strip()
+            if has_title_query and title_query and not (stored and stored.get('title_embedding')):
+                queries.setdefault(article_title, None)
+
+        if not queries:
+            return 0
+
+        from backend.shared.services import get_embedding_service
+
+        get_embedding_service().get_embeddings_batch(
+            list(queries),
+            contract_id=contract_id,
+            component="consistency_agent",
+            purpose="a1_query_prefetch"
+        )
+        logger.info(f"  검색 쿼리 임베딩 사전 생성: {len(queries)}개")
+        return len(queries)
+
     @staticmethod
     def _safe_int(value: Any) -> Optional[int]:
         try:
@@ -589,15 +696,17 @@ class ArticleMatcher:
         if len(filtered_scores) < len(article_scores):
             logger.info(f"    임계값 필터링: {len(article_scores)}개 → {len(filtered_scores)}개 (0.5 미만 제거)")
         
-        for i, article in enumerate(filtered_scores, 1):
-            # Dense/Sparse 평균 점수 계산
-            chunks = article['matched_chunks']
-            if chunks:
-                avg_dense = sum(c.get('dense_score', 0.0) for c in chunks) / len(chunks)
-                avg_sparse = sum(c.get('sparse_score', 0.0) for c in chunks) / len(chunks)
-                logger.info(f"      {i}. {article['parent_id']}: {article['score']:.3f} (D:{avg_dense:.3f}, S:{avg_sparse:.3f}, 하위항목:{article['num_sub_items']}개)")
-            else:
-                logger.debug(f"      {i}. {article['parent_id']}: {article['score']:.3f} (하위항목: {article['num_sub_items']}개)")
+        # 로그 전용 Dense/Sparse 평균 계산이므로 INFO 비활성 시 생략
+        if logger.isEnabledFor(logging.INFO):
+            for i, article in enumerate(filtered_scores, 1):
+                # Dense/Sparse 평균 점수 계산
+                chunks = article['matched_chunks']
+                if chunks:
+                    avg_dense = sum(c.get('dense_score', 0.0) for c in chunks) / len(chunks)
+                    avg_sparse = sum(c.get('sparse_score', 0.0) for c in chunks) / len(chunks)
+                    logger.info(f"      {i}. {article['parent_id']}: {article['score']:.3f} (D:{avg_dense:.3f}, S:{avg_sparse:.3f}, 하위항목:{article['num_sub_items']}개)")
+                else:
+                    logger.debug(f"      {i}. {article['parent_id']}: {article['score']:.3f} (하위항목: {article['num_sub_items']}개)")
 
         return filtered_scores
 
@@ -731,14 +840,13 @@ class ArticleMatcher:
         logger.info(f"  사용자 조문 FAISS 인덱스 생성 중...")
         logger.info(f"    contract_id: {contract_id}")
         
-        # 먼저 전체 임베딩 데이터 확인
-        all_embeddings = self.embedding_loader.load_embeddings(contract_id)
-        if not all_embeddings:
+        # 먼저 전체 임베딩 데이터 확인 (계약서당 한 번만 DB 조회)
+        article_embedding_map = self._get_article_embedding_map(contract_id)
+        if article_embedding_map is None:
             logger.error(f"    ❌ 임베딩 데이터 전체가 없음!")
             return None, []
         
-        article_embeddings = all_embeddings.get("article_embeddings", [])
-        logger.info(f"    DB에 저장된 조문 임베딩: {len(article_embeddings)}개")
+        logger.info(f"    DB에 저장된 조문 임베딩: {len(article_embedding_map)}개")
         
         # 모든 하위항목 임베딩 수집
         embeddings_list = []
@@ -748,8 +856,8 @@ class ArticleMatcher:
             user_no = user_article.get('number')
             user_content = user_article.get('content', [])
             
-            # 임베딩 로드
-            stored_embedding = self.embedding_loader.load_article_embedding(contract_id, user_no)
+            # 임베딩 조회
+            stored_embedding = article_embedding_map.get(user_no)
             if not stored_embedding:
                 logger.warning(f"    제{user_no}조 임베딩 없음 - 건너뜀")
                 continue
@@ -805,24 +913,48 @@ class ArticleMatcher:
         Returns:
             매칭된 사용자 조문 리스트 (유사도 순 정렬, 조 단위)
         """
+        return self.find_matching_user_articles_batch(
+            [standard_article],
+            user_faiss_index,
+            embedding_map,
+            contract_type,
+            top_k=top_k
+        )[0]
+    
+    def find_matching_user_articles_batch(
+        self,
+        standard_articles: List[Dict[str, Any]],
+        user_faiss_index,
+        embedding_map: List[Dict],
+        contract_type: str,
+        top_k: int = 3
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        역방향 검색 일괄 수행: 모든 표준 조문의 청크를 한 번의 FAISS 검색으로 처리
+        
+        Args:
+            standard_articles: 표준 조문 정보 리스트 (find_matching_user_articles 참고)
+            user_faiss_index: 사용자 조문 FAISS 인덱스
+            embedding_map: 인덱스 → 조문 매핑
+            contract_type: 계약 유형 (FAISS 인덱스 로드용)
+            top_k: 조문별 반환할 최대 결과 개수 (조 단위)
+        
+        Returns:
+            표준 조문별 매칭된 사용자 조문 리스트 (입력 순서, 각 리스트는 유사도 순 정렬)
+        """
         import numpy as np
         
-        parent_id = standard_article.get('parent_id')
-        title = standard_article.get('title', '')
-        chunks = standard_article.get('chunks', [])
+        results: List[List[Dict[str, Any]]] = [[] for _ in standard_articles]
+        if not standard_articles:
+            return results
         
-        logger.info(f"    역방향 검색 시작: {parent_id} ({title})")
-        logger.info(f"      - 표준 청크 수: {len(chunks)}개")
+        logger.info(f"    역방향 검색 시작: 표준 조문 {len(standard_articles)}개")
         logger.info(f"      - FAISS 인덱스: {'있음' if user_faiss_index is not None else '없음'}")
         logger.info(f"      - embedding_map 크기: {len(embedding_map)}개")
         
-        if not chunks:
-            logger.warning(f"      청크가 없습니다")
-            return []
-        
         if user_faiss_index is None:
             logger.error(f"      FAISS 인덱스가 없습니다")
-            return []
+            return results
         
         # 표준 계약서 FAISS 인덱스 및 청크 로드
         standard_faiss_indexes = self.kb_loader.load_faiss_indexes(contract_type)
@@ -830,54 +962,67 @@ class ArticleMatcher:
         
         if not standard_faiss_indexes or not standard_chunks:
             logger.error(f"      표준 계약서 인덱스/청크 로드 실패: {contract_type}")
-            return []
+            return results
         
         # text 인덱스만 사용 (본문 검색)
         standard_faiss_text, _ = standard_faiss_indexes
         
-        # 청크 ID → 인덱스 매핑 생성
-        chunk_id_to_index = {chunk['id']: idx for idx, chunk in enumerate(standard_chunks)}
-        
-        # 사용자 조문별 점수 집계
-        user_article_scores = defaultdict(lambda: {
-            'scores': [],
-            'matched_chunks': [],
-            'user_article': None
-        })
+        # 청크 ID → 인덱스 매핑 (계약 유형별로 한 번만 생성)
+        chunk_id_to_index = self._chunk_id_index_maps.get(contract_type)
+        if chunk_id_to_index is None:
+            chunk_id_to_index = {chunk['id']: idx for idx, chunk in enumerate(standard_chunks)}
+            self._chunk_id_index_maps[contract_type] = chunk_id_to_index
         
-        # 각 표준 청크로 FAISS 검색
-        total_searches = 0
-        total_matches = 0
+        # 표준 청크 임베딩 수집 (FAISS 인덱스에서 복원, 조문 위치와 함께 기록)
+        query_owners = []  # [(표준 조문 위치, 청크), ...]
+        query_embeddings = []
         chunks_without_embedding = 0
         
-        for chunk in chunks:
-            chunk_id = chunk.get('id')
-            
-            # 청크 인덱스 찾기
-            chunk_index = chunk_id_to_index.get(chunk_id)
-            if chunk_index is None:
-                chunks_without_embedding += 1
-                logger.debug(f"      청크 인덱스 없음: {chunk_id}")
-                continue
-            
-            # FAISS 인덱스에서 임베딩 추출
-            try:
-                chunk_embedding = standard_faiss_text.reconstruct(chunk_index)
-            except Exception as e:
-                chunks_without_embedding += 1
-                logger.debug(f"      임베딩 추출 실패: {chunk_id}, {e}")
+        for position, standard_article in enumerate(standard_articles):
+            chunks = standard_article.get('chunks', [])
+            if not chunks:
+                logger.warning(f"      청크가 없습니다: {standard_article.get('parent_id')}")
                 continue
             
-            total_searches += 1
-            
-            # FAISS 검색 (Top-10 하위항목)
-            query_vector = np.array([chunk_embedding], dtype=np.float32)
-            distances, indices = user_faiss_index.search(query_vector, k=10)
-            
-            # 검색 결과 처리
-            chunk_matches = 0
-            for idx, distance in zip(indices[0], distances[0]):
-                if idx >= len(embedding_map):
+            for chunk in chunks:
+                chunk_id = chunk.get('id')
+                
+                # 청크 인덱스 찾기
+                chunk_index = chunk_id_to_index.get(chunk_id)
+                if chunk_index is None:
+                    chunks_without_embedding += 1
+                    logger.debug(f"      청크 인덱스 없음: {chunk_id}")
+                    continue
+                
+                # FAISS 인덱스에서 임베딩 추출
+                try:
+                    query_embeddings.append(standard_faiss_text.reconstruct(chunk_index))
+                    query_owners.append((position, chunk))
+                except Exception as e:
+                    chunks_without_embedding += 1
+                    logger.debug(f"      임베딩 추출 실패: {chunk_id}, {e}")
+        
+        if chunks_without_embedding > 0:
+            logger.warning(f"      임베딩 없는 청크: {chunks_without_embedding}개")
+        
+        if not query_owners:
+            return results
+        
+        # 모든 표준 청크를 한 번에 FAISS 검색 (청크당 Top-10 하위항목)
+        query_matrix = np.asarray(query_embeddings, dtype=np.float32)
+        distances, indices = user_faiss_index.search(query_matrix, k=10)
+        
+        # 표준 조문별 사용자 조문 점수 집계
+        article_scores = [
+            defaultdict(lambda: {'scores': [], 'matched_chunks': [], 'user_article': None})
+            for _ in standard_articles
+        ]
+        total_matches = 0
+        
+        for (position, chunk), chunk_indices, chunk_distances in zip(query_owners, indices, distances):
+            user_article_scores = article_scores[position]
+            for idx, distance in zip(chunk_indices, chunk_distances):
+                if idx < 0 or idx >= len(embedding_map):  # 결과가 k개 미만이면 FAISS가 -1로 채움
                     continue
                 
                 match_info = embedding_map[idx]
@@ -890,7 +1035,7 @@ class ArticleMatcher:
                 logger.debug(f"        청크 매칭: 제{user_no}조 하위{match_info['sub_item_index']} - 유사도 {similarity:.3f}")
                 
                 if similarity > 0.5:  # 임계값
-                    chunk_matches += 1
+                    total_matches += 1
                     user_article_scores[user_no]['scores'].append(similarity)
                     user_article_scores[user_no]['matched_chunks'].append({
                         'standard_chunk': chunk,
@@ -899,42 +1044,47 @@ class ArticleMatcher:
                         'similarity': similarity
                     })
                     user_article_scores[user_no]['user_article'] = user_article
-            
-            if chunk_matches > 0:
-                total_matches += chunk_matches
-                logger.debug(f"      청크 검색 완료: {chunk_matches}개 매칭")
         
-        if chunks_without_embedding > 0:
-            logger.warning(f"      임베딩 없는 청크: {chunks_without_embedding}개")
+        logger.info(f"      총 {len(query_owners)}개 청크 일괄 검색, {total_matches}개 매칭 발견")
         
-        logger.info(f"      총 {total_searches}개 청크 검색, {total_matches}개 매칭 발견")
+        for position, user_article_scores in enumerate(article_scores):
+            results[position] = self._rank_user_article_matches(user_article_scores, top_k)
         
+        return results
+    
+    @staticmethod
+    def _rank_user_article_matches(
+        user_article_scores: Dict[Any, Dict[str, Any]],
+        top_k: int
+    ) -> List[Dict[str, Any]]:
+        """
+        역방향 검색 점수를 사용자 조문 단위로 정리
+        
+        Args:
+            user_article_scores: 사용자 조문 번호 → {'scores', 'matched_chunks', 'user_article'}
+            top_k: 반환할 최대 결과 개수
+        
+        Returns:
+            유사도(최고 점수) 순 상위 top_k개 사용자 조문
+        """
         # 조별 평균 점수 계산 및 정렬
         results = []
-        for user_no, data in user_article_scores.items():
+        for data in user_article_scores.values():
             if not data['scores']:
                 continue
             
-            avg_score = sum(data['scores']) / len(data['scores'])
-            max_score = max(data['scores'])
-            
             results.append({
                 'user_article': data['user_article'],
-                'similarity': max_score,
-                'avg_similarity': avg_score,
+                'similarity': max(data['scores']),
+                'avg_similarity': sum(data['scores']) / len(data['scores']),
                 'num_matches': len(data['scores']),
                 'matched_chunks': data['matched_chunks']
             })
         
-        # 유사도 순 정렬
+        # 유사도 순 정렬 후 Top-K 반환
         results.sort(key=lambda x: x['similarity'], reverse=True)
         
-        # Top-K 반환
-        top_results = results[:top_k]
-        
-        logger.debug(f"      검색 완료: {len(top_results)}개 사용자 조문")
-        
-        return top_results
+        return results[:top_k]
     
     def _calculate_cosine_similarity(
         self,
@@ -4,9 +4,13 @@ MatchingVerifier - LLM 기반 조항 매칭 검증
 검색 엔진으로 추출된 후보 조항들 중 실제로 매칭되는 조항을 LLM으로 검증
 """
 
+import asyncio
+import json
 import logging
-from typing import Dict, Any, List, Optional
-from openai import AzureOpenAI
+from typing import Dict, Any, List, Optional, Tuple
+from openai import AzureOpenAI, AsyncAzureOpenAI
+
+from .verification_cache import VerificationCache
 
 logger = logging.getLogger(__name__)
 
@@ -20,17 +24,95 @@ class MatchingVerifier:
     2. 선택된 조항들에 대한 매칭 여부 최종 검증 (LLM)
     """
 
-    def __init__(self, azure_client: AzureOpenAI, model: str = "gpt-4o", knowledge_base_loader=None):
+    SELECTION_SYSTEM_PROMPT = """당신은 데이터 계약서 전문가입니다. 
+
+역할: 사용자 계약서 조항과 표준계약서 조항 간의 관련성을 판단합니다.
+
+중요: 
+- 내용의 충실도나 완성도는 평가하지 마세요 (다음 단계에서 수행)
+- 단순히 "같은 주제를 다루는가?"만 판단하세요
+- 의심스러우면 관련있음으로 판단하세요 (보수적 접근)
+- 명백히 다른 주제만 제외하세요"""
+
+    # 일괄 검증 프롬프트에서 레코드(사용자 조항 단위)를 구분하는 문자열
+    RECORD_SEPARATOR = "---RECORD|||SEP|||BOUNDARY---"
+
+    CONTRACT_TYPE_NAMES = {
+        "provide": "데이터 제공 계약",
+        "create": "데이터 생성 계약",
+        "process": "데이터 가공 계약",
+        "brokerage_provider": "데이터 중개 계약 (제공자용)",
+        "brokerage_user": "데이터 중개 계약 (이용자용)"
+    }
+
+    SELECTION_CRITERIA = """**매칭 판단 기준** (관련성만 판단, 내용 충실도는 평가하지 않음):
+
+1. **같은 주제를 다루는가?**
+   - 사용자 조항과 표준 조항이 동일하거나 유사한 법적 사항을 규율하는가?
+   - 부분적으로라도 겹치는 내용이 있으면 관련있음으로 판단
+
+2. **여러 조항 매칭 가능**
+   - 사용자 조항 하나가 표준계약서의 여러 조항에 걸쳐 있을 수 있음
+   - 관련있는 조항은 모두 선택 (1개 이상)
+
+3. **제외 기준**
+   - 키워드만 유사하고 법적 맥락이 완전히 다른 경우
+   - 예: "데이터"라는 단어만 공통이고 실제 규율 대상이 다름
+
+**조항 유형별 판단 가이드**:
+
+**[용어 정의 조항]**
+- 용어의 의미/범위를 명시적으로 정립하는 내용이 있어야 함
+- 표현 형식: "~란", "~는", "~를 의미한다", "~을 말한다" 등 다양
+- 계약 전체에서 반복 참조되는 핵심 개념의 범위를 명시
+- 제외: 계약 목적, 배경, 체결 경위, 당사자 소개 등
+
+**[권리/의무 조항]**
+- 당사자의 권리나 의무를 규정하는 조항
+- "~할 수 있다", "~해야 한다", "~하여서는 아니 된다" 등
+- 부분적 권리/의무 포함도 관련있음으로 판단
+
+**[절차/방법 조항]**
+- 특정 행위의 절차, 방법, 기한을 규정
+- 동일한 절차를 다루면 관련있음 (세부사항 차이는 무시)
+
+**[책임/제재 조항]**
+- 위반 시 책임, 손해배상, 계약 해지 등
+- 동일한 위반 사항에 대한 제재면 관련있음
+
+**[기타 조항]**
+- 계약 기간, 비밀유지, 분쟁 해결 등
+- 주제가 명확히 일치하면 관련있음
+
+**판단 원칙**:
+- 내용이 100% 일치할 필요 없음 (충실도는 A3에서 평가)
+- 부분적으로라도 관련있으면 선택
+- 의심스러우면 선택 (False Negative 방지)
+- 명백히 다른 주제만 제외"""
+
+    def __init__(
+        self,
+        azure_client: AzureOpenAI,
+        model: str = "gpt-4o",
+        knowledge_base_loader=None,
+        async_azure_client: Optional[AsyncAzureOpenAI] = None,
+        cache: Optional[VerificationCache] = None
+    ):
         """
         Args:
             azure_client: Azure OpenAI 클라이언트
             model: 사용할 모델명 (기본: gpt-4o)
             knowledge_base_loader: KnowledgeBaseLoader 인스턴스 (참조 로드용)
+            async_azure_client: 비동기 Azure OpenAI 클라이언트 (없으면 동기 클라이언트를 스레드에서 호출)
+            cache: LLM 검증 결과 캐시 (None이면 캐시 미사용)
         """
         self.azure_client = azure_client
+        self.async_azure_client = async_azure_client
+        self.cache = cache
         self.model = model
         self.kb_loader = knowledge_base_loader
         self.all_chunks = []  # 참조 로드용 전체 청크 캐시
+        self._chunks_by_global_id: Dict[str, Dict[str, Any]] = {}  # global_id → 청크 (참조 조회용)
 
         logger.info(f"MatchingVerifier 초기화 완료 (model={model})")
 
@@ -39,7 +121,8 @@ class MatchingVerifier:
         user_article: Dict[str, Any],
         candidate_articles: List[Dict[str, Any]],
         contract_type: str,
-        top_k: int = 5
+        top_k: int = 5,
+        user_embedding: Optional[Any] = None
     ) -> Dict[str, Any]:
         """
         후보 조항들에 대한 매칭 검증
@@ -60,6 +143,7 @@ class MatchingVerifier:
                 ]
             contract_type: 계약 유형
             top_k: 최종 선택할 조항 개수 (기본: 5)
+            user_embedding: 사용자 조항 임베딩 (의미 유사 캐시 조회용, 선택)
 
         Returns:
             {
@@ -73,18 +157,15 @@ class MatchingVerifier:
         """
         if not candidate_articles:
             logger.warning(f"  후보 조항이 없습니다")
-            return {
-                "matched": False,
-                "selected_articles": [],
-                "verification_details": [],
-                "prompt_tokens": 0,
-                "completion_tokens": 0,
-                "total_tokens": 0
-            }
+            return self._build_verification_result([], {"selected_articles": []})
 
         # Top-K 후보 선정
         top_candidates = candidate_articles[:top_k]
 
+        cached = self._get_cached_matching(user_article, top_candidates, contract_type, user_embedding)
+        if cached is not None:
+            return cached
+
         logger.info(f"  매칭 검증 시작: 후보 {len(top_candidates)}개 조항")
 
         # 1단계: 관련 조항 선택
@@ -94,31 +175,348 @@ class MatchingVerifier:
             contract_type
         )
 
+        result = self._build_verification_result(top_candidates, selection_result)
+        self._store_cached_matching(user_article, top_candidates, contract_type, user_embedding, result)
+        return result
+
+    async def verify_matching_async(
+        self,
+        user_article: Dict[str, Any],
+        candidate_articles: List[Dict[str, Any]],
+        contract_type: str,
+        top_k: int = 5,
+        user_embedding: Optional[Any] = None
+    ) -> Dict[str, Any]:
+        """
+        후보 조항들에 대한 매칭 검증 (비동기)
+
+        verify_matching()과 동일한 결과를 반환하며, LLM 호출만 비동기로 수행합니다.
+        """
+        if not candidate_articles:
+            logger.warning(f"  후보 조항이 없습니다")
+            return self._build_verification_result([], {"selected_articles": []})
+
+        top_candidates = candidate_articles[:top_k]
+
+        cached = self._get_cached_matching(user_article, top_candidates, contract_type, user_embedding)
+        if cached is not None:
+            return cached
+
+        logger.info(f"  매칭 검증 시작: 후보 {len(top_candidates)}개 조항")
+
+        selection_result = await self._select_relevant_articles_async(
+            user_article,
+            top_candidates,
+            contract_type
+        )
+
+        result = self._build_verification_result(top_candidates, selection_result)
+        self._store_cached_matching(user_article, top_candidates, contract_type, user_embedding, result)
+        return result
+
+    def verify_matching_batch(
+        self,
+        items: List[Tuple[Dict[str, Any], List[Dict[str, Any]]]],
+        contract_type: str,
+        top_k: int = 5,
+        user_embeddings: Optional[List[Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 사용자 조항의 매칭 검증을 한 번의 LLM 호출로 수행
+
+        시스템 프롬프트와 판단 기준을 레코드 간에 공유하며, 응답 블록 수가
+        레코드 수와 다르면 조항별 개별 검증으로 재시도합니다. 캐시에 있는 조항은
+        LLM에 보내지 않습니다.
+
+        Args:
+            items: (사용자 조항, 후보 표준계약서 조항 목록) 튜플 리스트
+            contract_type: 계약 유형
+            top_k: 조항별 LLM에 제시할 후보 개수 (기본: 5)
+            user_embeddings: items 순서의 사용자 조항 임베딩 (의미 유사 캐시 조회용, 선택)
+
+        Returns:
+            items 순서대로 verify_matching() 반환 형식의 딕셔너리 리스트
+        """
+        user_embeddings = user_embeddings or [None] * len(items)
+        results, pending = self._prepare_matching_batch(items, contract_type, top_k, user_embeddings)
+
+        if len(pending) <= 1:
+            for i in pending:
+                results[i] = self.verify_matching(items[i][0], items[i][1], contract_type, top_k, user_embeddings[i])
+            return results
+
+        batch = [(items[i][0], items[i][1][:top_k]) for i in pending]
+        logger.info(f"  일괄 매칭 검증 시작: {len(batch)}개 조항")
+
+        selection_results = None
+        try:
+            response = self.azure_client.chat.completions.create(
+                model=self.model,
+                messages=self._build_batch_selection_messages(batch, contract_type),
+                temperature=0.2,
+                max_tokens=500 * len(batch)
+            )
+            selection_results = self._split_batch_selection_completion(response, batch)
+        except Exception as e:
+            logger.error(f"    일괄 조항 선택 실패: {e}")
+
+        if selection_results is None:
+            logger.warning(f"    일괄 응답 분할 실패, 조항별 개별 검증으로 재시도")
+            for i in pending:
+                results[i] = self.verify_matching(items[i][0], items[i][1], contract_type, top_k, user_embeddings[i])
+            return results
+
+        self._fill_matching_batch(results, pending, batch, selection_results, contract_type, user_embeddings)
+        return results
+
+    async def verify_matching_batch_async(
+        self,
+        items: List[Tuple[Dict[str, Any], List[Dict[str, Any]]]],
+        contract_type: str,
+        top_k: int = 5,
+        user_embeddings: Optional[List[Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 사용자 조항의 매칭 검증을 한 번의 LLM 호출로 수행 (비동기)
+
+        verify_matching_batch()와 동일한 결과를 반환하며, 개별 검증 재시도는 동시에 수행합니다.
+        """
+        user_embeddings = user_embeddings or [None] * len(items)
+        results, pending = self._prepare_matching_batch(items, contract_type, top_k, user_embeddings)
+
+        if len(pending) <= 1:
+            for i in pending:
+                results[i] = await self.verify_matching_async(
+                    items[i][0], items[i][1], contract_type, top_k, user_embeddings[i]
+                )
+            return results
+
+        batch = [(items[i][0], items[i][1][:top_k]) for i in pending]
+        logger.info(f"  일괄 매칭 검증 시작: {len(batch)}개 조항")
+
+        selection_results = None
+        try:
+            response = await self._create_chat_completion_async(
+                model=self.model,
+                messages=self._build_batch_selection_messages(batch, contract_type),
+                temperature=0.2,
+                max_tokens=500 * len(batch)
+            )
+            selection_results = self._split_batch_selection_completion(response, batch)
+        except Exception as e:
+            logger.error(f"    일괄 조항 선택 실패: {e}")
+
+        if selection_results is None:
+            logger.warning(f"    일괄 응답 분할 실패, 조항별 개별 검증으로 재시도")
+            retried = await asyncio.gather(*(
+                self.verify_matching_async(items[i][0], items[i][1], contract_type, top_k, user_embeddings[i])
+                for i in pending
+            ))
+            for i, result in zip(pending, retried):
+                results[i] = result
+            return results
+
+        self._fill_matching_batch(results, pending, batch, selection_results, contract_type, user_embeddings)
+        return results
+
+    def _prepare_matching_batch(
+        self,
+        items: List[Tuple[Dict[str, Any], List[Dict[str, Any]]]],
+        contract_type: str,
+        top_k: int,
+        user_embeddings: List[Any]
+    ) -> Tuple[List[Optional[Dict[str, Any]]], List[int]]:
+        """
+        일괄 검증 전처리: 후보가 없는 조항과 캐시 히트 조항의 결과를 먼저 채움
+
+        Returns:
+            (items 순서의 결과 리스트, LLM 검증이 필요한 인덱스 리스트)
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        pending = []
+
+        for i, (user_article, candidates) in enumerate(items):
+            if not candidates:
+                results[i] = self._build_verification_result([], {"selected_articles": []})
+                continue
+
+            cached = self._get_cached_matching(user_article, candidates[:top_k], contract_type, user_embeddings[i])
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.append(i)
+
+        return results, pending
+
+    def _fill_matching_batch(
+        self,
+        results: List[Optional[Dict[str, Any]]],
+        pending: List[int],
+        batch: List[Tuple[Dict[str, Any], List[Dict[str, Any]]]],
+        selection_results: List[Dict[str, Any]],
+        contract_type: str,
+        user_embeddings: List[Any]
+    ):
+        """일괄 조항 선택 결과를 매칭 검증 결과로 변환하여 results에 채우고 캐시에 저장"""
+        for i, (user_article, top_candidates), selection_result in zip(pending, batch, selection_results):
+            result = self._build_verification_result(top_candidates, selection_result)
+            self._store_cached_matching(user_article, top_candidates, contract_type, user_embeddings[i], result)
+            results[i] = result
+
+    def _matching_cache_keys(
+        self,
+        user_article: Dict[str, Any],
+        top_candidates: List[Dict[str, Any]],
+        contract_type: str
+    ) -> Tuple[str, str]:
+        """매칭 검증 캐시 키와 의미 유사 버킷 생성 (사용자 조항 제목/본문 + 후보 조항 ID)"""
+        kind = f"matching:{self.model}"
+        text = f"{user_article.get('title', '')}\n{self._format_user_article(user_article)}"
+        candidate_ids = [candidate['parent_id'] for candidate in top_candidates]
+        return (
+            VerificationCache.make_key(kind, contract_type, text, candidate_ids),
+            VerificationCache.make_bucket(kind, contract_type, candidate_ids)
+        )
+
+    def _get_cached_matching(
+        self,
+        user_article: Dict[str, Any],
+        top_candidates: List[Dict[str, Any]],
+        contract_type: str,
+        user_embedding: Optional[Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        매칭 검증 캐시 조회 (캐시 미사용 시 None)
+
+        캐시에는 LLM이 선택한 조항 ID만 저장되어 있으므로, 점수/하위항목 등 상세 정보는
+        이번 호출의 후보로 다시 구성합니다.
+        """
+        if self.cache is None:
+            return None
+
+        key, bucket = self._matching_cache_keys(user_article, top_candidates, contract_type)
+        cached = self.cache.get(key, bucket, user_embedding)
+        if cached is None:
+            return None
+
+        logger.info(f"  매칭 검증 캐시 히트: 제{user_article.get('number')}조")
+        return self._build_verification_result(
+            top_candidates,
+            {"selected_articles": cached.get('selected_articles', [])}
+        )
+
+    def _store_cached_matching(
+        self,
+        user_article: Dict[str, Any],
+        top_candidates: List[Dict[str, Any]],
+        contract_type: str,
+        user_embedding: Optional[Any],
+        result: Dict[str, Any]
+    ):
+        """
+        매칭 검증 결과 캐시 저장 (LLM 호출 실패로 인한 폴백 결과는 저장하지 않음)
+
+        후보 점수/하위항목은 호출마다 달라지므로 LLM 판단인 선택 조항 ID만 저장합니다.
+        """
+        if self.cache is None or not result.get('prompt_tokens'):
+            return
+
+        key, bucket = self._matching_cache_keys(user_article, top_candidates, contract_type)
+        self.cache.set(key, {"selected_articles": result.get('selected_articles', [])}, bucket, user_embedding)
+
+    def _forward_cache_key(
+        self,
+        messages: List[Dict[str, str]],
+        parent_id: str,
+        contract_type: str
+    ) -> Optional[str]:
+        """역방향 검증 캐시 키 생성 (후보 사용자 조문이 모두 포함된 프롬프트 기준, 캐시 미사용 시 None)"""
+        if self.cache is None:
+            return None
+        return VerificationCache.make_key(
+            f"forward:{self.model}", contract_type, messages[-1]["content"], [parent_id]
+        )
+
+    def _missing_analysis_cache_key(
+        self,
+        standard_article: Dict[str, Any],
+        contract_type: str
+    ) -> Optional[str]:
+        """후보 없는 누락 분석 캐시 키 생성 (표준 조문만으로 결정되므로 계약서 간 공유, 캐시 미사용 시 None)"""
+        if self.cache is None:
+            return None
+        parent_id = standard_article.get('parent_id', '')
+        return VerificationCache.make_key(
+            f"missing_analysis:{self.model}", contract_type, standard_article.get('title', ''), [parent_id]
+        )
+
+    def _get_cached(self, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """정확 일치 캐시 조회 (키가 없으면 None)"""
+        if self.cache is None or key is None:
+            return None
+        return self.cache.get(key)
+
+    def _store_cached(
+        self,
+        key: Optional[str],
+        result: Dict[str, Any],
+        bucket: Optional[str] = None,
+        embedding: Optional[Any] = None
+    ):
+        """LLM 검증 결과 캐시 저장 (토큰 사용량이 없는 폴백 결과는 저장하지 않음)"""
+        if self.cache is None or key is None or not result.get('prompt_tokens'):
+            return
+        self.cache.set(key, self._without_token_usage(result), bucket, embedding)
+
+    @staticmethod
+    def _without_token_usage(result: Dict[str, Any]) -> Dict[str, Any]:
+        """캐시 저장용 결과 (캐시 히트 시에는 LLM 토큰을 사용하지 않으므로 0으로 기록)"""
+        cached = {**result, "prompt_tokens": 0, "completion_tokens": 0}
+        if "total_tokens" in cached:
+            cached["total_tokens"] = 0
+        return cached
+
+    def _build_verification_result(
+        self,
+        top_candidates: List[Dict[str, Any]],
+        selection_result: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        조항 선택 결과로 매칭 검증 결과 생성
+
+        Args:
+            top_candidates: LLM에 제시한 후보 조항들
+            selection_result: _select_relevant_articles() 결과
+
+        Returns:
+            verify_matching() 반환 형식의 딕셔너리
+        """
         selected_article_ids = selection_result.get('selected_articles', [])
+        prompt_tokens = selection_result.get('prompt_tokens', 0)
+        completion_tokens = selection_result.get('completion_tokens', 0)
 
         if not selected_article_ids:
-            logger.warning(f"  매칭 검증 실패: LLM이 관련 조항을 선택하지 못함")
+            if top_candidates:
+                logger.warning(f"  매칭 검증 실패: LLM이 관련 조항을 선택하지 못함")
             return {
                 "matched": False,
                 "selected_articles": [],
                 "verification_details": [],
-                "prompt_tokens": selection_result.get('prompt_tokens', 0),
-                "completion_tokens": selection_result.get('completion_tokens', 0),
-                "total_tokens": selection_result.get('prompt_tokens', 0) + selection_result.get('completion_tokens', 0)
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
             }
 
         logger.info(f"  매칭 검증 완료: {len(selected_article_ids)}개 조항 선택")
 
         # verification_details 생성: 선택된 조항들의 상세 정보
         verification_details = []
+        candidates_by_parent_id = {}
+        for candidate in top_candidates:
+            candidates_by_parent_id.setdefault(candidate['parent_id'], candidate)
+
         for article_id in selected_article_ids:
-            # 해당 조항 찾기
-            article_info = None
-            for candidate in top_candidates:
-                if candidate['parent_id'] == article_id:
-                    article_info = candidate
-                    break
-            
+            article_info = candidates_by_parent_id.get(article_id)
             if article_info:
                 verification_details.append({
                     "article_id": article_id,
@@ -134,11 +532,17 @@ class MatchingVerifier:
             "matched": True,
             "selected_articles": selected_article_ids,
             "verification_details": verification_details,
-            "prompt_tokens": selection_result.get('prompt_tokens', 0),
-            "completion_tokens": selection_result.get('completion_tokens', 0),
-            "total_tokens": selection_result.get('prompt_tokens', 0) + selection_result.get('completion_tokens', 0)
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens
         }
 
+    async def _create_chat_completion_async(self, **kwargs):
+        """비동기 LLM 호출 (비동기 클라이언트가 없으면 동기 클라이언트를 스레드에서 호출)"""
+        if self.async_azure_client is not None:
+            return await self.async_azure_client.chat.completions.create(**kwargs)
+        return await asyncio.to_thread(self.azure_client.chat.completions.create, **kwargs)
+
     def _select_relevant_articles(
         self,
         user_article: Dict[str, Any],
@@ -160,10 +564,91 @@ class MatchingVerifier:
                 "completion_tokens": int
             }
         """
+        messages = self._build_selection_messages(user_article, candidate_articles, contract_type)
+
+        try:
+            response = self.azure_client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=0.2,
+                max_tokens=500
+            )
+            return self._parse_selection_completion(response, candidate_articles)
+
+        except Exception as e:
+            logger.error(f"    조항 선택 실패: {e}")
+            # 실패 시 모든 후보 반환
+            return self._selection_fallback(candidate_articles)
+
+    async def _select_relevant_articles_async(
+        self,
+        user_article: Dict[str, Any],
+        candidate_articles: List[Dict[str, Any]],
+        contract_type: str
+    ) -> Dict[str, Any]:
+        """관련 표준 조항 선택 (비동기, _select_relevant_articles()와 동일한 반환 형식)"""
+        messages = self._build_selection_messages(user_article, candidate_articles, contract_type)
+
+        try:
+            response = await self._create_chat_completion_async(
+                model=self.model,
+                messages=messages,
+                temperature=0.2,
+                max_tokens=500
+            )
+            return self._parse_selection_completion(response, candidate_articles)
+
+        except Exception as e:
+            logger.error(f"    조항 선택 실패: {e}")
+            return self._selection_fallback(candidate_articles)
+
+    def _build_selection_messages(
+        self,
+        user_article: Dict[str, Any],
+        candidate_articles: List[Dict[str, Any]],
+        contract_type: str
+    ) -> List[Dict[str, str]]:
+        """
+        조항 선택 LLM 메시지 생성 (후보 청크 및 참조 별지/조항 포함)
+
+        Args:
+            user_article: 사용자 조항
+            candidate_articles: 후보 표준계약서 조항들
+            contract_type: 계약 유형
+
+        Returns:
+            chat.completions messages 리스트
+        """
         # 사용자 조항 포맷팅
         user_text = self._format_user_article(user_article)
 
         # 후보 조항들 포맷팅
+        candidates_text = self._format_selection_candidates(candidate_articles)
+
+        # 선택 프롬프트 생성
+        prompt = self._build_selection_prompt(
+            user_article_no=user_article.get('number'),
+            user_article_title=user_article.get('title', ''),
+            user_text=user_text,
+            candidates_text=candidates_text,
+            contract_type=contract_type
+        )
+
+        return [
+            {"role": "system", "content": self.SELECTION_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
+
+    def _format_selection_candidates(self, candidate_articles: List[Dict[str, Any]]) -> str:
+        """
+        후보 표준계약서 조항 포맷팅 (청크 본문, 참조 별지/조항, 해설 포함)
+
+        Args:
+            candidate_articles: 후보 표준계약서 조항들
+
+        Returns:
+            포맷팅된 후보 조항 텍스트
+        """
         candidates_text = ""
         for candidate in candidate_articles:
             parent_id = candidate['parent_id']
@@ -221,63 +706,141 @@ class MatchingVerifier:
             candidates_text += "\n".join(chunk_lines)
             candidates_text += "\n\n---\n\n"
 
-        # 선택 프롬프트 생성
-        prompt = self._build_selection_prompt(
-            user_article_no=user_article.get('number'),
-            user_article_title=user_article.get('title', ''),
-            user_text=user_text,
-            candidates_text=candidates_text,
-            contract_type=contract_type
-        )
+        return candidates_text
 
-        try:
-            response = self.azure_client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": """당신은 데이터 계약서 전문가입니다. 
+    def _parse_selection_completion(
+        self,
+        response,
+        candidate_articles: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """조항 선택 LLM 응답을 _select_relevant_articles() 반환 형식으로 변환"""
+        selection_text = response.choices[0].message.content.strip()
+        usage = response.usage
 
-역할: 사용자 계약서 조항과 표준계약서 조항 간의 관련성을 판단합니다.
+        # 선택된 조항 ID 파싱
+        selected_ids = self._parse_selection_response(selection_text, candidate_articles)
 
-중요: 
-- 내용의 충실도나 완성도는 평가하지 마세요 (다음 단계에서 수행)
-- 단순히 "같은 주제를 다루는가?"만 판단하세요
-- 의심스러우면 관련있음으로 판단하세요 (보수적 접근)
-- 명백히 다른 주제만 제외하세요"""
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.2,
-                max_tokens=500
-            )
+        logger.info(f"    LLM 조항 선택 완료: {len(selected_ids)}개 (토큰: {usage.total_tokens})")
+
+        return {
+            "selected_articles": selected_ids,
+            "prompt_tokens": usage.prompt_tokens,
+            "completion_tokens": usage.completion_tokens
+        }
+
+    def _build_batch_selection_messages(
+        self,
+        batch: List[Tuple[Dict[str, Any], List[Dict[str, Any]]]],
+        contract_type: str
+    ) -> List[Dict[str, str]]:
+        """
+        일괄 조항 선택 LLM 메시지 생성
+
+        사용자 조항별 레코드를 RECORD_SEPARATOR로 구분하고, 판단 기준은 한 번만 포함합니다.
+
+        Args:
+            batch: (사용자 조항, 후보 표준계약서 조항들) 튜플 리스트
+            contract_type: 계약 유형
+
+        Returns:
+            chat.completions messages 리스트
+        """
+        contract_name = self.CONTRACT_TYPE_NAMES.get(contract_type, contract_type)
+        separator = self.RECORD_SEPARATOR
+
+        records = []
+        for i, (user_article, candidate_articles) in enumerate(batch, 1):
+            records.append(f"""## 레코드 {i}
+
+### 사용자 계약서 조항
+제{user_article.get('number')}조 ({user_article.get('title', '')})
+{self._format_user_article(user_article)}
+
+### 후보 표준계약서 조항들
+{self._format_selection_candidates(candidate_articles)}""")
+
+        records_text = f"\n{separator}\n".join(records)
+
+        prompt = f"""# 관련 표준 조항 선택 (일괄)
+
+## 계약 유형
+{contract_name}
+
+## 레코드
+아래 {len(batch)}개의 레코드는 `{separator}` 구분자로 나뉘어 있습니다.
+각 레코드는 사용자 계약서 조항 하나와, 그 조항과 연관되어 있을 가능성이 있는 표준계약서 후보 조항들로 구성됩니다.
+
+{separator}
+{records_text}
+{separator}
+
+---
+
+**과제**: 각 레코드마다 사용자 계약서 조항과 **실제로 관련있는** 후보 표준계약서 조항들을 **모두** 선택하세요.
+레코드는 서로 독립적으로 판단하고, 해당 레코드의 후보 조항 중에서만 선택하세요.
+
+{self.SELECTION_CRITERIA}
+
+**응답 형식**: 레코드 순서대로 정확히 {len(batch)}개의 블록을 `{separator}` 구분자로 나누어 작성하고, 각 블록에는 조항 ID만 나열하세요.
+레코드 1
+선택된 조항: 제1조, 제3조
+{separator}
+레코드 2
+선택된 조항: 없음
+"""
 
-            selection_text = response.choices[0].message.content.strip()
-            usage = response.usage
+        return [
+            {"role": "system", "content": self.SELECTION_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
 
-            # 선택된 조항 ID 파싱
-            selected_ids = self._parse_selection_response(selection_text, candidate_articles)
+    def _split_batch_selection_completion(
+        self,
+        response,
+        batch: List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        일괄 조항 선택 LLM 응답을 레코드별 _select_relevant_articles() 반환 형식으로 분할
 
-            logger.info(f"    LLM 조항 선택 완료: {len(selected_ids)}개 (토큰: {usage.total_tokens})")
+        Args:
+            response: chat.completions 응답
+            batch: LLM에 제시한 (사용자 조항, 후보 표준계약서 조항들) 리스트
 
-            return {
-                "selected_articles": selected_ids,
-                "prompt_tokens": usage.prompt_tokens,
-                "completion_tokens": usage.completion_tokens
-            }
+        Returns:
+            batch 순서의 조항 선택 결과 리스트, 블록 수가 레코드 수와 다르면 None
+        """
+        selection_text = response.choices[0].message.content.strip()
+        usage = response.usage
 
-        except Exception as e:
-            logger.error(f"    조항 선택 실패: {e}")
-            # 실패 시 모든 후보 반환
-            all_ids = [candidate['parent_id'] for candidate in candidate_articles]
-            return {
-                "selected_articles": all_ids,
-                "prompt_tokens": 0,
-                "completion_tokens": 0
+        blocks = [block.strip() for block in selection_text.split(self.RECORD_SEPARATOR) if block.strip()]
+        if len(blocks) != len(batch):
+            logger.warning(f"    일괄 응답 블록 수 불일치: {len(blocks)}개 (레코드 {len(batch)}개)")
+            return None
+
+        logger.info(f"    LLM 일괄 조항 선택 완료: {len(batch)}개 레코드 (토큰: {usage.total_tokens})")
+
+        # 토큰 사용량은 레코드 수로 균등 분배
+        prompt_tokens = usage.prompt_tokens // len(batch)
+        completion_tokens = usage.completion_tokens // len(batch)
+
+        return [
+            {
+                "selected_articles": self._parse_selection_response(block, candidate_articles),
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens
             }
+            for block, (_, candidate_articles) in zip(blocks, batch)
+        ]
+
+    @staticmethod
+    def _selection_fallback(candidate_articles: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """조항 선택 실패 시 모든 후보 반환"""
+        all_ids = [candidate['parent_id'] for candidate in candidate_articles]
+        return {
+            "selected_articles": all_ids,
+            "prompt_tokens": 0,
+            "completion_tokens": 0
+        }
 
     def _build_selection_prompt(
         self,
@@ -300,15 +863,7 @@ class MatchingVerifier:
         Returns:
             프롬프트 텍스트
         """
-        contract_type_names = {
-            "provide": "데이터 제공 계약",
-            "create": "데이터 생성 계약",
-            "process": "데이터 가공 계약",
-            "brokerage_provider": "데이터 중개 계약 (제공자용)",
-            "brokerage_user": "데이터 중개 계약 (이용자용)"
-        }
-
-        contract_name = contract_type_names.get(contract_type, contract_type)
+        contract_name = self.CONTRACT_TYPE_NAMES.get(contract_type, contract_type)
 
         prompt = f"""# 관련 표준 조항 선택
 
@@ -328,50 +883,7 @@ class MatchingVerifier:
 
 **과제**: 위의 후보 조항들 중에서 사용자 계약서 조항(제{user_article_no}조)과 **실제로 관련있는** 표준계약서 조항들을 **모두** 선택하세요.
 
-**매칭 판단 기준** (관련성만 판단, 내용 충실도는 평가하지 않음):
-
-1. **같은 주제를 다루는가?**
-   - 사용자 조항과 표준 조항이 동일하거나 유사한 법적 사항을 규율하는가?
-   - 부분적으로라도 겹치는 내용이 있으면 관련있음으로 판단
-
-2. **여러 조항 매칭 가능**
-   - 사용자 조항 하나가 표준계약서의 여러 조항에 걸쳐 있을 수 있음
-   - 관련있는 조항은 모두 선택 (1개 이상)
-
-3. **제외 기준**
-   - 키워드만 유사하고 법적 맥락이 완전히 다른 경우
-   - 예: "데이터"라는 단어만 공통이고 실제 규율 대상이 다름
-
-**조항 유형별 판단 가이드**:
-
-**[용어 정의 조항]**
-- 용어의 의미/범위를 명시적으로 정립하는 내용이 있어야 함
-- 표현 형식: "~란", "~는", "~를 의미한다", "~을 말한다" 등 다양
-- 계약 전체에서 반복 참조되는 핵심 개념의 범위를 명시
-- 제외: 계약 목적, 배경, 체결 경위, 당사자 소개 등
-
-**[권리/의무 조항]**
-- 당사자의 권리나 의무를 규정하는 조항
-- "~할 수 있다", "~해야 한다", "~하여서는 아니 된다" 등
-- 부분적 권리/의무 포함도 관련있음으로 판단
-
-**[절차/방법 조항]**
-- 특정 행위의 절차, 방법, 기한을 규정
-- 동일한 절차를 다루면 관련있음 (세부사항 차이는 무시)
-
-**[책임/제재 조항]**
-- 위반 시 책임, 손해배상, 계약 해지 등
-- 동일한 위반 사항에 대한 제재면 관련있음
-
-**[기타 조항]**
-- 계약 기간, 비밀유지, 분쟁 해결 등
-- 주제가 명확히 일치하면 관련있음
-
-**판단 원칙**:
-- 내용이 100% 일치할 필요 없음 (충실도는 A3에서 평가)
-- 부분적으로라도 관련있으면 선택
-- 의심스러우면 선택 (False Negative 방지)
-- 명백히 다른 주제만 제외
+{self.SELECTION_CRITERIA}
 
 **응답 형식** (조항 ID만 나열):
 선택된 조항: 제1조, 제3조, 제5조
@@ -512,6 +1024,89 @@ class MatchingVerifier:
                 contract_type
             )
         
+        messages = self._build_forward_verification_messages(standard_article, user_candidates, contract_type)
+
+        cache_key = self._forward_cache_key(messages, parent_id, contract_type)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            logger.info(f"    재검증 캐시 히트: {parent_id}")
+            return cached
+        
+        try:
+            response = self.azure_client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=0.1,
+                max_tokens=1500,
+                response_format={"type": "json_object"}
+            )
+            result = self._parse_forward_verification_completion(response, user_candidates, standard_article)
+            
+        except Exception as e:
+            logger.error(f"    재검증 실패: {e}")
+            return self._forward_verification_fallback(title, e)
+
+        self._store_cached(cache_key, result)
+        return result
+
+    async def verify_missing_article_forward_async(
+        self,
+        standard_article: Dict[str, Any],
+        user_candidates: List[Dict[str, Any]],
+        contract_type: str
+    ) -> Dict[str, Any]:
+        """
+        누락 조문 역방향 검증 (비동기)
+
+        verify_missing_article_forward()와 동일한 결과를 반환하며, LLM 호출만 비동기로 수행합니다.
+        """
+        parent_id = standard_article.get('parent_id')
+        title = standard_article.get('title', '')
+        
+        logger.info(f"  누락 조문 재검증: {parent_id} ({title})")
+        
+        if not user_candidates:
+            logger.warning(f"    후보 조문이 없습니다 - LLM으로 상세 분석 생성")
+            return await self._generate_missing_analysis_without_candidates_async(
+                standard_article,
+                contract_type
+            )
+        
+        messages = self._build_forward_verification_messages(standard_article, user_candidates, contract_type)
+
+        cache_key = self._forward_cache_key(messages, parent_id, contract_type)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            logger.info(f"    재검증 캐시 히트: {parent_id}")
+            return cached
+        
+        try:
+            response = await self._create_chat_completion_async(
+                model=self.model,
+                messages=messages,
+                temperature=0.1,
+                max_tokens=1500,
+                response_format={"type": "json_object"}
+            )
+            result = self._parse_forward_verification_completion(response, user_candidates, standard_article)
+            
+        except Exception as e:
+            logger.error(f"    재검증 실패: {e}")
+            return self._forward_verification_fallback(title, e)
+
+        self._store_cached(cache_key, result)
+        return result
+
+    def _build_forward_verification_messages(
+        self,
+        standard_article: Dict[str, Any],
+        user_candidates: List[Dict[str, Any]],
+        contract_type: str
+    ) -> List[Dict[str, str]]:
+        """역방향 검증 LLM 메시지 생성 (표준 조문 + 사용자 후보 조문)"""
+        parent_id = standard_article.get('parent_id')
+        title = standard_article.get('title', '')
+        
         # 표준 조문 포맷팅
         standard_text = self._format_standard_article(standard_article)
         
@@ -537,56 +1132,57 @@ class MatchingVerifier:
             contract_type=contract_type
         )
         
-        try:
-            response = self.azure_client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "당신은 계약서 조항을 정확하게 비교 분석하는 법률 전문가입니다. JSON 형식으로만 응답하세요."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.1,
-                max_tokens=1500,
-                response_format={"type": "json_object"}
-            )
-            
-            response_text = response.choices[0].message.content.strip()
-            usage = response.usage
-            
-            # 응답 파싱
-            result = self._parse_forward_verification_response(
-                response_text,
-                user_candidates,
-                standard_article
-            )
-            
-            result['prompt_tokens'] = usage.prompt_tokens
-            result['completion_tokens'] = usage.completion_tokens
-            
-            logger.info(f"    재검증 완료: 누락={result['is_truly_missing']}, "
-                       f"신뢰도={result['confidence']:.2f} (토큰: {usage.total_tokens})")
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"    재검증 실패: {e}")
-            return {
-                "is_truly_missing": True,  # 실패 시 누락으로 간주
-                "confidence": 0.5,
-                "matched_user_article": None,
-                "reasoning": f"검증 중 오류 발생: {str(e)}",
-                "recommendation": f"'{title}' 조항 확인이 필요합니다.",
-                "evidence": "LLM 검증 실패",
-                "risk_assessment": "검증 실패로 인해 정확한 평가 불가",
-                "candidates_analysis": [],
-                "prompt_tokens": 0,
-                "completion_tokens": 0
+        return [
+            {
+                "role": "system",
+                "content": "당신은 계약서 조항을 정확하게 비교 분석하는 법률 전문가입니다. JSON 형식으로만 응답하세요."
+            },
+            {
+                "role": "user",
+                "content": prompt
             }
+        ]
+
+    def _parse_forward_verification_completion(
+        self,
+        response,
+        user_candidates: List[Dict[str, Any]],
+        standard_article: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """역방향 검증 LLM 응답을 결과 딕셔너리로 변환 (토큰 사용량 포함)"""
+        response_text = response.choices[0].message.content.strip()
+        usage = response.usage
+        
+        # 응답 파싱
+        result = self._parse_forward_verification_response(
+            response_text,
+            user_candidates,
+            standard_article
+        )
+        
+        result['prompt_tokens'] = usage.prompt_tokens
+        result['completion_tokens'] = usage.completion_tokens
+        
+        logger.info(f"    재검증 완료: 누락={result['is_truly_missing']}, "
+                   f"신뢰도={result['confidence']:.2f} (토큰: {usage.total_tokens})")
+        
+        return result
+
+    @staticmethod
+    def _forward_verification_fallback(title: str, error: Exception) -> Dict[str, Any]:
+        """역방향 검증 실패 시 기본 결과 (누락으로 간주)"""
+        return {
+            "is_truly_missing": True,  # 실패 시 누락으로 간주
+            "confidence": 0.5,
+            "matched_user_article": None,
+            "reasoning": f"검증 중 오류 발생: {str(error)}",
+            "recommendation": f"'{title}' 조항 확인이 필요합니다.",
+            "evidence": "LLM 검증 실패",
+            "risk_assessment": "검증 실패로 인해 정확한 평가 불가",
+            "candidates_analysis": [],
+            "prompt_tokens": 0,
+            "completion_tokens": 0
+        }
     
     def _format_standard_article(self, standard_article: Dict[str, Any]) -> str:
         """
@@ -825,6 +1421,68 @@ JSON만 응답하세요."""
         Returns:
             상세 분석 결과
         """
+        title = standard_article.get('title', '')
+        messages = self._build_missing_analysis_messages(standard_article, contract_type)
+
+        cache_key = self._missing_analysis_cache_key(standard_article, contract_type)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            logger.info(f"    누락 분석 캐시 히트: {standard_article.get('parent_id')}")
+            return cached
+        
+        try:
+            response = self.azure_client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=0.1,
+                max_tokens=1000,
+                response_format={"type": "json_object"}
+            )
+            result = self._parse_missing_analysis_completion(response, title)
+            self._store_cached(cache_key, result)
+            return result
+            
+        except Exception as e:
+            logger.error(f"    LLM 누락 분석 실패: {e}")
+            return self._missing_analysis_fallback(title)
+
+    async def _generate_missing_analysis_without_candidates_async(
+        self,
+        standard_article: Dict[str, Any],
+        contract_type: str
+    ) -> Dict[str, Any]:
+        """후보 조문이 없을 때 LLM으로 상세한 누락 분석 생성 (비동기)"""
+        title = standard_article.get('title', '')
+        messages = self._build_missing_analysis_messages(standard_article, contract_type)
+
+        cache_key = self._missing_analysis_cache_key(standard_article, contract_type)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            logger.info(f"    누락 분석 캐시 히트: {standard_article.get('parent_id')}")
+            return cached
+        
+        try:
+            response = await self._create_chat_completion_async(
+                model=self.model,
+                messages=messages,
+                temperature=0.1,
+                max_tokens=1000,
+                response_format={"type": "json_object"}
+            )
+            result = self._parse_missing_analysis_completion(response, title)
+            self._store_cached(cache_key, result)
+            return result
+            
+        except Exception as e:
+            logger.error(f"    LLM 누락 분석 실패: {e}")
+            return self._missing_analysis_fallback(title)
+
+    def _build_missing_analysis_messages(
+        self,
+        standard_article: Dict[str, Any],
+        contract_type: str
+    ) -> List[Dict[str, str]]:
+        """후보 없는 누락 분석 LLM 메시지 생성"""
         parent_id = standard_article.get('parent_id')
         title = standard_article.get('title', '')
         standard_text = self._format_standard_article(standard_article)
@@ -871,39 +1529,33 @@ JSON만 응답하세요."""
 
 JSON만 응답하세요."""
         
-        try:
-            response = self.azure_client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "당신은 계약서 조항을 정확하게 분석하는 법률 전문가입니다. JSON 형식으로만 응답하세요."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.1,
-                max_tokens=1000,
-                response_format={"type": "json_object"}
-            )
-            
-            response_text = response.choices[0].message.content.strip()
-            usage = response.usage
-            
-            # JSON 파싱
-            import json
-            data = json.loads(response_text)
-            
-            # 결과 구성
-            purpose = data.get('purpose', '')
-            risk_scenario = data.get('risk_scenario', '')
-            legal_impact = data.get('legal_impact', '')
-            recommendation = data.get('recommendation', f"'{title}' 조항을 추가할 것을 권장합니다.")
-            
-            # 증거 텍스트 구성
-            evidence = f"""**조항의 핵심 목적:**
+        return [
+            {
+                "role": "system",
+                "content": "당신은 계약서 조항을 정확하게 분석하는 법률 전문가입니다. JSON 형식으로만 응답하세요."
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+
+    def _parse_missing_analysis_completion(self, response, title: str) -> Dict[str, Any]:
+        """후보 없는 누락 분석 LLM 응답을 결과 딕셔너리로 변환"""
+        response_text = response.choices[0].message.content.strip()
+        usage = response.usage
+        
+        # JSON 파싱
+        data = json.loads(response_text)
+        
+        # 결과 구성
+        purpose = data.get('purpose', '')
+        risk_scenario = data.get('risk_scenario', '')
+        legal_impact = data.get('legal_impact', '')
+        recommendation = data.get('recommendation', f"'{title}' 조항을 추가할 것을 권장합니다.")
+        
+        # 증거 텍스트 구성
+        evidence = f"""**조항의 핵심 목적:**
 {purpose}
 
 **역방향 검색 결과:**
@@ -911,36 +1563,37 @@ JSON만 응답하세요."""
 
 **법적·운영상 영향:**
 {legal_impact}"""
-            
-            logger.info(f"    LLM 누락 분석 완료 (토큰: {usage.total_tokens})")
-            
-            return {
-                "is_truly_missing": True,
-                "confidence": 1.0,
-                "matched_user_article": None,
-                "reasoning": f"역방향 검색에서 유사한 조문을 전혀 찾을 수 없었습니다. {purpose}",
-                "recommendation": recommendation,
-                "evidence": evidence,
-                "risk_assessment": risk_scenario,
-                "candidates_analysis": [],
-                "prompt_tokens": usage.prompt_tokens,
-                "completion_tokens": usage.completion_tokens
-            }
-            
-        except Exception as e:
-            logger.error(f"    LLM 누락 분석 실패: {e}")
-            return {
-                "is_truly_missing": True,
-                "confidence": 1.0,
-                "matched_user_article": None,
-                "reasoning": "사용자 계약서에서 유사한 조문을 찾을 수 없습니다.",
-                "recommendation": f"'{title}' 조항을 추가할 것을 권장합니다.",
-                "evidence": "역방향 검색에서 유사한 사용자 조문이 발견되지 않았습니다.",
-                "risk_assessment": "해당 조항이 없으면 계약 이행 과정에서 불명확성이 발생할 수 있습니다.",
-                "candidates_analysis": [],
-                "prompt_tokens": 0,
-                "completion_tokens": 0
-            }
+        
+        logger.info(f"    LLM 누락 분석 완료 (토큰: {usage.total_tokens})")
+        
+        return {
+            "is_truly_missing": True,
+            "confidence": 1.0,
+            "matched_user_article": None,
+            "reasoning": f"역방향 검색에서 유사한 조문을 전혀 찾을 수 없었습니다. {purpose}",
+            "recommendation": recommendation,
+            "evidence": evidence,
+            "risk_assessment": risk_scenario,
+            "candidates_analysis": [],
+            "prompt_tokens": usage.prompt_tokens,
+            "completion_tokens": usage.completion_tokens
+        }
+
+    @staticmethod
+    def _missing_analysis_fallback(title: str) -> Dict[str, Any]:
+        """후보 없는 누락 분석 실패 시 기본 결과"""
+        return {
+            "is_truly_missing": True,
+            "confidence": 1.0,
+            "matched_user_article": None,
+            "reasoning": "사용자 계약서에서 유사한 조문을 찾을 수 없습니다.",
+            "recommendation": f"'{title}' 조항을 추가할 것을 권장합니다.",
+            "evidence": "역방향 검색에서 유사한 사용자 조문이 발견되지 않았습니다.",
+            "risk_assessment": "해당 조항이 없으면 계약 이행 과정에서 불명확성이 발생할 수 있습니다.",
+            "candidates_analysis": [],
+            "prompt_tokens": 0,
+            "completion_tokens": 0
+        }
 
     def set_all_chunks(self, contract_type: str):
         """
@@ -950,11 +1603,24 @@ JSON만 응답하세요."""
             contract_type: 계약 유형
         """
         if self.kb_loader:
-            self.all_chunks = self.kb_loader.load_chunks(contract_type) or []
+            chunks = self.kb_loader.load_chunks(contract_type) or []
+            if chunks is self.all_chunks:
+                return  # 같은 계약 유형의 캐시된 청크 리스트면 색인 재사용
+
+            # 같은 global_id는 첫 청크 우선 (기존 선형 탐색과 동일)
+            chunks_by_global_id = {}
+            for chunk in chunks:
+                global_id = chunk.get('global_id')
+                if global_id:
+                    chunks_by_global_id.setdefault(global_id, chunk)
+
+            self._chunks_by_global_id = chunks_by_global_id
+            self.all_chunks = chunks
             logger.debug(f"    전체 청크 로드 완료: {len(self.all_chunks)}개")
         else:
             logger.warning("    KnowledgeBaseLoader가 없어 청크를 로드할 수 없습니다")
             self.all_chunks = []
+            self._chunks_by_global_id = {}
 
     def _load_referenced_exhibits(self, references: List[str]) -> Dict[str, str]:
         """
@@ -977,17 +1643,18 @@ JSON만 응답하세요."""
                 continue
 
             # global_id로 청크 찾기
-            for chunk in self.all_chunks:
-                if chunk.get('global_id') == ref_id:
-                    chunk_id = chunk.get('id', ref_id)
-                    text_llm = chunk.get('text_llm', '').strip()
-                    
-                    if text_llm:
-                        exhibit_contents[chunk_id] = text_llm
-                        logger.debug(f"        별지 참조 로드: {chunk_id}")
-                    else:
-                        logger.warning(f"        별지 {chunk_id}에 text_llm이 없습니다")
-                    break
+            chunk = self._chunks_by_global_id.get(ref_id)
+            if chunk is None:
+                continue
+
+            chunk_id = chunk.get('id', ref_id)
+            text_llm = chunk.get('text_llm', '').strip()
+
+            if text_llm:
+                exhibit_contents[chunk_id] = text_llm
+                logger.debug(f"        별지 참조 로드: {chunk_id}")
+            else:
+                logger.warning(f"        별지 {chunk_id}에 text_llm이 없습니다")
 
         return exhibit_contents
 
@@ -1012,22 +1679,23 @@ JSON만 응답하세요."""
                 continue
 
             # global_id로 청크 찾기
-            for chunk in self.all_chunks:
-                if chunk.get('global_id') == ref_id:
-                    chunk_id = chunk.get('id', ref_id)
-                    text_norm = chunk.get('text_norm', '').strip()
-                    commentary_summary = chunk.get('commentary_summary', '').strip()
-                    
-                    if text_norm:
-                        # text_norm + commentary_summary 결합
-                        content_parts = [text_norm]
-                        if commentary_summary:
-                            content_parts.append(f"[해설] {commentary_summary}")
-                        
-                        article_contents[chunk_id] = "\n        ".join(content_parts)
-                        logger.debug(f"        조항 참조 로드: {chunk_id}")
-                    else:
-                        logger.warning(f"        조항 {chunk_id}에 text_norm이 없습니다")
-                    break
+            chunk = self._chunks_by_global_id.get(ref_id)
+            if chunk is None:
+                continue
+
+            chunk_id = chunk.get('id', ref_id)
+            text_norm = chunk.get('text_norm', '').strip()
+            commentary_summary = chunk.get('commentary_summary', '').strip()
+
+            if text_norm:
+                # text_norm + commentary_summary 결합
+                content_parts = [text_norm]
+                if commentary_summary:
+                    content_parts.append(f"[해설] {commentary_summary}")
+
+                article_contents[chunk_id] = "\n        ".join(content_parts)
+                logger.debug(f"        조항 참조 로드: {chunk_id}")
+            else:
+                logger.warning(f"        조항 {chunk_id}에 text_norm이 없습니다")
 
         return article_contents
@@ -0,0 +1,297 @@
+"""
+VerificationCache - A1 LLM 검증 결과 캐시
+
+MatchingVerifier의 LLM 검증 결과를 캐싱하여 동일 계약서 재검증이나
+여러 계약서에 반복되는 정형 조항에 대한 LLM 호출을 생략합니다.
+
+- 정확 일치: sha256(계약유형|정규화 텍스트|정렬된 후보 ID) → 메모리 LRU + Redis(선택)
+- 의미 유사: 같은 계약유형/후보 ID 집합 안에서 사용자 조항 임베딩 코사인 유사도 ≥ 임계값
+  (숫자/부정어만 다른 조항이 같은 결과를 받을 수 있어 기본 비활성화, A1_SEMANTIC_CACHE_ENABLED)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+
+VERIFICATION_CACHE_ENABLED = os.getenv("A1_VERIFICATION_CACHE_ENABLED", "true").lower() == "true"
+VERIFICATION_CACHE_TTL = int(os.getenv("A1_VERIFICATION_CACHE_TTL", str(24 * 3600)))  # 초
+VERIFICATION_CACHE_MAX_SIZE = int(os.getenv("A1_VERIFICATION_CACHE_MAX_SIZE", "10000"))
+SEMANTIC_CACHE_ENABLED = os.getenv("A1_SEMANTIC_CACHE_ENABLED", "false").lower() == "true"
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("A1_SEMANTIC_CACHE_THRESHOLD", "0.95"))
+
+_REDIS_KEY_PREFIX = "a1_verify:"
+_PUNCTUATION_PATTERN = re.compile(r"[^\w\s]")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화 (소문자화, 구두점 제거, 공백 축약)"""
+    text = _PUNCTUATION_PATTERN.sub(" ", (text or "").lower())
+    return _WHITESPACE_PATTERN.sub(" ", text).strip()
+
+
+class VerificationCache:
+    """
+    LLM 검증 결과 캐시
+
+    정확 일치 계층(메모리 LRU + Redis)과 의미 유사 계층(메모리, 임베딩 내적)으로 구성됩니다.
+    Celery 스레드에서 동시에 접근하므로 메모리 계층은 락으로 보호합니다.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = VERIFICATION_CACHE_TTL,
+        max_size: int = VERIFICATION_CACHE_MAX_SIZE,
+        semantic_threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        redis_client=None,
+        semantic_enabled: bool = SEMANTIC_CACHE_ENABLED
+    ):
+        """
+        Args:
+            ttl_seconds: 캐시 TTL (초)
+            max_size: 메모리 캐시 최대 항목 수 (정확 일치/의미 유사 계층 각각)
+            semantic_threshold: 의미 유사 계층 코사인 유사도 임계값
+            redis_client: Redis 클라이언트 (None이면 메모리 캐시만 사용)
+            semantic_enabled: 의미 유사 계층 사용 여부 (False면 bucket/embedding을 무시)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.semantic_threshold = semantic_threshold
+        self.redis_client = redis_client
+        self.semantic_enabled = semantic_enabled
+
+        self._lock = threading.Lock()
+        self._exact: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (timestamp, value)
+        self._semantic: Dict[str, List[tuple]] = {}  # bucket -> [(timestamp, unit_vector, value), ...]
+        self._semantic_size = 0
+
+        self.stats = {"hits": 0, "semantic_hits": 0, "misses": 0}
+
+        logger.info(f"VerificationCache 초기화 완료 (Redis: {redis_client is not None}, "
+                    f"TTL: {ttl_seconds}s, max_size: {max_size}, semantic: {semantic_enabled}, "
+                    f"semantic_threshold: {semantic_threshold})")
+
+    @staticmethod
+    def make_key(kind: str, contract_type: str, text: str, candidate_ids: Iterable[str]) -> str:
+        """
+        정확 일치 캐시 키 생성
+
+        Args:
+            kind: 검증 종류 (예: "matching", "forward")
+            contract_type: 계약 유형
+            text: 검증 대상 텍스트 (정규화 전)
+            candidate_ids: 후보 ID 목록 (순서 무관)
+
+        Returns:
+            "{kind}:{sha256}" 형식의 키
+        """
+        ids = ",".join(sorted(str(candidate_id) for candidate_id in candidate_ids))
+        digest = hashlib.sha256(f"{contract_type}|{normalize_text(text)}|{ids}".encode("utf-8")).hexdigest()
+        return f"{kind}:{digest}"
+
+    @staticmethod
+    def make_bucket(kind: str, contract_type: str, candidate_ids: Iterable[str]) -> str:
+        """의미 유사 계층 버킷 키 생성 (텍스트를 제외한 나머지 조건이 같은 항목끼리만 비교)"""
+        ids = ",".join(sorted(str(candidate_id) for candidate_id in candidate_ids))
+        return f"{kind}|{contract_type}|{ids}"
+
+    def get(
+        self,
+        key: str,
+        bucket: Optional[str] = None,
+        embedding: Optional[Sequence[float]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        캐시 조회 (정확 일치 → Redis → 의미 유사 순)
+
+        Args:
+            key: make_key()로 생성한 키
+            bucket: make_bucket()으로 생성한 의미 유사 계층 버킷 (없으면 의미 유사 조회 생략)
+            embedding: 검증 대상 임베딩 (없으면 의미 유사 조회 생략)
+
+        Returns:
+            캐시된 결과의 복사본 (없으면 None)
+        """
+        now = time.time()
+
+        with self._lock:
+            entry = self._exact.get(key)
+            if entry is not None:
+                timestamp, value = entry
+                if now - timestamp <= self.ttl_seconds:
+                    self._exact.move_to_end(key)
+                    self.stats["hits"] += 1
+                    return dict(value)  # 호출 측 수정이 캐시에 반영되지 않도록 복사본 반환
+                del self._exact[key]
+
+        if self.redis_client is not None:
+            try:
+                cached = self.redis_client.get(_REDIS_KEY_PREFIX + key)
+                if cached:
+                    value = json.loads(cached)
+                    self._set_memory(key, value, now)
+                    with self._lock:
+                        self.stats["hits"] += 1
+                    return value
+            except Exception as e:
+                logger.warning(f"검증 캐시 Redis 조회 실패: {e}")
+
+        if self.semantic_enabled and bucket is not None and embedding is not None:
+            value = self._get_semantic(bucket, embedding, now)
+            if value is not None:
+                with self._lock:
+                    self.stats["semantic_hits"] += 1
+                return value
+
+        with self._lock:
+            self.stats["misses"] += 1
+        return None
+
+    def set(
+        self,
+        key: str,
+        value: Dict[str, Any],
+        bucket: Optional[str] = None,
+        embedding: Optional[Sequence[float]] = None
+    ):
+        """
+        캐시 저장
+
+        Args:
+            key: make_key()로 생성한 키
+            value: JSON 직렬화 가능한 검증 결과
+            bucket: 의미 유사 계층 버킷 (없으면 정확 일치 계층에만 저장)
+            embedding: 검증 대상 임베딩 (없으면 정확 일치 계층에만 저장)
+        """
+        now = time.time()
+        self._set_memory(key, value, now)
+
+        if self.redis_client is not None:
+            try:
+                self.redis_client.setex(
+                    _REDIS_KEY_PREFIX + key,
+                    self.ttl_seconds,
+                    json.dumps(value, ensure_ascii=False)
+                )
+            except Exception as e:
+                logger.warning(f"검증 캐시 Redis 저장 실패: {e}")
+
+        if self.semantic_enabled and bucket is not None and embedding is not None:
+            unit = self._to_unit_vector(embedding)
+            if unit is not None:
+                with self._lock:
+                    self._semantic.setdefault(bucket, []).append((now, unit, value))
+                    self._semantic_size += 1
+                    self._evict_semantic_if_needed()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 조회"""
+        with self._lock:
+            total = self.stats["hits"] + self.stats["semantic_hits"] + self.stats["misses"]
+            hit_rate = (self.stats["hits"] + self.stats["semantic_hits"]) / total if total else 0.0
+            return {
+                **self.stats,
+                "hit_rate": hit_rate,
+                "exact_size": len(self._exact),
+                "semantic_size": self._semantic_size
+            }
+
+    def _set_memory(self, key: str, value: Dict[str, Any], now: float):
+        """정확 일치 메모리 계층 저장 (LRU)"""
+        with self._lock:
+            self._exact[key] = (now, value)
+            self._exact.move_to_end(key)
+            while len(self._exact) > self.max_size:
+                self._exact.popitem(last=False)
+
+    def _get_semantic(self, bucket: str, embedding: Sequence[float], now: float) -> Optional[Dict[str, Any]]:
+        """의미 유사 계층 조회 (버킷 내 코사인 유사도 최댓값이 임계값 이상이면 반환)"""
+        query = self._to_unit_vector(embedding)
+        if query is None:
+            return None
+
+        with self._lock:
+            entries = [entry for entry in self._semantic.get(bucket, []) if now - entry[0] <= self.ttl_seconds]
+            if not entries:
+                return None
+            if len(entries) != len(self._semantic[bucket]):
+                self._semantic_size -= len(self._semantic[bucket]) - len(entries)
+                self._semantic[bucket] = entries
+
+            vectors = np.stack([entry[1] for entry in entries])
+
+        if vectors.shape[1] != query.shape[0]:
+            return None
+
+        similarities = vectors @ query
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.semantic_threshold:
+            return None
+
+        logger.debug(f"검증 캐시 의미 유사 히트 (유사도: {similarities[best]:.3f})")
+        return dict(entries[best][2])
+
+    def _evict_semantic_if_needed(self):
+        """의미 유사 계층이 최대 크기를 넘으면 가장 오래된 항목부터 제거 (락 보유 상태에서 호출)"""
+        while self._semantic_size > self.max_size:
+            oldest_bucket = min(self._semantic, key=lambda b: self._semantic[b][0][0])
+            self._semantic[oldest_bucket].pop(0)
+            if not self._semantic[oldest_bucket]:
+                del self._semantic[oldest_bucket]
+            self._semantic_size -= 1
+
+    @staticmethod
+    def _to_unit_vector(embedding: Sequence[float]) -> Optional[np.ndarray]:
+        """임베딩을 float32 단위 벡터로 변환 (영벡터면 None)"""
+        vector = np.asarray(embedding, dtype=np.float32)
+        if vector.ndim != 1:
+            return None
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return None
+        return vector / norm
+
+
+_verification_cache: Optional[VerificationCache] = None
+_verification_cache_lock = threading.Lock()
+
+
+def get_verification_cache() -> Optional[VerificationCache]:
+    """
+    프로세스 단위 VerificationCache 싱글톤
+
+    Returns:
+        VerificationCache 인스턴스 (A1_VERIFICATION_CACHE_ENABLED=false면 None)
+    """
+    global _verification_cache
+    if not VERIFICATION_CACHE_ENABLED:
+        return None
+
+    with _verification_cache_lock:
+        if _verification_cache is None:
+            redis_client = None
+            if redis is not None:
+                try:
+                    client = redis.Redis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379"))
+                    client.ping()
+                    redis_client = client
+                except Exception as e:
+                    logger.warning(f"검증 캐시 Redis 연결 실패, 메모리 캐시만 사용: {e}")
+            _verification_cache = VerificationCache(redis_client=redis_client)
+    return _verification_cache
@@ -1,21 +1,34 @@
 ﻿from celery import Celery, chain, group
-from backend.shared.core.celery_app import celery_app
+from celery.signals import worker_process_init, worker_process_shutdown
+from backend.shared.core.celery_app import celery_app, worker_consumes
 from backend.shared.database import (
     get_db, ValidationResult, ContractDocument, ClassificationResult,
     update_validation_field_with_retry, update_completeness_check_partial_with_retry
 )
-from backend.shared.services.knowledge_base_loader import KnowledgeBaseLoader
+from backend.shared.services.knowledge_base_loader import get_knowledge_base_loader
+from backend.shared.utils.queue_logging import install_queue_logging, stop_queue_logging
 from .a1_node.a1_node import CompletenessCheckNode
 from .a2_node.a2_node import ChecklistCheckNode
 from .a3_node.a3_node import ContentAnalysisNode
 import logging
 import os
 from typing import List
-from openai import AzureOpenAI
+import threading
+import httpx
+from openai import AzureOpenAI, AsyncAzureOpenAI, DefaultAsyncHttpxClient
 from sqlalchemy.orm.attributes import flag_modified
 
 logger = logging.getLogger(__name__)
 
+try:
+    import h2  # httpx HTTP/2 지원 (pip install httpx[http2])
+except ImportError:
+    h2 = None
+
+# 프로세스 공용 비동기 Azure OpenAI 클라이언트 (A1 이벤트 루프에서만 사용)
+_async_azure_client = None
+_async_azure_client_lock = threading.Lock()
+
 
 class NodeLoggerAdapter(logging.LoggerAdapter):
     """노드별 태그를 자동으로 추가하는 로거 어댑터"""
@@ -27,6 +40,46 @@ class NodeLoggerAdapter(logging.LoggerAdapter):
         return f"[{self.node_tag}] {msg}", kwargs
 
 
+@worker_process_init.connect
+def setup_queue_logging(**kwargs):
+    """
+    워커 프로세스 시작 시 큐 기반 로깅 설치
+
+    A1 동시 검증 중 조항별 로그가 핸들러 I/O에서 직렬화되지 않도록
+    로그 출력은 백그라운드 QueueListener가 담당합니다.
+    정합성 검증 워커에서만 설치합니다.
+    """
+    if not worker_consumes("consistency_validation"):
+        return
+    install_queue_logging()
+
+
+@worker_process_init.connect
+def preload_standard_knowledge_base(**kwargs):
+    """
+    워커 프로세스 시작 시 표준계약서 청크/FAISS 인덱스 미리 로드
+
+    프로세스 단위 지식베이스 로더 싱글톤에 캐시되므로 첫 A1 태스크도
+    청크 JSON 파싱과 인덱스 파일 로드 없이 바로 매칭을 시작합니다.
+    정합성 검증 워커에서만 로드합니다.
+    """
+    if not worker_consumes("consistency_validation"):
+        return
+    try:
+        kb_loader = get_knowledge_base_loader()
+        for contract_type in kb_loader.get_available_contract_types():
+            kb_loader.load_chunks(contract_type)
+            kb_loader.load_faiss_indexes(contract_type)
+    except Exception as e:
+        logger.warning(f"표준계약서 지식베이스 사전 로드 실패 (첫 검증 시 로드): {e}")
+
+
+@worker_process_shutdown.connect
+def flush_queue_logging(**kwargs):
+    """워커 프로세스 종료 전 큐에 남은 로그 출력"""
+    stop_queue_logging()
+
+
 @celery_app.task(bind=True, name="consistency.check_completeness", queue="consistency_validation")
 def check_completeness_task(self, contract_id: str, text_weight: float = 0.7, title_weight: float = 0.3, dense_weight: float = 0.85):
     """
@@ -74,7 +127,7 @@ def check_completeness_task(self, contract_id: str, text_weight: float = 0.7, ti
         logger.info(f"  계약서 유형: {contract_type}")
 
         # A1 노드 초기화
-        kb_loader = KnowledgeBaseLoader()
+        kb_loader = get_knowledge_base_loader()
         azure_client = _init_azure_client()
 
         if not azure_client:
@@ -82,7 +135,12 @@ def check_completeness_task(self, contract_id: str, text_weight: float = 0.7, ti
 
         a1_node = CompletenessCheckNode(
             knowledge_base_loader=kb_loader,
-            azure_client=azure_client
+            azure_client=azure_client,
+            async_azure_client=_init_async_azure_client(),
+            max_concurrency=int(os.getenv('A1_MAX_CONCURRENCY', '20')),
+            verification_batch_size=int(os.getenv('A1_VERIFICATION_BATCH_SIZE', '5')),
+            bypass_threshold=float(os.getenv('A1_BYPASS_THRESHOLD', '0.92')),
+            unmatched_model=os.getenv('A1_UNMATCHED_MODEL', 'gpt-4o-mini')
         )
 
         # A1 완전성 검증 수행
@@ -220,7 +278,7 @@ def analyze_content_task(self, contract_id: str, matching_types: List[str] = Non
         completeness_result = existing_result.completeness_check
 
         # A3 노드 초기화
-        kb_loader = KnowledgeBaseLoader()
+        kb_loader = get_knowledge_base_loader()
         azure_client = _init_azure_client()
 
         if not azure_client:
@@ -353,7 +411,7 @@ def check_checklist_task(self, contract_id: str, matching_types: List[str] = Non
             raise ValueError("Azure OpenAI 클라이언트 초기화 실패")
 
         # 지식베이스 로더 초기화
-        kb_loader = KnowledgeBaseLoader()
+        kb_loader = get_knowledge_base_loader()
 
         # A2 노드 초기화
         a2_node = ChecklistCheckNode(
@@ -528,6 +586,57 @@ def _init_azure_client():
         return None
 
 
+def _init_async_azure_client():
+    """
+    비동기 Azure OpenAI 클라이언트 조회 (A1 LLM 검증 동시 호출용, 프로세스 단위 싱글톤)
+
+    태스크마다 클라이언트를 새로 만들면 TCP/TLS 연결을 매번 다시 맺으므로, keep-alive 커넥션 풀
+    (h2 설치 시 HTTP/2 멀티플렉싱)을 가진 클라이언트 하나를 A1 공용 이벤트 루프에서 재사용합니다.
+
+    Returns:
+        AsyncAzureOpenAI 클라이언트 또는 None (None이면 동기 클라이언트를 스레드에서 호출)
+    """
+    global _async_azure_client
+    with _async_azure_client_lock:
+        if _async_azure_client is not None:
+            return _async_azure_client
+
+        try:
+            api_key = os.getenv('AZURE_OPENAI_API_KEY')
+            endpoint = os.getenv('AZURE_OPENAI_ENDPOINT')
+            max_retries = int(os.getenv('AZURE_OPENAI_MAX_RETRIES', '10'))
+            max_connections = int(os.getenv('A1_HTTP_MAX_CONNECTIONS', '128'))
+            max_keepalive = int(os.getenv('A1_HTTP_MAX_KEEPALIVE', '64'))
+
+            if not api_key or not endpoint:
+                logger.error("Azure OpenAI 환경 변수가 설정되지 않음")
+                return None
+
+            http_client = DefaultAsyncHttpxClient(
+                http2=h2 is not None,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive
+                )
+            )
+
+            _async_azure_client = AsyncAzureOpenAI(
+                api_key=api_key,
+                azure_endpoint=endpoint,
+                api_version="2024-02-01",
+                max_retries=max_retries,
+                http_client=http_client
+            )
+
+            logger.info(f"비동기 Azure OpenAI 클라이언트 초기화 완료 (max_retries={max_retries}, "
+                        f"http2={h2 is not None}, max_connections={max_connections})")
+            return _async_azure_client
+
+        except Exception as e:
+            logger.error(f"비동기 Azure OpenAI 클라이언트 초기화 실패: {e}")
+            return None
+
+
 # ============================================================================
 # 병렬 처리용 Celery Tasks
 # ============================================================================
@@ -580,7 +689,7 @@ def check_completeness_stage1_task(self, contract_id: str, text_weight: float =
         logger.info(f"[A1-S1] 계약서 유형: {contract_type}")
 
         # A1 노드 초기화
-        kb_loader = KnowledgeBaseLoader()
+        kb_loader = get_knowledge_base_loader()
         azure_client = _init_azure_client()
 
         if not azure_client:
@@ -588,7 +697,12 @@ def check_completeness_stage1_task(self, contract_id: str, text_weight: float =
 
         a1_node = CompletenessCheckNode(
             knowledge_base_loader=kb_loader,
-            azure_client=azure_client
+            azure_client=azure_client,
+            async_azure_client=_init_async_azure_client(),
+            max_concurrency=int(os.getenv('A1_MAX_CONCURRENCY', '20')),
+            verification_batch_size=int(os.getenv('A1_VERIFICATION_BATCH_SIZE', '5')),
+            bypass_threshold=float(os.getenv('A1_BYPASS_THRESHOLD', '0.92')),
+            unmatched_model=os.getenv('A1_UNMATCHED_MODEL', 'gpt-4o-mini')
         )
 
         # A1-Stage1 수행 (매칭 + LLM 검증)
@@ -709,7 +823,7 @@ def check_missing_articles_task(self, contract_id: str, text_weight: float = 0.7
         logger.info(f"[A1-S2] 계약서 유형: {contract_type}")
 
         # A1 노드 초기화
-        kb_loader = KnowledgeBaseLoader()
+        kb_loader = get_knowledge_base_loader()
         azure_client = _init_azure_client()
 
         if not azure_client:
@@ -717,7 +831,12 @@ def check_missing_articles_task(self, contract_id: str, text_weight: float = 0.7
 
         a1_node = CompletenessCheckNode(
             knowledge_base_loader=kb_loader,
-            azure_client=azure_client
+            azure_client=azure_client,
+            async_azure_client=_init_async_azure_client(),
+            max_concurrency=int(os.getenv('A1_MAX_CONCURRENCY', '20')),
+            verification_batch_size=int(os.getenv('A1_VERIFICATION_BATCH_SIZE', '5')),
+            bypass_threshold=float(os.getenv('A1_BYPASS_THRESHOLD', '0.92')),
+            unmatched_model=os.getenv('A1_UNMATCHED_MODEL', 'gpt-4o-mini')
         )
 
         # A1-Stage2 수행 (누락 조문 재검증)
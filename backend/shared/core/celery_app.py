@@ -15,6 +15,18 @@ celery_app = Celery(
     ]
 )
 
+# 워커가 소비하는 큐 목록 (워커 Dockerfile에서 -Q 인자와 함께 설정, 쉼표 구분)
+# 모든 에이전트 모듈이 include로 함께 임포트되므로 워커 시그널 핸들러는 이 값으로 자기 워커인지 확인합니다.
+WORKER_QUEUES = frozenset(
+    queue.strip() for queue in os.getenv('CELERY_WORKER_QUEUES', '').split(',') if queue.strip()
+)
+
+
+def worker_consumes(queue: str) -> bool:
+    """현재 워커가 해당 큐를 소비하는지 여부 (CELERY_WORKER_QUEUES 미설정 시 False)"""
+    return queue in WORKER_QUEUES
+
+
 # Celery 설정
 celery_app.conf.update(
     task_serializer='json',
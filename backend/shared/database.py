@@ -5,12 +5,15 @@ SQLite 사용
 
 from sqlalchemy import create_engine, Column, String, Integer, Float, DateTime, Text, JSON, event
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, scoped_session
 from sqlalchemy.exc import OperationalError
 from datetime import datetime
 import os
 import json
 import time
+import atexit
+import queue
+import threading
 import logging
 
 logger = logging.getLogger(__name__)
@@ -30,14 +33,19 @@ engine = create_engine(
 )
 
 # SQLite 설정 (병렬 처리 안정성 향상)
-# WAL 모드는 비활성화하고 busy_timeout만 설정하여 오탐지 방지
+# WAL 모드는 기본 비활성화하고 busy_timeout만 설정하여 오탐지 방지
+# SQLITE_WAL=true 이면 WAL + synchronous=NORMAL 사용 (쓰기 중에도 읽기 가능, 잠금 대기 감소)
+# 주의: journal_mode=WAL은 DB 파일에 영구 기록되며, 모든 컨테이너가 같은 호스트의 볼륨을 공유해야 함
+SQLITE_WAL = os.getenv("SQLITE_WAL", "false").lower() == "true"
+
 if "sqlite" in DATABASE_URL:
     @event.listens_for(engine, "connect")
     def set_sqlite_pragma(dbapi_conn, connection_record):
         """SQLite 연결 시 busy_timeout 및 격리 레벨 설정"""
         cursor = dbapi_conn.cursor()
-        # WAL 모드 비활성화 (오탐지 방지)
-        # cursor.execute("PRAGMA journal_mode=WAL")
+        if SQLITE_WAL:
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
         cursor.execute("PRAGMA busy_timeout=30000")  # 30초
         # READ UNCOMMITTED 격리 레벨 설정 (다른 트랜잭션의 변경사항 즉시 읽기)
         cursor.execute("PRAGMA read_uncommitted=1")
@@ -47,6 +55,9 @@ if "sqlite" in DATABASE_URL:
 # 세션 생성
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 스레드별 재사용 세션 (백그라운드 writer 등 장수명 스레드용)
+ScopedSession = scoped_session(SessionLocal)
+
 # Base 클래스
 Base = declarative_base()
 
@@ -81,6 +92,17 @@ class ClassificationResult(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
 
 
+class ClassificationCache(Base):
+    """LLM 분류 결과 캐시 (프롬프트 내용 해시 기준)"""
+    __tablename__ = "classification_cache"
+
+    contract_hash = Column(String, primary_key=True)  # SHA-256 (모델 + 조항 텍스트 + 유사도 점수)
+    predicted_type = Column(String, nullable=False)
+    confidence = Column(Float, nullable=False)
+    reason = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
 class ValidationResult(Base):
     """정합성 검증 결과"""
     __tablename__ = "validation_results"
@@ -364,4 +386,143 @@ def update_completeness_check_partial_with_retry(
         return _update()
     except Exception as e:
         logger.error(f"재시도 후에도 부분 업데이트 실패: {contract_id}, {e}")
-        return False
\ No newline at end of file
+        return False
+
+
+class TokenUsageBatcher:
+    """
+    TokenUsage 기록 일괄 저장기
+
+    호출 측은 put()으로 컬럼 값 딕셔너리를 큐에 넣기만 하고, 백그라운드 스레드가
+    최대 max_batch건 또는 flush_interval초 단위로 모아 bulk_insert_mappings 한 번으로 저장합니다.
+    SQLite 잠금 경합과 fsync 횟수를 배치 크기만큼 줄이는 용도입니다.
+    """
+
+    # flush()가 writer 스레드에 보내는 종료 신호 (이미 꺼내 둔 기록까지 저장 후 종료)
+    _STOP = object()
+
+    def __init__(self, max_batch: int = 100, flush_interval: float = 0.5):
+        """
+        Args:
+            max_batch: 한 번에 저장할 최대 건수
+            flush_interval: 최대 대기 시간 (초)
+        """
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[dict]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+        atexit.register(self.flush)
+
+    def put(self, row: dict):
+        """
+        기록 한 건 추가 (non-blocking)
+
+        Args:
+            row: TokenUsage 컬럼명 → 값 딕셔너리
+        """
+        self._ensure_worker()
+        self._queue.put(row)
+
+    def flush(self, timeout: float = 10.0):
+        """
+        남은 기록을 모두 저장 (종료 시 호출)
+
+        writer 스레드가 큐에서 꺼내 모으는 중인 기록도 유실되지 않도록 종료 신호를 보내
+        스레드가 마지막 배치를 저장하고 끝날 때까지 기다린 뒤, 큐에 남은 기록을 직접 저장합니다.
+
+        Args:
+            timeout: writer 스레드 종료 대기 시간 (초)
+        """
+        with self._lock:
+            thread = self._thread if self._pid == os.getpid() else None
+            self._thread = None
+
+        if thread is not None and thread.is_alive():
+            self._queue.put(self._STOP)
+            thread.join(timeout)
+            if thread.is_alive():
+                logger.warning(f"토큰 사용량 writer 스레드 종료 대기 시간 초과 ({timeout}s)")
+
+        while True:
+            items, _ = self._drain(block=False)
+            if not items:
+                return
+            self._write(items)
+
+    def _ensure_worker(self):
+        # prefork 워커는 fork 이전에 만든 스레드를 물려받지 못하므로 프로세스별로 시작
+        if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="token-usage-batcher", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            items, stopped = self._drain(block=True)
+            if items:
+                self._write(items)
+            if stopped:
+                return
+
+    def _drain(self, block: bool) -> tuple:
+        """최대 max_batch건을 꺼냄. 반환: (기록 리스트, 종료 신호 수신 여부)"""
+        items = []
+        deadline = None
+        while len(items) < self.max_batch:
+            try:
+                if not items:
+                    item = self._queue.get(block=block, timeout=None)
+                    deadline = time.monotonic() + self.flush_interval
+                else:
+                    remaining = deadline - time.monotonic() if block else 0
+                    if remaining > 0:
+                        item = self._queue.get(timeout=remaining)
+                    else:
+                        item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is self._STOP:
+                return items, True
+            items.append(item)
+        return items, False
+
+    def _write(self, items: list):
+        @db_retry_on_lock(max_retries=3, base_delay=0.1)
+        def _bulk_insert():
+            # writer 스레드 전용 세션을 flush마다 재사용
+            db = ScopedSession()
+            try:
+                db.bulk_insert_mappings(TokenUsage, items)
+                db.commit()
+            except Exception:
+                db.rollback()
+                ScopedSession.remove()
+                raise
+
+        try:
+            _bulk_insert()
+            logger.debug(f"토큰 사용량 일괄 저장: {len(items)}건")
+        except Exception as e:
+            logger.error(f"토큰 사용량 일괄 저장 실패 ({len(items)}건 유실): {e}")
+
+
+_token_usage_batcher = None
+
+
+def get_token_usage_batcher() -> TokenUsageBatcher:
+    """
+    TokenUsageBatcher 싱글톤 인스턴스 반환
+
+    Returns:
+        TokenUsageBatcher 인스턴스
+    """
+    global _token_usage_batcher
+    if _token_usage_batcher is None:
+        _token_usage_batcher = TokenUsageBatcher()
+    return _token_usage_batcher
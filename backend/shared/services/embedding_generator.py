@@ -13,6 +13,7 @@ from typing import Any, Dict, List, Tuple, Optional
 from functools import lru_cache
 import hashlib
 
+import numpy as np
 from openai import AzureOpenAI
 
 from backend.shared.database import SessionLocal, TokenUsage
@@ -83,7 +84,7 @@ class EmbeddingService:
             raise ValueError("유효한 텍스트가 없습니다")
 
         # 캐시 키 생성 (텍스트 해시)
-        cache_key = hashlib.md5(normalized.encode('utf-8')).hexdigest()
+        cache_key = self._cache_key(normalized)
         
         # 캐시 확인
         if cache_key in self._embedding_cache:
@@ -112,14 +113,7 @@ class EmbeddingService:
                 )
 
             embedding = response.data[0].embedding
-            
-            # 캐시 저장 (LRU 방식)
-            if len(self._embedding_cache) >= self._cache_size:
-                # 가장 오래된 항목 제거 (간단한 구현)
-                oldest_key = next(iter(self._embedding_cache))
-                del self._embedding_cache[oldest_key]
-            
-            self._embedding_cache[cache_key] = embedding
+            self._cache_put(cache_key, embedding)
             
             return embedding
 
@@ -136,7 +130,10 @@ class EmbeddingService:
         purpose: str = "batch_embedding"
     ) -> List[List[float]]:
         """
-        배치 임베딩 생성
+        배치 임베딩 생성 (캐싱 지원)
+
+        정규화 텍스트 해시로 캐시를 먼저 조회하고, 캐시에 없는 텍스트만 중복 제거 후
+        배치로 요청합니다. 재업로드된 계약서나 반복되는 정형 조항은 API를 호출하지 않습니다.
 
         Args:
             texts: 임베딩할 텍스트 리스트
@@ -146,12 +143,42 @@ class EmbeddingService:
             purpose: 사용 목적 (토큰 추적용)
 
         Returns:
-            임베딩 벡터 리스트
+            임베딩 벡터 리스트 (입력 순서)
         """
-        vectors: List[List[float]] = []
+        vectors: List[Optional[List[float]]] = [None] * len(texts)
+        missing_positions: Dict[Optional[str], List[int]] = {}  # cache_key → 입력 위치들
+        missing_texts: List[str] = []
+        missing_keys: List[Optional[str]] = []
+
+        for position, text in enumerate(texts):
+            normalized = self._normalize_text(text)
+            cache_key = self._cache_key(normalized) if normalized else None
+
+            if cache_key is not None and cache_key in self._embedding_cache:
+                vectors[position] = self._embedding_cache[cache_key]
+                continue
+
+            if cache_key is not None and cache_key in missing_positions:
+                missing_positions[cache_key].append(position)  # 배치 내 중복 텍스트
+                continue
+
+            if cache_key is not None:
+                missing_positions[cache_key] = [position]
+            else:
+                missing_positions.setdefault(None, []).append(position)
+            missing_texts.append(text)
+            missing_keys.append(cache_key)
+
+        cached_count = len(texts) - sum(len(positions) for positions in missing_positions.values())
+        self._cache_hits += cached_count
+        self._cache_misses += len(missing_texts)
+        if cached_count:
+            logger.info(f"임베딩 배치 캐시 HIT: {cached_count}/{len(texts)}개 (purpose={purpose})")
+
+        unkeyed_positions = iter(missing_positions.get(None, []))
 
-        for start in range(0, len(texts), batch_size):
-            batch = texts[start : start + batch_size]
+        for start in range(0, len(missing_texts), batch_size):
+            batch = missing_texts[start : start + batch_size]
             if not batch:
                 continue
 
@@ -184,10 +211,28 @@ class EmbeddingService:
                         purpose=purpose,
                     )
 
-            vectors.extend([data.embedding for data in response.data])
+            for cache_key, data in zip(missing_keys[start : start + batch_size], response.data):
+                if cache_key is None:
+                    vectors[next(unkeyed_positions)] = data.embedding
+                    continue
+                self._cache_put(cache_key, data.embedding)
+                for position in missing_positions[cache_key]:
+                    vectors[position] = data.embedding
 
         return vectors
 
+    def _cache_put(self, cache_key: str, embedding: List[float]):
+        """임베딩 캐시 저장 (최대 크기 초과 시 가장 오래된 항목 제거)"""
+        if len(self._embedding_cache) >= self._cache_size:
+            oldest_key = next(iter(self._embedding_cache))
+            del self._embedding_cache[oldest_key]
+        self._embedding_cache[cache_key] = embedding
+
+    @staticmethod
+    def _cache_key(normalized: str) -> str:
+        """정규화 텍스트 → 캐시 키 (텍스트 해시)"""
+        return hashlib.md5(normalized.encode('utf-8')).hexdigest()
+
     def _log_token_usage(
         self,
         contract_id: str,
@@ -284,13 +329,17 @@ class EmbeddingGenerator:
         if not self.api_key or not self.azure_endpoint:
             raise ValueError("Azure OpenAI 자격 증명이 설정되지 않았습니다.")
 
-        # EmbeddingService 인스턴스 생성 (공통 임베딩 로직 사용)
-        self.embedding_service = EmbeddingService(
-            api_key=self.api_key,
-            azure_endpoint=self.azure_endpoint,
-            embedding_model=self.embedding_model,
-            api_version=api_version
-        )
+        # EmbeddingService 인스턴스 (공통 임베딩 로직 사용)
+        # 기본 설정이면 프로세스 싱글톤을 공유하여 업로드 간 임베딩 캐시를 재사용
+        if api_key is None and azure_endpoint is None and embedding_model is None and api_version == "2024-02-01":
+            self.embedding_service = get_embedding_service()
+        else:
+            self.embedding_service = EmbeddingService(
+                api_key=self.api_key,
+                azure_endpoint=self.azure_endpoint,
+                embedding_model=self.embedding_model,
+                api_version=api_version
+            )
 
     def generate_embeddings(
         self,
@@ -338,6 +387,7 @@ class EmbeddingGenerator:
             "preamble_embeddings": preamble_embeddings,
             "article_embeddings": article_embeddings,
             "exhibit_embeddings": exhibit_embeddings,
+            "document_embedding": self._build_document_embedding(article_embeddings),
         }
 
         return embeddings
@@ -432,6 +482,32 @@ class EmbeddingGenerator:
 
         return article_embeddings
 
+    @staticmethod
+    def _build_document_embedding(
+        article_embeddings: List[Dict[str, Any]]
+    ) -> Optional[List[float]]:
+        """
+        Document-level embedding (mean of per-article mean vectors).
+
+        Each article vector is the mean of its title and sub-item vectors, the
+        same aggregation the classification agent uses for its query, so the
+        classifier can use it without calling the embedding endpoint.
+        """
+        article_means = []
+        for entry in article_embeddings:
+            vectors = [entry["title_embedding"]] if entry.get("title_embedding") else []
+            vectors.extend(
+                item["text_embedding"]
+                for item in entry.get("sub_items", [])
+                if item.get("text_embedding")
+            )
+            if vectors:
+                article_means.append(np.asarray(vectors, dtype=np.float32).mean(axis=0))
+
+        if not article_means:
+            return None
+        return np.mean(article_means, axis=0).tolist()
+
     def _generate_exhibit_embeddings(
         self,
         contract_id: str,
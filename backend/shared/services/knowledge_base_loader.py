@@ -10,9 +10,16 @@ import logging
 import pickle
 
 import faiss
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class KnowledgeBaseLoader:
     """
@@ -47,6 +54,9 @@ class KnowledgeBaseLoader:
         self._faiss_cache: Dict[str, Any] = {}
         self._faiss_dual_cache: Dict[tuple, Any] = {}  # (contract_type, 'text'|'title') -> index
         self._chunks_cache: Dict[str, list] = {}
+        self._embedding_matrix_cache: Dict[str, Any] = {}
+        self._similarity_matrix_cache: Dict[tuple, tuple] = {}
+        self._similarity_centroids_cache: Dict[tuple, Any] = {}
     
     def load_faiss_index(self, contract_type: str) -> Optional[Any]:
         """
@@ -198,9 +208,9 @@ class KnowledgeBaseLoader:
             return None
         
         try:
-            # 청크 로드
-            with open(chunks_file, 'r', encoding='utf-8') as f:
-                chunks = json.load(f)
+            # 청크 로드 (바이트로 읽어 orjson으로 파싱, 미설치 시 표준 json)
+            with open(chunks_file, 'rb') as f:
+                chunks = _json_loads(f.read())
             
             # 캐시 저장
             self._chunks_cache[contract_type] = chunks
@@ -212,6 +222,143 @@ class KnowledgeBaseLoader:
             logger.error(f"청크 로드 실패: {e}")
             return None
     
+    def load_embedding_matrix(self, contract_type: str) -> Optional[np.ndarray]:
+        """
+        표준계약서 청크 text_norm 임베딩 행렬 로드
+
+        Ingestion이 저장한 {type}_std_contract_text_embeddings.npy를 memmap으로 엽니다.
+        파일이 없으면 text FAISS 인덱스(IndexFlatL2)에서 벡터를 복원합니다.
+        행 순서는 text FAISS 인덱스와 동일합니다.
+
+        Args:
+            contract_type: 계약 유형
+
+        Returns:
+            (N, D) float32 배열 또는 None
+        """
+        if contract_type in self._embedding_matrix_cache:
+            return self._embedding_matrix_cache[contract_type]
+
+        matrix_file = self.faiss_dir / f"{contract_type}_std_contract_text_embeddings.npy"
+
+        try:
+            if matrix_file.exists():
+                matrix = np.load(matrix_file, mmap_mode='r')
+            else:
+                text_index_file = self.faiss_dir / f"{contract_type}_std_contract_text.faiss"
+                if not text_index_file.exists():
+                    return None
+                logger.warning(
+                    f"임베딩 행렬 파일이 없어 FAISS 인덱스에서 복원합니다: {contract_type} "
+                    f"(ingestion의 export_matrix 모드로 생성 가능)"
+                )
+                text_index = faiss.read_index(str(text_index_file))
+                matrix = np.asarray(text_index.reconstruct_n(0, text_index.ntotal), dtype=np.float32)
+        except Exception as e:
+            logger.error(f"임베딩 행렬 로드 실패: {contract_type} - {e}")
+            return None
+
+        self._embedding_matrix_cache[contract_type] = matrix
+        logger.info(f"임베딩 행렬 로드 완료: {contract_type} {matrix.shape}")
+        return matrix
+
+    def load_similarity_matrix(
+        self,
+        contract_types: tuple,
+        max_chunks_per_type: int = 20
+    ) -> Optional[tuple]:
+        """
+        분류용 청크 임베딩 행렬 로드
+
+        유형별 임베딩 행렬(load_embedding_matrix)의 앞쪽 행을 모아 L2 정규화한 float32 행렬로
+        쌓습니다. 임베딩 행렬이 없는 유형은 청크 메타데이터의 embedding 필드를 사용합니다.
+        정규화된 쿼리 q에 대해 M @ q 한 번으로 전 유형 코사인 유사도를 얻습니다.
+
+        Args:
+            contract_types: 계약 유형 튜플 (행렬 내 순서)
+            max_chunks_per_type: 유형별 최대 청크 수
+
+        Returns:
+            (matrix, offsets) 튜플 또는 None
+            - matrix: (N, D) float32, 행 단위 L2 정규화 (norm 0인 행은 0 벡터)
+            - offsets: (len(contract_types) + 1,) int64, 유형 i의 행 범위는 offsets[i]:offsets[i+1]
+        """
+        cache_key = (tuple(contract_types), max_chunks_per_type)
+        if cache_key in self._similarity_matrix_cache:
+            return self._similarity_matrix_cache[cache_key]
+
+        rows = []
+        offsets = [0]
+        for contract_type in contract_types:
+            embedding_matrix = self.load_embedding_matrix(contract_type)
+            if embedding_matrix is not None:
+                rows.extend(embedding_matrix[:max_chunks_per_type])
+            else:
+                # 임베딩 행렬이 없으면 청크 메타데이터에 포함된 임베딩 사용
+                chunks = self.load_chunks(contract_type) or []
+                for chunk in chunks[:max_chunks_per_type]:
+                    embedding = chunk.get("embedding")
+                    if embedding:
+                        rows.append(embedding)
+            offsets.append(len(rows))
+
+        if not rows:
+            logger.warning("분류용 청크 임베딩이 없습니다")
+            return None
+
+        try:
+            matrix = np.asarray(rows, dtype=np.float32)
+        except ValueError as e:
+            logger.error(f"청크 임베딩 차원 불일치: {e}")
+            return None
+
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+
+        result = (matrix, np.asarray(offsets, dtype=np.int64))
+        self._similarity_matrix_cache[cache_key] = result
+
+        logger.info(f"분류용 임베딩 행렬 생성 완료: {matrix.shape}")
+        return result
+
+    def load_similarity_centroids(
+        self,
+        contract_types: tuple,
+        max_chunks_per_type: int = 20
+    ) -> Optional[np.ndarray]:
+        """
+        분류용 유형별 중심 벡터 행렬 로드
+
+        유형별로 정규화된 청크 행의 평균을 구합니다 (평균 후 재정규화하지 않음).
+        정규화된 쿼리 q에 대해 centroid @ q는 청크별 코사인 유사도의 평균과 같으므로,
+        전체 청크 행렬 대신 유형 수만큼의 내적으로 동일한 점수를 얻습니다.
+
+        Args:
+            contract_types: 계약 유형 튜플 (행렬 내 순서)
+            max_chunks_per_type: 유형별 최대 청크 수
+
+        Returns:
+            (len(contract_types), D) float32 행렬 또는 None (청크가 없는 유형은 0 벡터)
+        """
+        cache_key = (tuple(contract_types), max_chunks_per_type)
+        if cache_key in self._similarity_centroids_cache:
+            return self._similarity_centroids_cache[cache_key]
+
+        loaded = self.load_similarity_matrix(contract_types, max_chunks_per_type)
+        if loaded is None:
+            return None
+        matrix, offsets = loaded
+
+        centroids = np.zeros((len(contract_types), matrix.shape[1]), dtype=np.float32)
+        for i in range(len(contract_types)):
+            start, end = offsets[i], offsets[i + 1]
+            if end > start:
+                centroids[i] = matrix[start:end].mean(axis=0, dtype=np.float32)
+
+        self._similarity_centroids_cache[cache_key] = centroids
+        logger.info(f"분류용 유형별 중심 벡터 생성 완료: {centroids.shape}")
+        return centroids
+
     def load_whoosh_index(self, contract_type: str):
         """
         Whoosh 인덱스 로드
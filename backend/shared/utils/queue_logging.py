@@ -0,0 +1,65 @@
+"""
+큐 기반 로깅 (QueueHandler + QueueListener)
+
+루트 로거의 핸들러를 백그라운드 QueueListener로 옮기고 루트 로거에는 QueueHandler만 남깁니다.
+A1 노드처럼 동시 검증 중 조항별로 다수의 로그를 남기는 경로에서 핸들러 I/O(stdout, 파일 등)가
+로깅 락을 잡고 직렬화되지 않도록, 호출 스레드는 LogRecord를 큐에 넣고 바로 반환합니다.
+"""
+
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+QUEUE_LOGGING_ENABLED = os.getenv("QUEUE_LOGGING_ENABLED", "true").lower() == "true"
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_listener_lock = threading.Lock()
+
+
+def install_queue_logging() -> bool:
+    """
+    루트 로거 핸들러를 QueueListener 뒤로 이동 (프로세스당 한 번)
+
+    Celery prefork 자식 프로세스처럼 핸들러 구성이 끝난 뒤에 호출해야 합니다.
+
+    Returns:
+        설치 여부 (비활성화되었거나 옮길 핸들러가 없으면 False)
+    """
+    global _listener
+    if not QUEUE_LOGGING_ENABLED:
+        return False
+
+    with _listener_lock:
+        if _listener is not None:
+            return True
+
+        root = logging.getLogger()
+        handlers = [h for h in root.handlers if not isinstance(h, logging.handlers.QueueHandler)]
+        if not handlers:
+            return False
+
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+        for handler in handlers:
+            root.removeHandler(handler)
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+        # 핸들러별 레벨 설정을 그대로 적용
+        _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+
+    logger.info(f"큐 기반 로깅 활성화: 핸들러 {len(handlers)}개")
+    return True
+
+
+def stop_queue_logging():
+    """QueueListener 종료 (큐에 남은 로그를 모두 처리한 뒤 반환)"""
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
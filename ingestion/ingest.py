@@ -69,6 +69,7 @@ Commands:
           - chunking       : 항/호 단위 청킹
           - embedding      : 임베딩 + 인덱싱
           - s_embedding    : 간이 청킹 및 임베딩 (조/별지 단위)
+          - export_matrix  : 기존 text FAISS 인덱스에서 임베딩 행렬(.npy) 추출
         
         --file 옵션:
           - all             : 모든 파일 (PDF, DOCX 모두)
@@ -107,6 +108,8 @@ Commands:
                 self._run_embedding(filename)
             elif mode == 's_embedding':
                 self._run_simple_embedding(filename)
+            elif mode == 'export_matrix':
+                self._run_export_matrix(filename)
             else:
                 logger.error(f" 알 수 없는 모드: {mode}")
                 return
@@ -129,9 +132,9 @@ Commands:
         while i < len(tokens):
             if tokens[i] in ['--mode', '-m'] and i + 1 < len(tokens):
                 mode = tokens[i + 1]
-                if mode not in ['full', 'parsing', 'art_chunking', 'chunking', 'embedding', 's_embedding']:
+                if mode not in ['full', 'parsing', 'art_chunking', 'chunking', 'embedding', 's_embedding', 'export_matrix']:
                     logger.error(f" 잘못된 모드: {mode}")
-                    logger.error("   사용 가능: full, parsing, art_chunking, chunking, embedding, s_embedding")
+                    logger.error("   사용 가능: full, parsing, art_chunking, chunking, embedding, s_embedding, export_matrix")
                     return None
                 args['mode'] = mode
                 i += 2
@@ -517,6 +520,39 @@ Commands:
                 import traceback
                 traceback.print_exc()
     
+    def _run_export_matrix(self, filename):
+        """
+        기존 text FAISS 인덱스에서 임베딩 행렬(.npy) 추출
+
+        임베딩 행렬 저장 이전에 생성된 인덱스용 일회성 마이그레이션입니다.
+        재임베딩 없이 IndexFlatL2에 저장된 벡터를 그대로 복원합니다.
+        """
+        import faiss
+        import numpy as np
+
+        faiss_dir = self.index_path / "faiss"
+        logger.info("=== 임베딩 행렬 추출 ===")
+        logger.info(f"  입력/출력: {faiss_dir}")
+
+        if filename == 'all':
+            index_files = sorted(faiss_dir.glob("*_text.faiss"))
+        else:
+            index_files = [faiss_dir / filename]
+
+        for index_file in index_files:
+            if not index_file.exists():
+                logger.error(f"   [ERROR] 파일을 찾을 수 없습니다: {index_file.name}")
+                continue
+
+            try:
+                index = faiss.read_index(str(index_file))
+                vectors = np.asarray(index.reconstruct_n(0, index.ntotal), dtype=np.float32)
+                matrix_path = faiss_dir / index_file.name.replace("_text.faiss", "_text_embeddings.npy")
+                np.save(matrix_path, vectors)
+                logger.info(f"    - {matrix_path.name} {vectors.shape}")
+            except Exception as e:
+                logger.error(f"   [ERROR] 추출 실패 ({index_file.name}): {e}")
+
     def _run_simple_embedding(self, filename):
         """
         간이 청킹 및 임베딩 실행
@@ -320,6 +320,11 @@ class TextEmbedder:
                 text_index_path = output_dir / f"{base_name}_text.faiss"
                 faiss.write_index(text_index, str(text_index_path))
                 logger.info(f"    text_norm FAISS 인덱스 저장: {text_index_path}")
+
+                # 분류 에이전트용 임베딩 행렬 (memmap 로드, 행 순서는 text 인덱스와 동일)
+                text_matrix_path = output_dir / f"{base_name}_text_embeddings.npy"
+                np.save(text_matrix_path, text_array)
+                logger.info(f"    text_norm 임베딩 행렬 저장: {text_matrix_path}")
             else:
                 error_msg = f"text_norm 임베딩이 없어 인덱스를 생성할 수 없습니다: {base_name}"
                 logger.error(f"    [ERROR] {error_msg}")